@@ -0,0 +1,240 @@
+"""
+Shared helpers for the benchmark scripts in this package.
+
+Benchmarks run against the database configured by `DATABASE_STRING` and drive
+the real WSGI handler, so request signals (and with them connection
+closing/reuse) behave exactly as they do behind a server.
+"""
+
+import os
+import statistics
+import time
+from contextlib import contextmanager
+from io import BytesIO
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+def setup_django() -> None:
+    """
+    Configure Django for a standalone benchmark run.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+    import django
+    from django.conf import settings
+
+    django.setup()
+    # Benchmarks talk to the handler directly; accept its default host.
+    settings.ALLOWED_HOSTS = ["*"]
+
+
+def measure(
+    fn: Callable[[], Any], iterations: int, warmup: int = 5
+) -> Dict[str, float]:
+    """
+    Time `fn` and summarise the per-call latency in milliseconds.
+
+    Args:
+        fn (Callable[[], Any]): The operation to time.
+        iterations (int): Timed calls.
+        warmup (int, optional): Untimed calls made first. Defaults to 5.
+
+    Returns:
+        Dict[str, float]: `mean`, `p50`, `p95`, `p99`, `min` and `max` in ms.
+    """
+    for _ in range(warmup):
+        fn()
+
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return summarize(samples)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Summarise latency samples (ms) as `mean`, `p50`, `p95`, `p99`, `min` and `max`.
+    """
+    samples = sorted(samples)
+
+    def percentile(fraction: float) -> float:
+        return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+    return {
+        "mean": statistics.fmean(samples),
+        "p50": samples[len(samples) // 2],
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "min": samples[0],
+        "max": samples[-1],
+    }
+
+
+def wsgi_request(
+    path: str,
+    method: str = "GET",
+    body: bytes = b"",
+    content_type: str = "application/json",
+    query_string: str = "",
+) -> int:
+    """
+    Send one request through the project's WSGI application.
+
+    The response is consumed and closed, which fires `request_finished` and
+    lets Django close or keep the database connection per `CONN_MAX_AGE`.
+
+    Returns:
+        int: The HTTP status code.
+    """
+    from django.core.wsgi import get_wsgi_application
+
+    application = get_wsgi_application()
+    status: List[str] = []
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "QUERY_STRING": query_string,
+        "SERVER_NAME": "benchmark",
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "CONTENT_TYPE": content_type,
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": BytesIO(body),
+        "wsgi.url_scheme": "http",
+        "wsgi.errors": BytesIO(),
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+        "wsgi.version": (1, 0),
+    }
+    response = application(environ, lambda s, headers, exc_info=None: status.append(s))
+    try:
+        for _ in response:
+            pass
+    finally:
+        response.close()
+    return int(status[0].split(" ", 1)[0])
+
+
+@contextmanager
+def database_settings(**overrides: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Temporarily change the default database's settings (e.g. `CONN_MAX_AGE`).
+
+    The current connection is closed before and after so the next query
+    connects with the overridden settings.
+
+    Yields:
+        Dict[str, Any]: The effective settings dictionary.
+    """
+    from django.db import connections
+
+    original = dict(connections.settings["default"])
+
+    def reconnect(settings_dict: Dict[str, Any]) -> None:
+        connections["default"].close()
+        del connections["default"]
+        connections.settings["default"] = settings_dict
+
+    reconnect({**original, **overrides})
+    try:
+        yield connections.settings["default"]
+    finally:
+        reconnect(original)
+
+
+def ensure_todos(count: int) -> int:
+    """
+    Make sure the database holds todos to benchmark against.
+
+    If the table is empty, `count` synthetic rows are inserted; existing data
+    is left untouched.
+
+    Returns:
+        int: The number of todos in the table.
+    """
+    from todos.models import Todo, TodoCounter, TodoUser
+
+    existing = Todo.objects.count()
+    if existing:
+        return existing
+
+    TodoUser.objects.bulk_create(
+        [TodoUser(id=i, avatar=i % 7 + 1) for i in range(1, 11)],
+        ignore_conflicts=True,
+    )
+    Todo.objects.bulk_create(
+        [
+            Todo(
+                api_id=i,
+                user_id=i % 10 + 1,
+                title=f"Benchmark todo {i}",
+                completed=i % 3 == 0,
+            )
+            for i in range(1, count + 1)
+        ],
+        batch_size=1000,
+    )
+    TodoCounter.rebuild()
+    TodoUser.rebuild_counts()
+    return count
+
+
+def seed_dataset(count: int, batch_size: int = 5000) -> None:
+    """
+    Replace the todos with exactly `count` synthetic rows (10 users).
+
+    Every third todo is completed. Rows are generated and inserted in chunks
+    of `batch_size`, so 1M-row datasets do not need 1M objects in memory.
+    """
+    from django.db import connection, transaction
+
+    from todos.helpers import iter_chunks
+    from todos.models import Todo, TodoCounter, TodoUser
+
+    rows = (
+        Todo(
+            api_id=i,
+            user_id=i % 10 + 1,
+            title=f"Benchmark todo {i}",
+            completed=i % 3 == 0,
+        )
+        for i in range(1, count + 1)
+    )
+    with transaction.atomic():
+        # A plain DELETE: `QuerySet.delete()` would load every row for signals.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {connection.ops.quote_name(Todo._meta.db_table)}"
+            )
+        TodoUser.objects.bulk_create(
+            [TodoUser(id=i, avatar=i % 7 + 1) for i in range(1, 11)],
+            ignore_conflicts=True,
+        )
+        for chunk in iter_chunks(rows, batch_size):
+            Todo.objects.bulk_create(chunk)
+        TodoCounter.rebuild()
+        TodoUser.rebuild_counts()
+
+
+def format_table(
+    rows: List[Dict[str, Any]], columns: Optional[List[str]] = None
+) -> str:
+    """
+    Render result rows as a fixed-width text table.
+    """
+    columns = columns or list(rows[0])
+    cells = [
+        [f"{row[c]:.2f}" if isinstance(row[c], float) else str(row[c]) for c in columns]
+        for row in rows
+    ]
+    widths = [
+        max(len(column), *(len(line[i]) for line in cells))
+        for i, column in enumerate(columns)
+    ]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(columns, widths))]
+    lines.append("  ".join("-" * w for w in widths))
+    lines.extend("  ".join(v.ljust(w) for v, w in zip(line, widths)) for line in cells)
+    return "\n".join(lines)
@@ -0,0 +1,93 @@
+"""
+Per-request latency of the todo list page and `/toggle-todo/` with and
+without persistent or pooled database connections.
+
+Usage:
+    DATABASE_STRING=postgres://... python -m benchmarks.db_connections
+
+Scenarios:
+    - `per-request`: `CONN_MAX_AGE=0`, a new connection for every request.
+    - `persistent`: `CONN_MAX_AGE=60` with health checks.
+    - `pooled`: django-db-connection-pool (PostgreSQL only, if installed).
+"""
+
+import argparse
+import importlib.util
+import json
+from typing import Any, Dict, List
+
+from benchmarks.common import (
+    database_settings,
+    ensure_todos,
+    format_table,
+    measure,
+    setup_django,
+    wsgi_request,
+)
+
+POOL_ENGINE = "dj_db_conn_pool.backends.postgresql"
+
+
+def scenarios(engine: str) -> Dict[str, Dict[str, Any]]:
+    available = {
+        "per-request": {"CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False},
+        "persistent": {"CONN_MAX_AGE": 60, "CONN_HEALTH_CHECKS": True},
+    }
+    if engine.endswith("postgresql") and importlib.util.find_spec("dj_db_conn_pool"):
+        available["pooled"] = {
+            "ENGINE": POOL_ENGINE,
+            "CONN_MAX_AGE": 0,
+            "POOL_OPTIONS": {"POOL_SIZE": 5, "MAX_OVERFLOW": 10, "PRE_PING": True},
+        }
+    return available
+
+
+def run(iterations: int, rows: int) -> List[Dict[str, Any]]:
+    from django.conf import settings
+    from django.db import connections
+
+    from todos.models import Todo
+
+    # Measure the database round trips, not the page cache.
+    settings.TODO_PAGE_CACHE_TIMEOUT = 0
+    ensure_todos(rows)
+    todo_id = str(Todo.objects.values_list("uuid", flat=True).first())
+    toggle_body = json.dumps({"todo_id": todo_id}).encode()
+
+    results = []
+    for name, overrides in scenarios(connections.settings["default"]["ENGINE"]).items():
+        with database_settings(**overrides):
+            endpoints = {
+                "GET /": lambda: wsgi_request("/"),
+                "POST /toggle-todo/": lambda: wsgi_request(
+                    "/toggle-todo/", method="POST", body=toggle_body
+                ),
+            }
+            for endpoint, fn in endpoints.items():
+                stats = measure(fn, iterations)
+                results.append({"scenario": name, "endpoint": endpoint, **stats})
+            if iterations % 2:
+                # Leave the toggled row as we found it (warmup calls are even).
+                wsgi_request("/toggle-todo/", method="POST", body=toggle_body)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--rows", type=int, default=200, help="Synthetic todos if the table is empty."
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON results.")
+    args = parser.parse_args()
+
+    setup_django()
+    results = run(args.iterations, args.rows)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Concurrent load test for a running server, to compare the WSGI and ASGI paths.
+
+Start the server under test, e.g.:
+
+    # WSGI, sync views (thread per request)
+    python manage.py runserver 8000 --noreload
+    # ASGI, async views (one event loop)
+    ASYNC_VIEWS=True uvicorn config.asgi:application --port 8001
+
+then fire the same load at both:
+
+    python -m benchmarks.load_test --url wsgi=http://127.0.0.1:8000/ \\
+        --url asgi=http://127.0.0.1:8001/ --concurrency 100 --requests 2000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List, Tuple
+
+import httpx
+
+from benchmarks.common import format_table, summarize
+
+
+async def run_load(
+    url: str, requests: int, concurrency: int, method: str = "GET", body: bytes = b""
+) -> Dict[str, Any]:
+    """
+    Send `requests` requests to `url` with at most `concurrency` in flight.
+
+    Returns:
+        Dict[str, Any]: Throughput (`rps`), error count and latency summary (ms).
+    """
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+
+        async def worker() -> None:
+            nonlocal errors
+            for _ in remaining:
+                start = time.perf_counter()
+                try:
+                    response = await client.request(method, url, content=body)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {"rps": requests / elapsed, "errors": errors, **summarize(latencies)}
+
+
+def parse_target(value: str) -> Tuple[str, str]:
+    label, _, url = value.rpartition("=")
+    return label or url, url
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--url",
+        action="append",
+        type=parse_target,
+        required=True,
+        help="Target as URL or LABEL=URL; repeat to compare servers.",
+    )
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--body", default="", help="Request body, e.g. JSON.")
+    parser.add_argument("--json", action="store_true", help="Print JSON results.")
+    args = parser.parse_args()
+
+    results = []
+    for label, url in args.url:
+        stats = asyncio.run(
+            run_load(
+                url, args.requests, args.concurrency, args.method, args.body.encode()
+            )
+        )
+        results.append({"target": label, "concurrency": args.concurrency, **stats})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Bulk insert speed and index size of a UUID versus an integer primary key.
+
+Usage:
+    DATABASE_STRING=postgres://... python -m benchmarks.primary_keys
+
+Loads the same synthetic todos into two scratch tables shaped like
+`todos_todo`, then drops them:
+    - `uuid pk`: a random UUID primary key, `api_id` unique (the layout
+      before migration 0006).
+    - `bigint pk`: a surrogate sequential bigint primary key, the UUID and
+      `api_id` kept unique. Shown for comparison; it adds an index.
+    - `api_id pk`: the upstream `api_id` as primary key, the UUID kept as a
+      unique column (the current layout).
+
+Sizes are read from `pg_relation_size` on PostgreSQL and from the `dbstat`
+table on SQLite (reported as None if SQLite was built without it).
+"""
+
+import argparse
+import json
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from benchmarks.common import format_table, setup_django
+
+COLUMNS = (
+    "user_id integer NOT NULL, title varchar(200) NOT NULL, completed boolean NOT NULL"
+)
+UNIQUE_API_ID = f"api_id integer NOT NULL UNIQUE, {COLUMNS}"
+
+LAYOUTS = {
+    "postgresql": {
+        "uuid pk": f"uuid uuid PRIMARY KEY, {UNIQUE_API_ID}",
+        "bigint pk": (
+            "id bigint GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY, "
+            f"uuid uuid NOT NULL UNIQUE, {UNIQUE_API_ID}"
+        ),
+        "api_id pk": (
+            f"api_id integer PRIMARY KEY, uuid uuid NOT NULL UNIQUE, {COLUMNS}"
+        ),
+    },
+    "sqlite": {
+        "uuid pk": f"uuid char(32) PRIMARY KEY, {UNIQUE_API_ID}",
+        "bigint pk": (
+            "id integer PRIMARY KEY AUTOINCREMENT, "
+            f"uuid char(32) NOT NULL UNIQUE, {UNIQUE_API_ID}"
+        ),
+        "api_id pk": (
+            f"api_id integer PRIMARY KEY, uuid char(32) NOT NULL UNIQUE, {COLUMNS}"
+        ),
+    },
+}
+
+
+def relation_sizes(
+    cursor: Any, vendor: str, table: str, uuid_pk: bool
+) -> Dict[str, Optional[int]]:
+    """
+    Return the table, primary key index and total index size in bytes.
+    """
+    if vendor == "postgresql":
+        cursor.execute(
+            "SELECT pg_relation_size(%s), pg_relation_size(%s), pg_indexes_size(%s)",
+            [table, f"{table}_pkey", table],
+        )
+        heap, pk_index, indexes = cursor.fetchone()
+        return {"table": heap, "pk index": pk_index, "all indexes": indexes}
+
+    try:
+        cursor.execute(
+            "SELECT name, SUM(pgsize) FROM dbstat WHERE name = %s "
+            "OR name LIKE %s GROUP BY name",
+            [table, f"sqlite_autoindex_{table}_%"],
+        )
+    except Exception:
+        return {"table": None, "pk index": None, "all indexes": None}
+    sizes = dict(cursor.fetchall())
+    heap = sizes.pop(table, 0)
+    # The first automatic index belongs to the first constraint in the DDL,
+    # the UUID primary key in the `uuid pk` layout. An integer primary key is
+    # the rowid of the table b-tree itself and has no separate index.
+    autoindexes = [sizes[name] for name in sorted(sizes)]
+    pk_index = autoindexes[0] if uuid_pk else 0
+    return {"table": heap, "pk index": pk_index, "all indexes": sum(autoindexes)}
+
+
+def run(rows: int, batch_size: int) -> List[Dict[str, Any]]:
+    from django.db import connection, transaction
+
+    vendor = connection.vendor
+    if vendor not in LAYOUTS:
+        raise SystemExit(f"Unsupported database vendor: {vendor}")
+
+    data = [
+        (uuid.uuid4(), i, i % 10 + 1, f"Benchmark todo {i}", i % 3 == 0)
+        for i in range(1, rows + 1)
+    ]
+    if vendor == "sqlite":
+        data = [(u.hex, *rest) for u, *rest in data]
+
+    results = []
+    for name, columns in LAYOUTS[vendor].items():
+        table = "benchmark_" + name.replace(" ", "_")
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            cursor.execute(f"CREATE TABLE {table} ({columns})")
+            try:
+                start = time.perf_counter()
+                for offset in range(0, rows, batch_size):
+                    batch = data[offset : offset + batch_size]
+                    # One multi-row INSERT per batch, as `bulk_create` issues.
+                    values = ", ".join(["(%s, %s, %s, %s, %s)"] * len(batch))
+                    with transaction.atomic():
+                        cursor.execute(
+                            f"INSERT INTO {table} "
+                            f"(uuid, api_id, user_id, title, completed) VALUES {values}",
+                            [value for row in batch for value in row],
+                        )
+                elapsed = time.perf_counter() - start
+
+                if vendor == "postgresql":
+                    cursor.execute(f"VACUUM ANALYZE {table}")
+                sizes = relation_sizes(cursor, vendor, table, name == "uuid pk")
+            finally:
+                cursor.execute(f"DROP TABLE {table}")
+
+        results.append(
+            {
+                "layout": name,
+                "rows": rows,
+                "insert s": elapsed,
+                "rows/s": round(rows / elapsed),
+                **{
+                    f"{key} KiB": None if size is None else size // 1024
+                    for key, size in sizes.items()
+                },
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--json", action="store_true", help="Print JSON results.")
+    args = parser.parse_args()
+
+    setup_django()
+    results = run(args.rows, args.batch_size)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,419 @@
+"""
+Offline benchmark suite for the list, pagination, toggle and ingest paths.
+
+Usage:
+    DATABASE_STRING=postgres://... python -m benchmarks.suite \\
+        --datasets 10000 1000000 --output results.json
+    python -m benchmarks.suite --compare before.json after.json
+
+For every dataset size the todo table is filled with synthetic rows (see
+`seed_dataset`; a table holding anything else is only replaced with
+`--reseed`), then:
+    - `list`: `GET /` for each filter at the first page, a deep cursor page
+      and a deep `?page=` (OFFSET) page, 90% into the filtered rows, and a
+      `?q=` title search, and the first page of one user (`?user=`).
+      Latency percentiles and queries per request; the page cache is
+      disabled, the row cache stays on.
+    - `users`: `GET /users/`, the per-user summary, at its first and last
+      page.
+    - `toggle`: `POST /toggle-todo/` from 1, 8 and 32 threads at once.
+      Throughput and latency; each todo is toggled twice, so the data ends
+      as it started.
+    - `ingest`: `get_external_todo_data` against a mocked upstream serving
+      one JSON array of new todos. Rolled back afterwards.
+
+Requests go through the real WSGI handler, no server or network involved.
+`--output` writes the results with the git revision, database vendor and
+versions, so runs from different commits can be diffed with `--compare`.
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from unittest.mock import patch
+from urllib.parse import urlencode
+
+from benchmarks.common import (
+    format_table,
+    measure,
+    seed_dataset,
+    setup_django,
+    summarize,
+    wsgi_request,
+)
+
+FILTERS = ("all", "todo", "complete")
+DEEP_FRACTION = 0.9
+PAGE_SIZE = 20
+TOGGLE_CONCURRENCY = [1, 8, 32]
+# Matches about one synthetic title in ten thousand.
+SEARCH_TERM = "todo 4242"
+# One of the ten synthetic users (see `seed_dataset`).
+BENCH_USER = 3
+
+# Metrics compared by `--compare`, and whether higher is better.
+COMPARED_METRICS = {
+    "p50": False,
+    "p95": False,
+    "p99": False,
+    "queries": False,
+    "rps": True,
+    "items/s": True,
+}
+
+
+def prepare_dataset(count: int, reseed: bool) -> None:
+    """
+    Make the todo table hold exactly the synthetic `count`-row dataset.
+
+    Raises:
+        SystemExit: If the table holds other data and `reseed` is False.
+    """
+    from todos.models import Todo
+
+    existing = Todo.objects.count()
+    synthetic = not Todo.objects.exclude(title__startswith="Benchmark todo").exists()
+    if existing == count and synthetic:
+        return
+    if existing and not (synthetic or reseed):
+        raise SystemExit(
+            f"The todo table holds {existing} non-benchmark rows; "
+            "pass --reseed to replace them."
+        )
+    seed_dataset(count)
+
+
+def list_scenarios(count: int) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yield `(scenario, query params)` for every filter and page depth.
+    """
+    from todos.helpers import encode_cursor
+
+    matching = {"all": count, "complete": count // 3, "todo": count - count // 3}
+    for filter_name in FILTERS:
+        deep_row = int(matching[filter_name] * DEEP_FRACTION)
+        yield f"{filter_name}, first", {"filter": filter_name}
+        yield f"{filter_name}, deep cursor", {
+            "filter": filter_name,
+            "after": encode_cursor(int(count * DEEP_FRACTION)),
+        }
+        yield f"{filter_name}, deep offset", {
+            "filter": filter_name,
+            "page": max(1, deep_row // PAGE_SIZE),
+        }
+        yield f"{filter_name}, search", {"filter": filter_name, "q": SEARCH_TERM}
+        yield f"{filter_name}, user", {"filter": filter_name, "user": BENCH_USER}
+
+
+def bench_pages(
+    path: str, scenarios: Iterable[Tuple[str, Dict[str, Any]]], iterations: int
+) -> List[Dict[str, Any]]:
+    """
+    Measure `GET path` with each scenario's query params.
+    """
+    from django.db import connection, reset_queries
+    from django.test.utils import CaptureQueriesContext
+
+    results = []
+    for scenario, params in scenarios:
+        query_string = urlencode(params)
+
+        def request() -> None:
+            status = wsgi_request(path, query_string=query_string)
+            if status != 200:
+                raise RuntimeError(f"GET {path}?{query_string} returned {status}")
+
+        stats = measure(request, iterations)
+        reset_queries()
+        with CaptureQueriesContext(connection) as queries:
+            request()
+        results.append({"scenario": scenario, "queries": len(queries), **stats})
+    return results
+
+
+def bench_list(count: int, iterations: int) -> List[Dict[str, Any]]:
+    return bench_pages("/", list_scenarios(count), iterations)
+
+
+def bench_users(iterations: int) -> List[Dict[str, Any]]:
+    from todos.models import TodoUser
+    from todos.views import TodoUserListView
+
+    last_page = max(1, -(-TodoUser.objects.count() // TodoUserListView.paginate_by))
+    scenarios = [("first page", {}), ("last page", {"page": last_page})]
+    return bench_pages("/users/", scenarios, iterations)
+
+
+def bench_toggle(count: int, requests: int) -> List[Dict[str, Any]]:
+    from django.db import connections
+
+    from todos.models import Todo
+
+    api_ids = random.sample(range(1, count + 1), min(count, requests // 2))
+    toggle_bodies = [
+        json.dumps({"todo_id": str(todo_uuid)}).encode()
+        for todo_uuid in Todo.objects.filter(api_id__in=api_ids).values_list(
+            "uuid", flat=True
+        )
+    ]
+
+    results = []
+    for concurrency in TOGGLE_CONCURRENCY:
+        bodies = iter(toggle_bodies)
+        lock = threading.Lock()
+        latencies: List[float] = []
+        errors = 0
+
+        def worker() -> None:
+            nonlocal errors
+            try:
+                while True:
+                    with lock:
+                        body = next(bodies, None)
+                    if body is None:
+                        return
+                    # Twice per todo, so the dataset ends as it started.
+                    for _ in range(2):
+                        start = time.perf_counter()
+                        status = wsgi_request("/toggle-todo/", method="POST", body=body)
+                        elapsed = (time.perf_counter() - start) * 1000
+                        with lock:
+                            latencies.append(elapsed)
+                            errors += status != 200
+            finally:
+                connections.close_all()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(concurrency) as pool:
+            for future in [pool.submit(worker) for _ in range(concurrency)]:
+                future.result()
+        elapsed = time.perf_counter() - started
+
+        results.append(
+            {
+                "scenario": f"{concurrency} threads",
+                "rps": len(latencies) / elapsed,
+                "errors": errors,
+                **summarize(latencies),
+            }
+        )
+    return results
+
+
+class FakeUpstreamResponse:
+    """
+    Stand-in for a streamed `requests` response with a fixed body.
+    """
+
+    status_code = 200
+    headers: Dict[str, str] = {}
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        for offset in range(0, len(self.body), chunk_size):
+            yield self.body[offset : offset + chunk_size]
+
+    def close(self) -> None:
+        pass
+
+
+class FakeUpstreamClient:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    def get(self, url: str, **kwargs: Any) -> FakeUpstreamResponse:
+        return FakeUpstreamResponse(self.body)
+
+
+def bench_ingest(count: int, items: int, repeats: int) -> List[Dict[str, Any]]:
+    from django.db import transaction
+    from django.db.models import Max
+    from django.test.utils import override_settings
+
+    from todos.helpers import get_external_todo_data
+    from todos.models import Todo
+
+    first_id = (Todo.objects.aggregate(last=Max("api_id"))["last"] or 0) + 1
+    body = json.dumps(
+        [
+            {
+                "userId": i % 20 + 1,
+                "id": first_id + i,
+                "title": f"Ingested todo {i}",
+                "completed": i % 2 == 0,
+            }
+            for i in range(items)
+        ]
+    ).encode()
+
+    def ingest() -> None:
+        with transaction.atomic():
+            if get_external_todo_data() is None:
+                raise RuntimeError("get_external_todo_data stored nothing")
+            transaction.set_rollback(True)
+
+    module = "todos.helpers.todo_list_view_helper"
+    with patch(f"{module}.config", return_value="http://upstream.invalid/todos"):
+        with patch(
+            f"{module}.get_upstream_client", return_value=FakeUpstreamClient(body)
+        ):
+            with override_settings(TODO_API_PAGINATION="none"):
+                stats = measure(ingest, repeats, warmup=1)
+
+    return [
+        {
+            "scenario": f"{items} items",
+            "items/s": items / (stats["mean"] / 1000),
+            **stats,
+        }
+    ]
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    import django
+    from django.conf import settings
+    from django.db import connection
+
+    # Measure the queries and rendering, not the page cache.
+    settings.TODO_PAGE_CACHE_TIMEOUT = 0
+
+    results = []
+    for count in args.datasets:
+        prepare_dataset(count, args.reseed)
+        for benchmark, rows in (
+            ("list", bench_list(count, args.iterations)),
+            ("users", bench_users(args.iterations)),
+            ("toggle", bench_toggle(count, args.toggle_requests)),
+            ("ingest", bench_ingest(count, args.ingest_items, args.ingest_repeats)),
+        ):
+            results.extend(
+                {"benchmark": benchmark, "dataset": count, **row} for row in rows
+            )
+
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "iterations": args.iterations,
+        },
+        "results": results,
+    }
+
+
+def result_key(row: Dict[str, Any]) -> Tuple[str, int, str]:
+    return row["benchmark"], row["dataset"], row["scenario"]
+
+
+def compare(before: Dict[str, Any], after: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Pair the results of two runs and report the change of each metric.
+
+    A positive `change %` is an improvement: lower latency or query count,
+    higher throughput.
+    """
+    baseline = {result_key(row): row for row in before["results"]}
+    rows = []
+    for row in after["results"]:
+        old = baseline.get(result_key(row))
+        if old is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            if metric not in row or not old.get(metric):
+                continue
+            delta = (
+                row[metric] - old[metric]
+                if higher_is_better
+                else old[metric] - row[metric]
+            )
+            rows.append(
+                {
+                    "benchmark": row["benchmark"],
+                    "dataset": row["dataset"],
+                    "scenario": row["scenario"],
+                    "metric": metric,
+                    "before": float(old[metric]),
+                    "after": float(row[metric]),
+                    "change %": delta / old[metric] * 100,
+                }
+            )
+    return rows
+
+
+def print_tables(results: List[Dict[str, Any]]) -> None:
+    for benchmark in dict.fromkeys(row["benchmark"] for row in results):
+        rows = [row for row in results if row["benchmark"] == benchmark]
+        print(f"\n{benchmark}")
+        print(format_table(rows))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--datasets", type=int, nargs="+", default=[10_000])
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--toggle-requests", type=int, default=400)
+    parser.add_argument("--ingest-items", type=int, default=10_000)
+    parser.add_argument("--ingest-repeats", type=int, default=3)
+    parser.add_argument(
+        "--reseed",
+        action="store_true",
+        help="Replace a todo table that holds non-benchmark data.",
+    )
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BEFORE", "AFTER"),
+        help="Compare two result files instead of running.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON results.")
+    args = parser.parse_args()
+
+    if args.compare:
+        runs = []
+        for path in args.compare:
+            with open(path) as f:
+                runs.append(json.load(f))
+        rows = compare(*runs)
+        print(json.dumps(rows, indent=2) if args.json else format_table(rows))
+        return
+
+    setup_django()
+    report = run(args)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_tables(report["results"])
+
+
+if __name__ == "__main__":
+    main()
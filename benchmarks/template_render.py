@@ -0,0 +1,103 @@
+"""
+Render time of the todo list template for a 20-row and a 500-row page.
+
+Usage:
+    python -m benchmarks.template_render
+
+Renders `todos.html` from in-memory todos (no database queries) with:
+    - `no row cache`: every row rendered on every request.
+    - `row cache, cold`: every row rendered, then stored.
+    - `row cache, warm`: every row served from the cache.
+"""
+
+import argparse
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from benchmarks.common import format_table, measure, setup_django
+
+
+def make_todos(count: int) -> List[Any]:
+    from todos.models import Todo, TodoUser
+
+    now = datetime.now(timezone.utc)
+    users = [TodoUser(id=i, avatar=i % 7 + 1) for i in range(1, 11)]
+    return [
+        Todo(
+            uuid=uuid.uuid4(),
+            api_id=i,
+            user=users[i % 10],
+            title=f"Benchmark todo {i}",
+            completed=i % 3 == 0,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def run(sizes: List[int], iterations: int) -> List[Dict[str, Any]]:
+    from django.conf import settings
+    from django.core.cache import caches
+    from django.template.loader import render_to_string
+
+    cache = caches[settings.TODO_PAGE_CACHE_ALIAS]
+    row_timeout = settings.TODO_ROW_CACHE_TIMEOUT or 3600
+
+    def render(todos: List[Any]) -> str:
+        return render_to_string(
+            "todos.html",
+            {
+                "todos": todos,
+                "total_todos": len(todos),
+                "completed_todos": 0,
+                "uncompleted_todos": len(todos),
+                "current_filter": "all",
+                "next_cursor": None,
+            },
+        )
+
+    results = []
+    for size in sizes:
+        todos = make_todos(size)
+
+        settings.TODO_ROW_CACHE_TIMEOUT = 0
+        no_cache = measure(lambda: render(todos), iterations)
+
+        settings.TODO_ROW_CACHE_TIMEOUT = row_timeout
+
+        def cold() -> str:
+            cache.clear()
+            return render(todos)
+
+        cold_stats = measure(cold, iterations)
+        render(todos)
+        warm = measure(lambda: render(todos), iterations)
+
+        for scenario, stats in (
+            ("no row cache", no_cache),
+            ("row cache, cold", cold_stats),
+            ("row cache, warm", warm),
+        ):
+            results.append({"rows": size, "scenario": scenario, **stats})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 500])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="Print JSON results.")
+    args = parser.parse_args()
+
+    setup_django()
+    results = run(args.sizes, args.iterations)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table(results))
+
+
+if __name__ == "__main__":
+    main()
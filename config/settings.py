@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 
 import dj_database_url
@@ -15,12 +16,19 @@ ALLOWED_HOSTS = config("ALLOWED_HOSTS", default="localhost", cast=Csv())
 
 # Application definition
 INSTALLED_APPS = [
+    # Serve static files through WhiteNoise under runserver too.
+    "whitenoise.runserver_nostatic",
     "django.contrib.staticfiles",
     "todos",
 ]
 
 MIDDLEWARE = [
+    # Disabled unless REQUEST_TIMING is set; first so it times everything.
+    "todos.middleware.RequestTimingMiddleware",
+    # Disabled unless METRICS_ENABLED is set.
+    "todos.middleware.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -31,8 +39,19 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [],
-        "APP_DIRS": True,
+        "APP_DIRS": False,
         "OPTIONS": {
+            # Compile each template once per process (the dev autoreloader
+            # resets the cache when a template changes).
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -44,17 +63,90 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "config.wsgi.application"
-
+ASGI_APPLICATION = "config.asgi.application"
+
+# Route the list, fragment and toggle URLs to their async views. Only useful
+# under an ASGI server (e.g. `uvicorn config.asgi:application`); under WSGI
+# async views run on a per-request event loop.
+ASYNC_VIEWS = config("ASYNC_VIEWS", default=False, cast=bool)
+
+# Connections are kept open between requests for DB_CONN_MAX_AGE seconds
+# (0 closes them after every request, None keeps them forever) and checked
+# before reuse. Under ASGI every request runs its sync code on a fresh
+# thread, so persistent connections would pile up; the default is 0 there.
+# DB_POOL=True switches PostgreSQL to a SQLAlchemy-backed pool shared by the
+# threads of a worker (`pool` extra: django-db-connection-pool).
 DATABASES = {
     "default": dj_database_url.parse(
         config(
             "DATABASE_STRING",
             default="",
             cast=str,
-        )
+        ),
+        conn_max_age=config(
+            "DB_CONN_MAX_AGE",
+            default="0" if ASYNC_VIEWS else "60",
+            cast=lambda value: None if value.lower() == "none" else int(value),
+        ),
+        conn_health_checks=config("DB_CONN_HEALTH_CHECKS", default=True, cast=bool),
     )
 }
 
+DB_POOL_ENGINES = {
+    "django.db.backends.postgresql": "dj_db_conn_pool.backends.postgresql",
+}
+if config("DB_POOL", default=False, cast=bool):
+    DATABASES["default"].update(
+        ENGINE=DB_POOL_ENGINES.get(
+            DATABASES["default"]["ENGINE"], DATABASES["default"]["ENGINE"]
+        ),
+        # The pool owns connection lifetime; hand connections back after
+        # every request instead of pinning one per thread.
+        CONN_MAX_AGE=0,
+        POOL_OPTIONS={
+            "POOL_SIZE": config("DB_POOL_SIZE", default=5, cast=int),
+            "MAX_OVERFLOW": config("DB_POOL_MAX_OVERFLOW", default=10, cast=int),
+            "TIMEOUT": config("DB_POOL_TIMEOUT", default=30, cast=int),
+            "RECYCLE": config("DB_POOL_RECYCLE", default=1800, cast=int),
+            "PRE_PING": config("DB_CONN_HEALTH_CHECKS", default=True, cast=bool),
+        },
+    )
+
+# Cache backend: "locmem" (per process), "file", or a shared "redis" /
+# "memcached" server for multi-worker deployments. Redis and memcached need
+# the `redis` / `pymemcache` extras installed.
+CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "memcached": "django.core.cache.backends.memcached.PyMemcacheCache",
+    "dummy": "django.core.cache.backends.dummy.DummyCache",
+}
+CACHE_BACKEND = config("CACHE_BACKEND", default="locmem")
+CACHE_LOCATION = config(
+    "CACHE_LOCATION",
+    default={
+        "locmem": "careacross",
+        "file": os.path.join(tempfile.gettempdir(), "careacross-cache"),
+        "redis": "redis://127.0.0.1:6379/1",
+        "memcached": "127.0.0.1:11211",
+        "dummy": "",
+    }.get(CACHE_BACKEND, ""),
+)
+
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND],
+        "LOCATION": CACHE_LOCATION,
+        "KEY_PREFIX": config("CACHE_KEY_PREFIX", default="careacross"),
+    }
+}
+if CACHE_BACKEND in ("locmem", "file"):
+    # Room for every row of a large page (Django's default is 300 entries).
+    CACHES["default"]["OPTIONS"] = {
+        "MAX_ENTRIES": config("CACHE_MAX_ENTRIES", default=10000, cast=int)
+    }
+
 AUTH_PASSWORD_VALIDATORS = []
 
 LANGUAGE_CODE = "en-us"
@@ -72,4 +164,89 @@ STATICFILES_DIRS = [
 ]
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
+# `collectstatic` writes content-hashed names plus .gz/.br variants, which
+# WhiteNoise serves with immutable far-future caching and content
+# negotiation. Unhashed names get WHITENOISE_MAX_AGE.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "todos.storage.TodoStaticFilesStorage"},
+}
+WHITENOISE_MAX_AGE = config(
+    "WHITENOISE_MAX_AGE", default=0 if DEBUG else 3600, cast=int
+)
+# Without a collectstatic run (development), serve straight from the finders.
+WHITENOISE_USE_FINDERS = config("WHITENOISE_USE_FINDERS", default=DEBUG, cast=bool)
+WHITENOISE_AUTOREFRESH = DEBUG
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# Cold-start seeding: how long a request waits for another worker's seed
+# before serving the "warming up" page, and where file locks live when the
+# database cannot provide advisory locks.
+TODO_SEED_WAIT_TIMEOUT = config("TODO_SEED_WAIT_TIMEOUT", default=5.0, cast=float)
+TODO_LOCK_DIR = config("TODO_LOCK_DIR", default=tempfile.gettempdir())
+
+# Upstream todo API client: keep-alive pool sizes and timeouts (seconds).
+UPSTREAM_POOL_CONNECTIONS = config("UPSTREAM_POOL_CONNECTIONS", default=4, cast=int)
+UPSTREAM_POOL_MAXSIZE = config("UPSTREAM_POOL_MAXSIZE", default=8, cast=int)
+UPSTREAM_POOL_BLOCK = config("UPSTREAM_POOL_BLOCK", default=True, cast=bool)
+UPSTREAM_CONNECT_TIMEOUT = config("UPSTREAM_CONNECT_TIMEOUT", default=3.05, cast=float)
+UPSTREAM_READ_TIMEOUT = config("UPSTREAM_READ_TIMEOUT", default=10.0, cast=float)
+
+# Upstream pagination: "none" (one JSON array), "page" (page/limit query
+# parameters, fetched concurrently) or "cursor" (follow a next cursor).
+TODO_API_PAGINATION = config("TODO_API_PAGINATION", default="none")
+TODO_API_PAGE_SIZE = config("TODO_API_PAGE_SIZE", default=100, cast=int)
+TODO_API_CONCURRENCY = config("TODO_API_CONCURRENCY", default=4, cast=int)
+TODO_API_FIRST_PAGE = config("TODO_API_FIRST_PAGE", default=1, cast=int)
+# Upper bound on numbered pages per fetch, in case the upstream ignores paging.
+TODO_API_MAX_PAGES = config("TODO_API_MAX_PAGES", default=10000, cast=int)
+TODO_API_PAGE_PARAM = config("TODO_API_PAGE_PARAM", default="page")
+TODO_API_LIMIT_PARAM = config("TODO_API_LIMIT_PARAM", default="limit")
+TODO_API_CURSOR_PARAM = config("TODO_API_CURSOR_PARAM", default="cursor")
+TODO_API_RESULTS_KEY = config("TODO_API_RESULTS_KEY", default="results")
+TODO_API_NEXT_KEY = config("TODO_API_NEXT_KEY", default="next")
+
+# Rendered todo list pages: cache alias and lifetime in seconds (0 disables).
+# Keys include the counter version, so writes invalidate them immediately.
+TODO_PAGE_CACHE_ALIAS = config("TODO_PAGE_CACHE_ALIAS", default="default")
+TODO_PAGE_CACHE_TIMEOUT = config("TODO_PAGE_CACHE_TIMEOUT", default=300, cast=int)
+# Shared hit/miss counters for the page cache (`todo_cache_stats`, `/metrics`).
+# Off by default: recording them costs a cache round trip per lookup.
+TODO_PAGE_CACHE_STATS = config("TODO_PAGE_CACHE_STATS", default=False, cast=bool)
+
+# Rendered task rows, keyed by uuid + updated_at, in the same cache alias
+# (seconds, 0 disables).
+TODO_ROW_CACHE_TIMEOUT = config("TODO_ROW_CACHE_TIMEOUT", default=3600, cast=int)
+# Part of every row key together with the row template and static manifest;
+# bump it to drop cached rows after a change neither of those shows.
+TODO_ROW_CACHE_VERSION = config("TODO_ROW_CACHE_VERSION", default="1")
+
+# Per-request instrumentation: query count, DB/render/upstream time as a
+# `Server-Timing` header and a `todos.timing` log line per request.
+REQUEST_TIMING = config("REQUEST_TIMING", default=False, cast=bool)
+
+# Prometheus `/metrics` endpoint (needs the `metrics` extra). Under several
+# worker processes, set PROMETHEUS_MULTIPROC_DIR to a directory they share.
+METRICS_ENABLED = config("METRICS_ENABLED", default=False, cast=bool)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        "todos.timing": {"handlers": ["console"], "level": "INFO", "propagate": False},
+    },
+}
+
+# `manage.py serve` (gunicorn, preloaded): bind address, worker processes,
+# threads per worker, request-count recycling and timeouts in seconds.
+WEB_BIND = config("WEB_BIND", default="0.0.0.0:8000")
+WEB_CONCURRENCY = config(
+    "WEB_CONCURRENCY", default=(os.cpu_count() or 1) * 2 + 1, cast=int
+)
+WEB_THREADS = config("WEB_THREADS", default=1, cast=int)
+WEB_MAX_REQUESTS = config("WEB_MAX_REQUESTS", default=1000, cast=int)
+WEB_MAX_REQUESTS_JITTER = config("WEB_MAX_REQUESTS_JITTER", default=100, cast=int)
+WEB_TIMEOUT = config("WEB_TIMEOUT", default=30, cast=int)
+WEB_KEEPALIVE = config("WEB_KEEPALIVE", default=5, cast=int)
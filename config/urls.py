@@ -1,12 +1,29 @@
+from django.conf import settings
 from django.urls import path
 
 from todos import views
 
+# Serve the async views when running under ASGI with ASYNC_VIEWS=True.
+if settings.ASYNC_VIEWS:
+    list_view = views.AsyncTodoListView
+    fragment_view = views.AsyncTodoFragmentView
+    toggle_view = views.atoggle_todo_completion
+else:
+    list_view = views.TodoListView
+    fragment_view = views.TodoFragmentView
+    toggle_view = views.toggle_todo_completion
+
 urlpatterns = [
-    path("", views.TodoListView.as_view(), name="todo_list"),
-    path("toggle-todo/", views.toggle_todo_completion, name="toggle_todo"),
+    path("", list_view.as_view(), name="todo_list"),
+    path("todos/more/", fragment_view.as_view(), name="todo_fragment"),
+    path("users/", views.TodoUserListView.as_view(), name="todo_users"),
+    path("toggle-todo/", toggle_view, name="toggle_todo"),
+    path("toggle-todos/", views.toggle_todos_batch, name="toggle_todos_batch"),
 ]
 
+if settings.METRICS_ENABLED:
+    urlpatterns.append(path("metrics", views.metrics, name="metrics"))
+
 # Register custom error handlers
 handler404 = "todos.errors.custom_404"
 handler500 = "todos.errors.custom_500"
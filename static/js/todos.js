@@ -6,30 +6,38 @@ document.addEventListener("DOMContentLoaded", function () {
     if (loadMoreBtn) {
         loadMoreBtn.addEventListener("click", function (event) {
             event.preventDefault();
-            const nextPage = loadMoreBtn.getAttribute("data-next-page");
+            const nextCursor = loadMoreBtn.getAttribute("data-next-cursor");
 
-            // Get current URL and add/modify the page parameter.
-            const url = new URL(window.location.href);
-            url.searchParams.set("page", nextPage);
+            // Request only the next rows from the fragment endpoint, keeping the
+            // current filter, search and user and seeking past the last task already shown.
+            const currentParams = new URL(window.location.href).searchParams;
+            const url = new URL(loadMoreBtn.getAttribute("data-fragment-url"), window.location.origin);
+            for (const param of ["filter", "q", "user"]) {
+                if (currentParams.has(param)) {
+                    url.searchParams.set(param, currentParams.get(param));
+                }
+            }
+            url.searchParams.set("after", nextCursor);
 
             fetch(url)
                 .then(response => response.text())
                 .then(html => {
-                    // Create a temporary DOM element to parse the fetched HTML.
-                    const parser = new DOMParser();
-                    const doc = parser.parseFromString(html, "text/html");
+                    // The fragment is just task rows plus a #next-page marker.
+                    const fragment = document.createElement("template");
+                    fragment.innerHTML = html;
 
-                    // Extract the tasks from the fetched content.
-                    const newTasksContainer = doc.getElementById("task-container");
-                    const newTasksHTML = newTasksContainer.innerHTML;
+                    const nextPageMarker = fragment.content.getElementById("next-page");
+                    const newCursor = nextPageMarker ? nextPageMarker.getAttribute("data-next-cursor") : "";
+                    if (nextPageMarker) {
+                        nextPageMarker.remove();
+                    }
 
                     // Append the new tasks to the current task container.
-                    taskContainer.insertAdjacentHTML("beforeend", newTasksHTML);
+                    taskContainer.appendChild(fragment.content);
 
                     // Update or remove the Load More button.
-                    const newLoadMoreBtn = doc.getElementById("load-more");
-                    if (newLoadMoreBtn) {
-                        loadMoreBtn.setAttribute("data-next-page", newLoadMoreBtn.getAttribute("data-next-page"));
+                    if (newCursor) {
+                        loadMoreBtn.setAttribute("data-next-cursor", newCursor);
                     } else {
                         loadMoreBtn.style.display = "none";
                     }
@@ -1,6 +1,33 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import request_finished
+from django.db.backends.signals import connection_created
 
 
 class TodosConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "todos"
+
+    def ready(self) -> None:
+        from todos import signals  # noqa: F401
+
+        if settings.REQUEST_TIMING:
+            from todos.instrumentation import install_query_recorder
+
+            connection_created.connect(install_query_recorder)
+
+        if settings.METRICS_ENABLED:
+            from todos.metrics import (
+                count_connection,
+                metrics_available,
+                update_connection_gauge,
+            )
+
+            if not metrics_available():
+                raise ImproperlyConfigured(
+                    "METRICS_ENABLED requires prometheus_client; install the "
+                    "`metrics` extra."
+                )
+            connection_created.connect(count_connection)
+            request_finished.connect(update_connection_gauge)
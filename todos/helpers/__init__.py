@@ -1,3 +1,84 @@
-from .todo_list_view_helper import fetch_todos_from_api, get_external_todo_data
+from .async_upstream_client import AsyncUpstreamClient, get_async_upstream_client
+from .cursor_pagination import (
+    CursorPage,
+    apaginate_by_cursor,
+    decode_cursor,
+    encode_cursor,
+    paginate_by_cursor,
+)
+from .page_cache import (
+    get_cached_page,
+    page_cache_enabled,
+    page_cache_key,
+    page_cache_stats,
+    page_cache_stats_enabled,
+    reset_page_cache_stats,
+    store_page,
+)
+from .paged_fetch import fetch_todo_pages_if_changed, iter_todo_pages
+from .row_cache import render_todo_rows, row_cache_key, row_cache_version
+from .single_flight import (
+    aseed_todos_if_empty,
+    seed_todos_if_empty,
+    single_flight_lock,
+)
+from .todo_list_view_helper import (
+    afetch_todos_from_api,
+    aget_external_todo_data,
+    fetch_todos_from_api,
+    fetch_todos_if_changed,
+    get_external_todo_data,
+    iter_chunks,
+    iter_upstream_todos,
+    store_todo_items,
+    store_todo_users,
+    stream_todos_from_api,
+)
+from .todo_sync import SyncResult, sync_external_todo_data
+from .upstream_client import (
+    UpstreamClient,
+    get_upstream_client,
+    reset_upstream_clients,
+)
+from .warmup import warm_up
 
-__all__ = ["fetch_todos_from_api", "get_external_todo_data"]
+__all__ = [
+    "AsyncUpstreamClient",
+    "CursorPage",
+    "SyncResult",
+    "UpstreamClient",
+    "afetch_todos_from_api",
+    "aget_external_todo_data",
+    "apaginate_by_cursor",
+    "aseed_todos_if_empty",
+    "decode_cursor",
+    "encode_cursor",
+    "fetch_todo_pages_if_changed",
+    "fetch_todos_from_api",
+    "fetch_todos_if_changed",
+    "get_async_upstream_client",
+    "get_cached_page",
+    "get_external_todo_data",
+    "get_upstream_client",
+    "iter_chunks",
+    "iter_todo_pages",
+    "iter_upstream_todos",
+    "page_cache_enabled",
+    "page_cache_key",
+    "page_cache_stats",
+    "page_cache_stats_enabled",
+    "paginate_by_cursor",
+    "render_todo_rows",
+    "reset_page_cache_stats",
+    "reset_upstream_clients",
+    "row_cache_key",
+    "row_cache_version",
+    "seed_todos_if_empty",
+    "single_flight_lock",
+    "store_page",
+    "store_todo_items",
+    "store_todo_users",
+    "stream_todos_from_api",
+    "sync_external_todo_data",
+    "warm_up",
+]
@@ -0,0 +1,204 @@
+import asyncio
+import time
+import weakref
+from typing import IO, Any, Awaitable, Dict, List, Optional, Tuple, TypeVar
+
+import httpx
+from django.conf import settings
+
+from todos.instrumentation import track
+from todos.metrics import UPSTREAM_DURATION, UPSTREAM_ERRORS, UPSTREAM_RETRIES
+
+T = TypeVar("T")
+
+
+class AsyncUpstreamClient:
+    """
+    An asyncio HTTP client for the upstream todo API.
+
+    The async counterpart of `UpstreamClient`: one `httpx.AsyncClient` keeps a
+    pool of keep-alive connections, and retries follow the same policy
+    (connection errors and `status_forcelist` responses, with exponential
+    backoff). Waiting on the upstream suspends only the calling coroutine, so
+    one event loop can serve many slow fetches at once.
+
+    Use `get_async_upstream_client()` rather than instantiating this directly;
+    an `AsyncClient` is bound to the event loop it was created on.
+
+    Args:
+        retries (int, optional): Maximum number of retry attempts. Defaults to 3.
+        backoff_factor (float, optional): A factor to calculate the delay between retries. Defaults to 0.3.
+        status_forcelist (Optional[List[int]], optional): HTTP status codes that should trigger a retry.
+            Defaults to [500, 502, 503, 504] if not provided.
+    """
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff_factor: float = 0.3,
+        status_forcelist: Optional[List[int]] = None,
+    ) -> None:
+        if status_forcelist is None:
+            status_forcelist = [500, 502, 503, 504]
+
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.status_forcelist = set(status_forcelist)
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.UPSTREAM_POOL_MAXSIZE,
+                max_keepalive_connections=settings.UPSTREAM_POOL_MAXSIZE,
+            ),
+            timeout=httpx.Timeout(
+                settings.UPSTREAM_READ_TIMEOUT,
+                connect=settings.UPSTREAM_CONNECT_TIMEOUT,
+            ),
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Seconds to wait before retry number `attempt` (1-based).
+        """
+        return self.backoff_factor * (2 ** (attempt - 1))
+
+    def _should_retry(self, response: httpx.Response, attempt: int) -> bool:
+        return response.status_code in self.status_forcelist and attempt < self.retries
+
+    async def _observed(self, request: Awaitable[T]) -> T:
+        """
+        Await `request`, recording its duration and failure in the upstream
+        metrics.
+        """
+        start = time.perf_counter()
+        try:
+            return await request
+        except httpx.HTTPError:
+            UPSTREAM_ERRORS.inc()
+            raise
+        finally:
+            UPSTREAM_DURATION.observe(time.perf_counter() - start)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a GET, retrying per the client's policy.
+
+        Raises:
+            httpx.HTTPError: If the request still fails after all retries.
+        """
+        return await self._observed(self._get(url, **kwargs))
+
+    async def _get(self, url: str, **kwargs: Any) -> httpx.Response:
+        attempt = 0
+        while True:
+            try:
+                with track("upstream"):
+                    response = await self.client.get(url, **kwargs)
+                if not self._should_retry(response, attempt):
+                    response.raise_for_status()
+                    return response
+            except httpx.TransportError:
+                if attempt >= self.retries:
+                    raise
+            attempt += 1
+            UPSTREAM_RETRIES.inc()
+            await asyncio.sleep(self.backoff(attempt))
+
+    async def download(
+        self, url: str, body: IO[bytes], chunk_size: int, **kwargs: Any
+    ) -> None:
+        """
+        Stream a response body into `body`, retrying per the client's policy.
+
+        A retry after a partial read rewinds and truncates `body` first.
+
+        Raises:
+            httpx.HTTPError: If the request still fails after all retries.
+        """
+        await self._observed(self._download(url, body, chunk_size, **kwargs))
+
+    async def _download(
+        self, url: str, body: IO[bytes], chunk_size: int, **kwargs: Any
+    ) -> None:
+        attempt = 0
+        while True:
+            try:
+                with track("upstream"):
+                    async with self.client.stream("GET", url, **kwargs) as response:
+                        if not self._should_retry(response, attempt):
+                            response.raise_for_status()
+                            async for chunk in response.aiter_bytes(chunk_size):
+                                body.write(chunk)
+                            return
+            except httpx.TransportError:
+                if attempt >= self.retries:
+                    raise
+                body.seek(0)
+                body.truncate()
+            attempt += 1
+            UPSTREAM_RETRIES.inc()
+            await asyncio.sleep(self.backoff(attempt))
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+_ClientKey = Tuple[int, float, Tuple[int, ...]]
+_LoopClients = Dict[_ClientKey, AsyncUpstreamClient]
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients]"
+_clients = weakref.WeakKeyDictionary()
+# Per event loop, the task that closes its clients (see `_close_on_shutdown`).
+_closers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]"
+_closers = weakref.WeakKeyDictionary()
+
+
+async def _close_on_shutdown(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Wait until the loop shuts down, then close the clients created on it.
+
+    Event loops have no close hook, but `asyncio.run` (and so `async_to_sync`
+    running async views under WSGI, and uvicorn) cancels every pending task
+    before closing its loop, so the clients' sockets are released here rather
+    than whenever the garbage collector gets to them.
+    """
+    try:
+        await asyncio.Event().wait()
+    finally:
+        _closers.pop(loop, None)
+        for client in _clients.pop(loop, {}).values():
+            await client.aclose()
+
+
+def get_async_upstream_client(
+    retries: int = 3,
+    backoff_factor: float = 0.3,
+    status_forcelist: Optional[List[int]] = None,
+) -> AsyncUpstreamClient:
+    """
+    Return the running event loop's client for a retry policy.
+
+    Must be called from a coroutine. Clients are cached per event loop and
+    closed when it shuts down.
+
+    Args:
+        retries (int, optional): Maximum number of retry attempts. Defaults to 3.
+        backoff_factor (float, optional): A factor to calculate the delay between retries. Defaults to 0.3.
+        status_forcelist (Optional[List[int]], optional): HTTP status codes that should trigger a retry.
+            Defaults to [500, 502, 503, 504] if not provided.
+
+    Returns:
+        AsyncUpstreamClient: A client shared by every coroutine on this loop
+        using the same policy.
+    """
+    if status_forcelist is None:
+        status_forcelist = [500, 502, 503, 504]
+    key = (retries, backoff_factor, tuple(status_forcelist))
+
+    loop = asyncio.get_running_loop()
+    loop_clients = _clients.setdefault(loop, {})
+    if loop not in _closers:
+        _closers[loop] = loop.create_task(_close_on_shutdown(loop))
+    client = loop_clients.get(key)
+    if client is None:
+        client = AsyncUpstreamClient(retries, backoff_factor, list(status_forcelist))
+        loop_clients[key] = client
+    return client
@@ -0,0 +1,116 @@
+import base64
+import binascii
+from typing import Any, List, Optional, Tuple
+
+from django.db.models import QuerySet
+
+from todos.models import Todo
+
+# Largest cursor accepted: the databases' signed 64-bit integer range.
+MAX_CURSOR = 2**63 - 1
+
+
+def encode_cursor(api_id: int) -> str:
+    """
+    Encode the `api_id` of the last row on a page as an opaque cursor.
+
+    Args:
+        api_id (int): The `api_id` to resume after.
+
+    Returns:
+        str: A URL-safe token suitable for the `after` query parameter.
+    """
+    return base64.urlsafe_b64encode(str(api_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (Optional[str]): The raw `after` query parameter.
+
+    Returns:
+        Optional[int]: The `api_id` to seek after, or None if the cursor is
+        missing, malformed or outside `0..MAX_CURSOR` (callers then start
+        from the first page).
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        after = int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    return after if 0 <= after <= MAX_CURSOR else None
+
+
+class CursorPage:
+    """
+    A page of results produced by keyset pagination.
+
+    Exposes the subset of Django's `Page` interface used by the templates
+    (`object_list`, `has_next`, `has_previous`) plus the `next_cursor` for the
+    following page.
+    """
+
+    def __init__(self, object_list: List[Any], has_next: bool, after: Optional[int]):
+        self.object_list = object_list
+        self._has_next = has_next
+        self.after = after
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self.after is not None
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        if not self._has_next:
+            return None
+        return encode_cursor(self.object_list[-1].api_id)
+
+
+def paginate_by_cursor(
+    queryset: QuerySet[Todo], page_size: int, after: Optional[int]
+) -> Tuple[CursorPage, List[Todo]]:
+    """
+    Fetch one page of todos ordered by `api_id`, seeking past `after`.
+
+    Fetches `page_size + 1` rows so the existence of a next page is known
+    without a `COUNT(*)`, and uses `api_id > after` instead of OFFSET so deep
+    pages cost the same as the first one.
+
+    Args:
+        queryset (QuerySet[Todo]): The filtered queryset, ordered by `api_id`.
+        page_size (int): Number of rows per page.
+        after (Optional[int]): The `api_id` of the last row already shown.
+
+    Returns:
+        Tuple[CursorPage, List[Todo]]: The page and the rows it contains.
+    """
+    if after is not None:
+        queryset = queryset.filter(api_id__gt=after)
+    rows = list(queryset.order_by("api_id")[: page_size + 1])
+    page = CursorPage(rows[:page_size], has_next=len(rows) > page_size, after=after)
+    return page, page.object_list
+
+
+async def apaginate_by_cursor(
+    queryset: QuerySet[Todo], page_size: int, after: Optional[int]
+) -> Tuple[CursorPage, List[Todo]]:
+    """
+    Async version of `paginate_by_cursor`, fetching the rows with the async ORM.
+    """
+    if after is not None:
+        queryset = queryset.filter(api_id__gt=after)
+    rows = [todo async for todo in queryset.order_by("api_id")[: page_size + 1]]
+    page = CursorPage(rows[:page_size], has_next=len(rows) > page_size, after=after)
+    return page, page.object_list
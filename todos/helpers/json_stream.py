@@ -0,0 +1,90 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Incrementally parse a top-level JSON array, yielding one element at a time.
+
+    Only the current element and the unparsed tail of the last chunk are kept
+    in memory, so peak memory depends on the chunk and element size rather
+    than on the length of the array.
+
+    Args:
+        chunks (Iterable[bytes]): Raw body chunks, e.g. `response.iter_content()`.
+        encoding (str, optional): Body encoding. Defaults to "utf-8".
+
+    Yields:
+        Any: Each decoded element of the array, in order.
+
+    Raises:
+        ValueError: If the body is not a well-formed JSON array.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    chunk_iter = iter(chunks)
+    buffer = ""
+    pos = 0
+    eof = False
+    started = False
+
+    def fill() -> bool:
+        """Append the next chunk to the buffer; False once the body is exhausted."""
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = next(chunk_iter, None)
+        if chunk is None:
+            eof = True
+            buffer = buffer[pos:] + text_decoder.decode(b"", final=True)
+        else:
+            buffer = buffer[pos:] + text_decoder.decode(chunk)
+        pos = 0
+        return True
+
+    def skip_whitespace() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or not fill():
+                return
+
+    skip_whitespace()
+    if pos >= len(buffer) or buffer[pos] != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+
+    while True:
+        skip_whitespace()
+        if pos >= len(buffer):
+            raise ValueError("Unterminated JSON array")
+        if buffer[pos] == "]":
+            return
+        if started:
+            if buffer[pos] != ",":
+                raise ValueError(
+                    f"Expected ',' or ']' in JSON array, got {buffer[pos]!r}"
+                )
+            pos += 1
+            skip_whitespace()
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The element may continue in the next chunk.
+                if not fill():
+                    raise ValueError("Malformed element in JSON array")
+                continue
+            # A scalar ending exactly at the buffer edge (e.g. a number) may
+            # continue in the next chunk, so only accept it with more data behind it.
+            if end == len(buffer) and fill():
+                continue
+            break
+        started = True
+        pos = end
+        yield value
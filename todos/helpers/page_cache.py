@@ -0,0 +1,99 @@
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+
+PAGE_KEY_PREFIX = "todos:page"
+HITS_KEY = "todos:page-cache:hits"
+MISSES_KEY = "todos:page-cache:misses"
+
+
+def _cache() -> BaseCache:
+    return caches[settings.TODO_PAGE_CACHE_ALIAS]
+
+
+def page_cache_stats_enabled() -> bool:
+    """
+    Whether lookups are counted in the shared hit/miss counters
+    (`TODO_PAGE_CACHE_STATS`).
+    """
+    return settings.TODO_PAGE_CACHE_STATS
+
+
+def page_cache_enabled() -> bool:
+    """
+    Whether rendered list pages are cached (`TODO_PAGE_CACHE_TIMEOUT` > 0).
+    """
+    return settings.TODO_PAGE_CACHE_TIMEOUT > 0
+
+
+def page_cache_key(namespace: str, version_key: str) -> str:
+    """
+    Build the cache key for one rendered page.
+
+    Args:
+        namespace (str): Distinguishes views sharing a version key, e.g. the template name.
+        version_key (str): A digest of the data version and request parameters, so
+            any counter bump moves every page to a fresh key.
+
+    Returns:
+        str: The cache key.
+    """
+    digest = version_key.strip('"')
+    return f"{PAGE_KEY_PREFIX}:{namespace}:{digest}"
+
+
+def _incr(key: str) -> None:
+    # One round trip once the counter exists. Counts are exact on backends
+    # with an atomic incr (Redis, Memcached) and approximate on the others.
+    cache = _cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_cached_page(key: str) -> Optional[bytes]:
+    """
+    Return a cached page body, recording the lookup as a hit or a miss when
+    `page_cache_stats_enabled()`.
+
+    Args:
+        key (str): A key from `page_cache_key`.
+
+    Returns:
+        Optional[bytes]: The rendered body, or None on a miss.
+    """
+    content = _cache().get(key)
+    if page_cache_stats_enabled():
+        _incr(MISSES_KEY if content is None else HITS_KEY)
+    return content
+
+
+def store_page(key: str, content: bytes) -> None:
+    """
+    Store a rendered page body for `TODO_PAGE_CACHE_TIMEOUT` seconds.
+    """
+    _cache().set(key, content, timeout=settings.TODO_PAGE_CACHE_TIMEOUT)
+
+
+def page_cache_stats() -> Dict[str, int]:
+    """
+    Return the hit/miss counters shared by every worker using the cache.
+
+    Returns:
+        Dict[str, int]: `hits`, `misses` and `lookups`.
+    """
+    values = _cache().get_many([HITS_KEY, MISSES_KEY])
+    hits = values.get(HITS_KEY, 0)
+    misses = values.get(MISSES_KEY, 0)
+    return {"hits": hits, "misses": misses, "lookups": hits + misses}
+
+
+def reset_page_cache_stats() -> None:
+    """
+    Reset the hit/miss counters to zero.
+    """
+    _cache().delete_many([HITS_KEY, MISSES_KEY])
@@ -0,0 +1,301 @@
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from django.conf import settings
+
+from todos.helpers.upstream_client import get_upstream_client
+from todos.instrumentation import track
+
+logger = logging.getLogger(__name__)
+
+
+def _page_items(payload: Any) -> List[Dict[str, Any]]:
+    """
+    Extract the todo items from a page body: a bare array or an object
+    holding the array under `settings.TODO_API_RESULTS_KEY`.
+    """
+    if isinstance(payload, list):
+        return payload
+    return payload.get(settings.TODO_API_RESULTS_KEY) or []
+
+
+def _next_cursor(payload: Any) -> Optional[str]:
+    """
+    Extract the `settings.TODO_API_NEXT_KEY` cursor from a page body; a bare
+    array has none.
+    """
+    if isinstance(payload, list):
+        return None
+    return payload.get(settings.TODO_API_NEXT_KEY)
+
+
+def _page_bounds(items: List[Dict[str, Any]]) -> Optional[Tuple[Any, Any]]:
+    """
+    Identify a page by the `id` of its first and last items; None if empty.
+    """
+    return (items[0].get("id"), items[-1].get("id")) if items else None
+
+
+def _get_json(url: str, params: Dict[str, Any], retry_kwargs: Dict[str, Any]) -> Any:
+    response = get_upstream_client(**retry_kwargs).get(url, params=params)
+    response.raise_for_status()
+    return response.json()
+
+
+def _iter_numbered_pages(
+    url: str,
+    page_size: int,
+    workers: int,
+    retry_kwargs: Dict[str, Any],
+    first_page: Optional[int] = None,
+    seen: Optional[Set[Tuple[Any, Any]]] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Fetch `?page=N&limit=M` pages with up to `workers` requests in flight,
+    starting at `first_page` (default `settings.TODO_API_FIRST_PAGE`).
+    `seen` holds the `_page_bounds` of pages the caller already has.
+
+    The total is unknown up front, so pages are requested in order until one
+    comes back short; the few requests already in flight past that point
+    return empty pages and are ignored. An upstream that ignores the paging
+    parameters answers every page in full, so a page whose first and last
+    `id` repeat an earlier page's also ends the source, and no more than
+    `settings.TODO_API_MAX_PAGES` pages are ever requested.
+    """
+    page_param = settings.TODO_API_PAGE_PARAM
+    limit_param = settings.TODO_API_LIMIT_PARAM
+    stop_page = settings.TODO_API_FIRST_PAGE + settings.TODO_API_MAX_PAGES - 1
+
+    def fetch(page: int) -> List[Dict[str, Any]]:
+        return _page_items(
+            _get_json(url, {page_param: page, limit_param: page_size}, retry_kwargs)
+        )
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="todo-pages")
+    pending: Dict[Future, int] = {}
+    next_page = settings.TODO_API_FIRST_PAGE if first_page is None else first_page
+    last_page: Optional[int] = None
+    seen = set() if seen is None else set(seen)
+    try:
+        for _ in range(workers):
+            if next_page > stop_page:
+                break
+            pending[pool.submit(fetch, next_page)] = next_page
+            next_page += 1
+
+        while pending:
+            # Pages download in worker threads; the request only counts the
+            # time it is blocked waiting for them.
+            with track("upstream"):
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                page = pending.pop(future)
+                items = future.result()
+                bounds = _page_bounds(items)
+                repeated = bounds in seen
+                if repeated or len(items) < page_size:
+                    last_page = page if last_page is None else min(last_page, page)
+                if last_page is None and next_page <= stop_page:
+                    pending[pool.submit(fetch, next_page)] = next_page
+                    next_page += 1
+                elif last_page is None and page == stop_page:
+                    logger.warning(
+                        f"Stopped fetching {url} after {settings.TODO_API_MAX_PAGES} pages."
+                    )
+                if items and not repeated and (last_page is None or page <= last_page):
+                    seen.add(bounds)
+                    yield items
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _iter_cursor_pages(
+    url: str,
+    page_size: int,
+    retry_kwargs: Dict[str, Any],
+    cursor: Optional[str] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Follow `next` cursors from `cursor` (default: the first page), prefetching
+    each page while the previous one is being consumed.
+
+    Cursor pages can only be requested one after another, so concurrency
+    comes from overlapping the next request with the caller's DB writes.
+    """
+    cursor_param = settings.TODO_API_CURSOR_PARAM
+    limit_param = settings.TODO_API_LIMIT_PARAM
+
+    def fetch(cursor: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        params: Dict[str, Any] = {limit_param: page_size}
+        if cursor:
+            params[cursor_param] = cursor
+        payload = _get_json(url, params, retry_kwargs)
+        return _page_items(payload), _next_cursor(payload)
+
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="todo-pages")
+    try:
+        future: Optional[Future] = pool.submit(fetch, cursor)
+        while future is not None:
+            with track("upstream"):
+                items, next_cursor = future.result()
+            future = pool.submit(fetch, next_cursor) if next_cursor else None
+            if items:
+                yield items
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_todo_pages(
+    url: str,
+    mode: Optional[str] = None,
+    page_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    retries: int = 3,
+    backoff_factor: float = 0.3,
+    status_forcelist: Optional[List[int]] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Fetch a paginated upstream todo source, yielding pages as they arrive.
+
+    Pages are fetched on background threads through the shared pooled client,
+    each with the usual retry/backoff policy, so the caller can write one page
+    to the database while the next ones are still downloading.
+
+    Args:
+        url (str): The URL of the paginated endpoint.
+        mode (Optional[str], optional): `"page"` for page/limit parameters
+            (fetched concurrently) or `"cursor"` for next-cursor responses
+            (fetched one ahead). Defaults to `settings.TODO_API_PAGINATION`.
+        page_size (Optional[int], optional): Items requested per page.
+            Defaults to `settings.TODO_API_PAGE_SIZE`.
+        workers (Optional[int], optional): Page requests in flight at once in
+            `"page"` mode. Defaults to `settings.TODO_API_CONCURRENCY`.
+        retries (int, optional): Maximum number of retry attempts per page. Defaults to 3.
+        backoff_factor (float, optional): A factor to calculate the delay between retries. Defaults to 0.3.
+        status_forcelist (Optional[List[int]], optional): HTTP status codes that should trigger a retry.
+            Defaults to [500, 502, 503, 504] if not provided.
+
+    Yields:
+        List[Dict[str, Any]]: The items of each non-empty page, in arrival order.
+
+    Raises:
+        requests.RequestException: If any page fails after all retry attempts.
+        ValueError: If `mode` is not a supported pagination style.
+    """
+    mode = mode or settings.TODO_API_PAGINATION
+    page_size = page_size or settings.TODO_API_PAGE_SIZE
+    workers = workers or settings.TODO_API_CONCURRENCY
+    retry_kwargs = {
+        "retries": retries,
+        "backoff_factor": backoff_factor,
+        "status_forcelist": status_forcelist,
+    }
+
+    if mode == "page":
+        return _iter_numbered_pages(url, page_size, workers, retry_kwargs)
+    if mode == "cursor":
+        return _iter_cursor_pages(url, page_size, retry_kwargs)
+    raise ValueError(f"Unsupported upstream pagination mode: {mode!r}")
+
+
+def fetch_todo_pages_if_changed(
+    url: str,
+    etag: str = "",
+    last_modified: str = "",
+    mode: Optional[str] = None,
+    page_size: Optional[int] = None,
+    workers: Optional[int] = None,
+    retries: int = 3,
+    backoff_factor: float = 0.3,
+    status_forcelist: Optional[List[int]] = None,
+) -> Tuple[Optional[Iterator[Dict[str, Any]]], str, str]:
+    """
+    Conditionally fetch a paginated upstream todo source.
+
+    The paginated counterpart of `fetch_todos_if_changed`: the first page is
+    requested with the validators from the previous sync, and its `ETag` /
+    `Last-Modified` are taken to describe the whole collection. A 304 ends the
+    fetch there; otherwise the remaining pages are fetched as by
+    `iter_todo_pages` while the caller consumes the items.
+
+    Args:
+        url (str): The URL of the paginated endpoint.
+        etag (str, optional): `ETag` from the previous response, sent as `If-None-Match`.
+        last_modified (str, optional): `Last-Modified` from the previous response,
+            sent as `If-Modified-Since`.
+        mode (Optional[str], optional): `"page"` or `"cursor"`. Defaults to
+            `settings.TODO_API_PAGINATION`.
+        page_size (Optional[int], optional): Items requested per page.
+            Defaults to `settings.TODO_API_PAGE_SIZE`.
+        workers (Optional[int], optional): Page requests in flight at once in
+            `"page"` mode. Defaults to `settings.TODO_API_CONCURRENCY`.
+        retries (int, optional): Maximum number of retry attempts per page. Defaults to 3.
+        backoff_factor (float, optional): A factor to calculate the delay between retries. Defaults to 0.3.
+        status_forcelist (Optional[List[int]], optional): HTTP status codes that should trigger a retry.
+            Defaults to [500, 502, 503, 504] if not provided.
+
+    Returns:
+        Tuple[Optional[Iterator[Dict[str, Any]]], str, str]: The todo items of
+        every page (None if the first page answered 304 Not Modified), and the
+        `ETag` / `Last-Modified` to send next time.
+
+    Raises:
+        requests.RequestException: If any page fails after all retry attempts.
+        ValueError: If `mode` is not a supported pagination style.
+    """
+    mode = mode or settings.TODO_API_PAGINATION
+    page_size = page_size or settings.TODO_API_PAGE_SIZE
+    workers = workers or settings.TODO_API_CONCURRENCY
+    retry_kwargs = {
+        "retries": retries,
+        "backoff_factor": backoff_factor,
+        "status_forcelist": status_forcelist,
+    }
+    if mode not in {"page", "cursor"}:
+        raise ValueError(f"Unsupported upstream pagination mode: {mode!r}")
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    params: Dict[str, Any] = {settings.TODO_API_LIMIT_PARAM: page_size}
+    if mode == "page":
+        params[settings.TODO_API_PAGE_PARAM] = settings.TODO_API_FIRST_PAGE
+
+    response = get_upstream_client(**retry_kwargs).get(
+        url, params=params, headers=headers
+    )
+    if response.status_code == 304:
+        return None, etag, last_modified
+    response.raise_for_status()
+    payload = response.json()
+
+    def items() -> Iterator[Dict[str, Any]]:
+        first = _page_items(payload)
+        yield from first
+        if mode == "page":
+            if len(first) < page_size:
+                return
+            rest = _iter_numbered_pages(
+                url,
+                page_size,
+                workers,
+                retry_kwargs,
+                first_page=settings.TODO_API_FIRST_PAGE + 1,
+                seen={_page_bounds(first)},
+            )
+        else:
+            cursor = _next_cursor(payload)
+            if not cursor:
+                return
+            rest = _iter_cursor_pages(url, page_size, retry_kwargs, cursor)
+        for page in rest:
+            yield from page
+
+    return (
+        items(),
+        response.headers.get("ETag", ""),
+        response.headers.get("Last-Modified", ""),
+    )
@@ -0,0 +1,180 @@
+import asyncio
+import fcntl
+import logging
+import os
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Iterator, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection
+
+from todos.models import TodoCounter
+
+logger = logging.getLogger(__name__)
+
+SEED_LOCK_NAME = "todos-seed"
+
+
+def _advisory_key(name: str) -> int:
+    return zlib.crc32(name.encode())
+
+
+@contextmanager
+def _advisory_lock(name: str, timeout: float, poll_interval: float) -> Iterator[bool]:
+    """
+    Hold a session-level PostgreSQL advisory lock for the duration of the block.
+    """
+    key = _advisory_key(name)
+    deadline = time.monotonic() + timeout
+    acquired = False
+    with connection.cursor() as cursor:
+        while True:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [key])
+            acquired = cursor.fetchone()[0]
+            if acquired or time.monotonic() >= deadline:
+                break
+            time.sleep(poll_interval)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [key])
+
+
+@contextmanager
+def _file_lock(name: str, timeout: float, poll_interval: float) -> Iterator[bool]:
+    """
+    Hold an exclusive `flock` on a lock file shared by every local worker.
+    """
+    path = os.path.join(settings.TODO_LOCK_DIR, f"{name}.lock")
+    deadline = time.monotonic() + timeout
+    acquired = False
+    with open(path, "a") as lock_file:
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                acquired = True
+            except BlockingIOError:
+                pass
+            if acquired or time.monotonic() >= deadline:
+                break
+            time.sleep(poll_interval)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def single_flight_lock(
+    name: str, timeout: float, poll_interval: float = 0.1
+) -> Iterator[bool]:
+    """
+    Serialise a piece of work across every worker process and host.
+
+    Uses a PostgreSQL advisory lock when the default database is PostgreSQL,
+    so workers on different hosts coordinate too, and falls back to a file
+    lock in `settings.TODO_LOCK_DIR` on other backends.
+
+    Args:
+        name (str): Name of the lock; callers using the same name exclude each other.
+        timeout (float): Seconds to wait for the lock before giving up.
+        poll_interval (float, optional): Seconds between attempts. Defaults to 0.1.
+
+    Yields:
+        bool: True if the lock is held for the block, False if it timed out.
+    """
+    lock = _advisory_lock if connection.vendor == "postgresql" else _file_lock
+    with lock(name, timeout, poll_interval) as acquired:
+        yield acquired
+
+
+def seed_todos_if_empty(
+    loader: Callable[[], Optional[object]], timeout: Optional[float] = None
+) -> bool:
+    """
+    Run `loader` to seed the Todo table, at most once across all workers.
+
+    The first caller takes the seed lock and runs `loader`; concurrent
+    callers wait up to `timeout` seconds for it. Whoever gets the lock
+    re-checks the counters first, so once the table is seeded the loader is
+    not run again.
+
+    Args:
+        loader (Callable[[], Optional[object]]): The function that fetches
+            and stores the upstream todos (normally `get_external_todo_data`).
+        timeout (Optional[float], optional): Seconds to wait for another
+            worker's seed. Defaults to `settings.TODO_SEED_WAIT_TIMEOUT`.
+
+    Returns:
+        bool: True if seeding has finished (by us or by another worker), or
+        False if another worker is still seeding after `timeout` seconds.
+    """
+    if timeout is None:
+        timeout = settings.TODO_SEED_WAIT_TIMEOUT
+
+    with single_flight_lock(SEED_LOCK_NAME, timeout) as acquired:
+        if not acquired:
+            logger.info("Todo seeding is in progress in another worker.")
+            return False
+        if not TodoCounter.snapshot().total:
+            try:
+                loader()
+            except Exception as e:
+                logger.exception(f"Error fetching external data: {e}")
+        return True
+
+
+async def aseed_todos_if_empty(
+    loader: Callable[[], Awaitable[Optional[object]]],
+    timeout: Optional[float] = None,
+    poll_interval: float = 0.1,
+) -> bool:
+    """
+    Async version of `seed_todos_if_empty` for an async `loader`.
+
+    Lock attempts run in the request's thread-sensitive executor (so an
+    advisory lock stays on the request's connection), while waiting for
+    another worker and running `loader` happen on the event loop without
+    holding a thread.
+
+    Args:
+        loader (Callable[[], Awaitable[Optional[object]]]): The coroutine
+            function that fetches and stores the upstream todos (normally
+            `aget_external_todo_data`).
+        timeout (Optional[float], optional): Seconds to wait for another
+            worker's seed. Defaults to `settings.TODO_SEED_WAIT_TIMEOUT`.
+        poll_interval (float, optional): Seconds between lock attempts. Defaults to 0.1.
+
+    Returns:
+        bool: True if seeding has finished (by us or by another worker), or
+        False if another worker is still seeding after `timeout` seconds.
+    """
+    if timeout is None:
+        timeout = settings.TODO_SEED_WAIT_TIMEOUT
+    deadline = time.monotonic() + timeout
+
+    while True:
+        lock = single_flight_lock(SEED_LOCK_NAME, timeout=0)
+        if await sync_to_async(lock.__enter__)():
+            break
+        await sync_to_async(lock.__exit__)(None, None, None)
+        if time.monotonic() >= deadline:
+            logger.info("Todo seeding is in progress in another worker.")
+            return False
+        await asyncio.sleep(poll_interval)
+
+    try:
+        if not (await TodoCounter.asnapshot()).total:
+            try:
+                await loader()
+            except Exception as e:
+                logger.exception(f"Error fetching external data: {e}")
+        return True
+    finally:
+        await sync_to_async(lock.__exit__)(None, None, None)
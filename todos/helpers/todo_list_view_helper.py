@@ -1,17 +1,71 @@
 import logging
 import random
-from typing import Any, Dict, List, Optional
+import tempfile
+from functools import partial
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 import requests
+from asgiref.sync import sync_to_async
 from decouple import config
+from django.conf import settings
+from django.db import transaction
 from django.db.models import QuerySet
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
 
-from todos.models import Todo
+from todos.helpers.async_upstream_client import get_async_upstream_client
+from todos.helpers.json_stream import iter_json_array
+from todos.helpers.paged_fetch import iter_todo_pages
+from todos.helpers.upstream_client import get_upstream_client
+from todos.instrumentation import track_iter
+from todos.metrics import INGESTED_ROWS
+from todos.models import Todo, TodoCounter, TodoUser
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Number of avatar images in static/images; each user gets one at random.
+USER_IMAGE_COUNT = 7
+
+# Rows built and inserted per chunk while ingesting the upstream feed.
+INGEST_BATCH_SIZE = 1000
+
+# Bytes read from the upstream response stream at a time.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Bytes of an async download kept in memory before spilling to disk.
+DOWNLOAD_SPOOL_SIZE = 1024 * 1024
+
+
+def iter_chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Split an iterable into lists of at most `size` items without materialising it.
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def store_todo_users(user_ids: Iterable[int], known: Set[int]) -> None:
+    """
+    Create the users not seen before, each with a random avatar.
+
+    Users that already exist in the database keep their avatar (conflicting
+    inserts are ignored), so re-fetching the feed never reshuffles avatars.
+
+    Args:
+        user_ids (Iterable[int]): Upstream `userId`s, in order of appearance.
+        known (Set[int]): Users already handled in this run; updated in place.
+    """
+    new_users = [
+        TodoUser(id=user_id, avatar=random.randint(1, USER_IMAGE_COUNT))
+        for user_id in dict.fromkeys(user_ids)
+        if user_id not in known
+    ]
+    if new_users:
+        TodoUser.objects.bulk_create(new_users, ignore_conflicts=True)
+        known.update(user.id for user in new_users)
+
 
 def fetch_todos_from_api(
     url: str,
@@ -20,7 +74,8 @@ def fetch_todos_from_api(
     status_forcelist: Optional[List[int]] = None,
 ) -> List[Dict[str, Any]]:
     """
-    Fetch todos from an external API using a session with a retry strategy.
+    Fetch todos from an external API using the shared pooled client and its
+    retry strategy.
 
     Args:
         url (str): The URL of the external API.
@@ -35,34 +90,152 @@ def fetch_todos_from_api(
     Raises:
         requests.RequestException: If the request fails after all retry attempts.
     """
-    if status_forcelist is None:
-        status_forcelist = [500, 502, 503, 504]
-
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=retries,
-        read=retries,
-        connect=retries,
-        backoff_factor=backoff_factor,
-        status_forcelist=status_forcelist,
-        raise_on_status=True,
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
+    client = get_upstream_client(retries, backoff_factor, status_forcelist)
 
-    response = session.get(url, timeout=10)
+    response = client.get(url)
     response.raise_for_status()
     return response.json()
 
 
+def stream_todos_from_api(
+    url: str,
+    retries: int = 3,
+    backoff_factor: float = 0.3,
+    status_forcelist: Optional[List[int]] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Fetch todos from an external API, yielding items as the body arrives.
+
+    Unlike `fetch_todos_from_api`, the JSON array is parsed incrementally from
+    the response stream, so the full body is never held in memory.
+
+    Args:
+        url (str): The URL of the external API.
+        retries (int, optional): Maximum number of retry attempts. Defaults to 3.
+        backoff_factor (float, optional): A factor to calculate the delay between retries. Defaults to 0.3.
+        status_forcelist (Optional[List[int]], optional): HTTP status codes that should trigger a retry.
+            Defaults to [500, 502, 503, 504] if not provided.
+        chunk_size (int, optional): Bytes read from the socket at a time.
+
+    Yields:
+        Dict[str, Any]: Each todo item, in upstream order.
+
+    Raises:
+        requests.RequestException: If the request fails after all retry attempts.
+        ValueError: If the body is not a well-formed JSON array.
+    """
+    client = get_upstream_client(retries, backoff_factor, status_forcelist)
+
+    response = client.get(url, stream=True)
+    try:
+        response.raise_for_status()
+        chunks = response.iter_content(chunk_size=chunk_size)
+        yield from iter_json_array(track_iter(chunks, "upstream"))
+    finally:
+        response.close()
+
+
+def iter_upstream_todos(url: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over every upstream todo, whichever pagination style is configured.
+
+    Args:
+        url (str): The URL of the external API.
+
+    Returns:
+        Iterator[Dict[str, Any]]: The todo items; for paginated sources, pages
+        keep downloading in the background while the caller consumes them.
+    """
+    if settings.TODO_API_PAGINATION == "none":
+        return stream_todos_from_api(url)
+    return (item for page in iter_todo_pages(url) for item in page)
+
+
+def fetch_todos_if_changed(
+    url: str,
+    etag: str = "",
+    last_modified: str = "",
+    retries: int = 3,
+    backoff_factor: float = 0.3,
+    status_forcelist: Optional[List[int]] = None,
+) -> Tuple[Optional[Iterator[Dict[str, Any]]], str, str]:
+    """
+    Conditionally fetch todos, sending the validators from the previous sync.
+
+    Args:
+        url (str): The URL of the external API.
+        etag (str, optional): `ETag` from the previous response, sent as `If-None-Match`.
+        last_modified (str, optional): `Last-Modified` from the previous response,
+            sent as `If-Modified-Since`.
+        retries (int, optional): Maximum number of retry attempts. Defaults to 3.
+        backoff_factor (float, optional): A factor to calculate the delay between retries. Defaults to 0.3.
+        status_forcelist (Optional[List[int]], optional): HTTP status codes that should trigger a retry.
+            Defaults to [500, 502, 503, 504] if not provided.
+
+    Returns:
+        Tuple[Optional[Iterator[Dict[str, Any]]], str, str]: The todo items, streamed
+        from the response body (None if the upstream answered 304 Not Modified),
+        and the `ETag` / `Last-Modified` to send next time.
+
+    Raises:
+        requests.RequestException: If the request fails after all retry attempts.
+    """
+    client = get_upstream_client(retries, backoff_factor, status_forcelist)
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    response = client.get(url, headers=headers, stream=True)
+    if response.status_code == 304:
+        response.close()
+        return None, etag, last_modified
+    try:
+        response.raise_for_status()
+    except requests.RequestException:
+        response.close()
+        raise
+
+    def items() -> Iterator[Dict[str, Any]]:
+        try:
+            chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            yield from iter_json_array(track_iter(chunks, "upstream"))
+        finally:
+            response.close()
+
+    return (
+        items(),
+        response.headers.get("ETag", ""),
+        response.headers.get("Last-Modified", ""),
+    )
+
+
 logger = logging.getLogger(__name__)
 
 
-def get_external_todo_data() -> Optional[QuerySet[Todo]]:
+def get_external_todo_data(
+    batch_size: int = INGEST_BATCH_SIZE,
+) -> Optional[QuerySet[Todo]]:
     """
-    Fetches todo data from an external API, assigns a consistent random image
-    per user, and stores the data in the database.
+    Fetches todo data from an external API, creates each new user with a
+    random avatar, and stores the data in the database.
+
+    The response body is parsed incrementally (see `stream_todos_from_api`), or,
+    for a paginated upstream (`settings.TODO_API_PAGINATION`), pages are fetched
+    concurrently (see `iter_todo_pages`) while earlier pages are written. Items are
+    stored in chunks of `batch_size` rows, each with its own `bulk_create` and
+    transaction, so peak memory stays flat whatever the size of the feed. If
+    the stream fails midway, the chunks already stored are kept.
+
+    `bulk_create` bypasses model signals, so the maintained counters are
+    adjusted explicitly in the same transaction as each insert.
+
+    Args:
+        batch_size (int, optional): Rows built and inserted per chunk.
+            Defaults to `INGEST_BATCH_SIZE`.
 
     Returns:
         Optional[QuerySet[Todo]]: A queryset containing the newly created Todo objects,
@@ -71,29 +244,124 @@ def get_external_todo_data() -> Optional[QuerySet[Todo]]:
     url: str = config("TODO_API_URL", cast=str)
 
     try:
-        data: List[dict] = fetch_todos_from_api(url)
-        todos_to_create: List[Todo] = []
-        user_image_mapping: dict[int, int] = {}
-
-        for item in data:
-            user_id: int = item.get("userId")
-            if user_id not in user_image_mapping:
-                user_image_mapping[user_id] = random.randint(1, 7)
-
-            todos_to_create.append(
-                Todo(
-                    title=item.get("title"),
-                    api_id=item.get("id"),
-                    user_id=user_id,
-                    image=user_image_mapping[user_id],
-                    completed=item.get("completed", False),
-                )
+        if store_todo_items(iter_upstream_todos(url), batch_size):
+            return Todo.objects.all()
+    except Exception as e:
+        logger.error(f"Error fetching todos from external API: {e}")
+
+    return None
+
+
+def store_todo_items(items: Iterable[Dict[str, Any]], batch_size: int) -> int:
+    """
+    Insert upstream todo items in chunks, creating their users on first sight.
+
+    Each chunk is written with one `bulk_create` for its new users (see
+    `store_todo_users`), one for its todos and the matching global and
+    per-user counter adjustments, in its own transaction.
+
+    Args:
+        items (Iterable[Dict[str, Any]]): Upstream items; consumed lazily.
+        batch_size (int): Rows built and inserted per chunk.
+
+    Returns:
+        int: The number of todos created.
+    """
+    known_users: Set[int] = set()
+    created = 0
+
+    for chunk in iter_chunks(items, batch_size):
+        todos_to_create = [
+            Todo(
+                title=item.get("title"),
+                api_id=item.get("id"),
+                user_id=item.get("userId"),
+                completed=item.get("completed", False),
             )
+            for item in chunk
+        ]
 
-        if todos_to_create:
-            Todo.objects.bulk_create(todos_to_create)
-            return Todo.objects.all()
+        user_counts: Dict[int, Tuple[int, int]] = {}
+        for todo in todos_to_create:
+            total, completed = user_counts.get(todo.user_id, (0, 0))
+            user_counts[todo.user_id] = (total + 1, completed + bool(todo.completed))
 
+        with transaction.atomic():
+            store_todo_users((todo.user_id for todo in todos_to_create), known_users)
+            Todo.objects.bulk_create(todos_to_create, batch_size=batch_size)
+            TodoUser.adjust_counts(user_counts)
+            TodoCounter.adjust(
+                total=len(todos_to_create),
+                completed=sum(completed for _, completed in user_counts.values()),
+            )
+        created += len(todos_to_create)
+        INGESTED_ROWS.inc(len(todos_to_create))
+
+    return created
+
+
+async def afetch_todos_from_api(
+    url: str,
+    retries: int = 3,
+    backoff_factor: float = 0.3,
+    status_forcelist: Optional[List[int]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Async version of `fetch_todos_from_api`, using the event loop's shared
+    `AsyncUpstreamClient`.
+
+    Raises:
+        httpx.HTTPError: If the request fails after all retry attempts.
+    """
+    client = get_async_upstream_client(retries, backoff_factor, status_forcelist)
+
+    response = await client.get(url)
+    return response.json()
+
+
+async def aget_external_todo_data(
+    batch_size: int = INGEST_BATCH_SIZE,
+) -> Optional[QuerySet[Todo]]:
+    """
+    Async version of `get_external_todo_data`.
+
+    The body is downloaded with the async client into a spooled temporary
+    file (kept in memory up to `DOWNLOAD_SPOOL_SIZE` bytes, then on disk), so
+    no thread is held while waiting on the upstream or its retries. It is
+    then parsed incrementally and stored by `store_todo_items` in the
+    request's thread-sensitive executor.
+
+    A paginated upstream (`settings.TODO_API_PAGINATION`) is fetched and
+    stored in that executor as by `get_external_todo_data`, since its pages
+    already download on background threads while earlier ones are written.
+
+    Args:
+        batch_size (int, optional): Rows built and inserted per chunk.
+            Defaults to `INGEST_BATCH_SIZE`.
+
+    Returns:
+        Optional[QuerySet[Todo]]: A queryset of all Todo objects, or None if
+        nothing was stored or an error occurred.
+    """
+    url: str = config("TODO_API_URL", cast=str)
+
+    try:
+        if settings.TODO_API_PAGINATION != "none":
+            created = await sync_to_async(store_todo_items)(
+                iter_upstream_todos(url), batch_size
+            )
+            return Todo.objects.all() if created else None
+
+        client = get_async_upstream_client()
+        with tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_SIZE) as body:
+            await client.download(url, body, chunk_size=STREAM_CHUNK_SIZE)
+            body.seek(0)
+            chunks = iter(partial(body.read, STREAM_CHUNK_SIZE), b"")
+            created = await sync_to_async(store_todo_items)(
+                iter_json_array(chunks), batch_size
+            )
+        if created:
+            return Todo.objects.all()
     except Exception as e:
         logger.error(f"Error fetching todos from external API: {e}")
 
@@ -0,0 +1,174 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from decouple import config
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from todos.helpers.paged_fetch import fetch_todo_pages_if_changed
+from todos.helpers.todo_list_view_helper import (
+    fetch_todos_if_changed,
+    iter_chunks,
+    store_todo_users,
+)
+from todos.models import SyncState, Todo, TodoCounter, TodoUser
+
+logger = logging.getLogger(__name__)
+
+SYNC_BATCH_SIZE = 1000
+
+
+@dataclass
+class SyncResult:
+    """
+    Outcome of one `sync_external_todo_data` run.
+    """
+
+    not_modified: bool = False
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+
+def _sync_chunk(
+    items: List[Dict[str, Any]], known_users: Set[int], result: SyncResult
+) -> None:
+    """
+    Upsert one chunk of upstream items, writing only new or changed rows.
+
+    The global and per-user counters move by the net change of the chunk,
+    including todos that moved to another user.
+    """
+    # Lock the chunk's existing rows, in primary-key order like the other write
+    # paths, so a toggle cannot commit between the diff and the upsert.
+    with transaction.atomic():
+        rows = (
+            Todo.objects.select_for_update()
+            .filter(api_id__in=[item.get("id") for item in items])
+            .order_by("pk")
+            .values_list("api_id", "user_id", "title", "completed")
+        )
+        existing = {
+            api_id: (user_id, title, completed)
+            for api_id, user_id, title, completed in rows
+        }
+
+        to_write: List[Todo] = []
+        total_delta = completed_delta = 0
+        user_deltas: Dict[int, Tuple[int, int]] = {}
+
+        def count(user_id: int, total: int, completed: int) -> None:
+            old_total, old_completed = user_deltas.get(user_id, (0, 0))
+            user_deltas[user_id] = (old_total + total, old_completed + completed)
+
+        for item in items:
+            api_id = item.get("id")
+            user_id = item.get("userId")
+            title = item.get("title")
+            completed = bool(item.get("completed", False))
+
+            previous = existing.get(api_id)
+            if previous == (user_id, title, completed):
+                result.unchanged += 1
+                continue
+
+            to_write.append(
+                Todo(
+                    api_id=api_id,
+                    user_id=user_id,
+                    title=title,
+                    completed=completed,
+                )
+            )
+            if previous is None:
+                result.created += 1
+                total_delta += 1
+                completed_delta += int(completed)
+            else:
+                result.updated += 1
+                completed_delta += int(completed) - int(previous[2])
+                count(previous[0], -1, -int(previous[2]))
+            count(user_id, 1, int(completed))
+
+        if to_write:
+            store_todo_users((todo.user_id for todo in to_write), known_users)
+            Todo.objects.bulk_create(
+                to_write,
+                update_conflicts=True,
+                unique_fields=["api_id"],
+                update_fields=["user", "title", "completed", "updated_at"],
+            )
+            TodoUser.adjust_counts(user_deltas)
+            TodoCounter.adjust(total=total_delta, completed=completed_delta)
+
+
+def sync_external_todo_data(
+    url: Optional[str] = None,
+    conditional: bool = True,
+    batch_size: int = SYNC_BATCH_SIZE,
+) -> SyncResult:
+    """
+    Incrementally sync the Todo table with the external API.
+
+    Unlike `get_external_todo_data`, which only seeds an empty table, this can
+    run at any time:
+    - The request carries the `ETag` / `Last-Modified` of the previous sync;
+      a 304 answer ends the sync without touching the Todo table. For a
+      paginated upstream (`settings.TODO_API_PAGINATION`) the first page is
+      requested conditionally and the rest are fetched as during seeding (see
+      `fetch_todo_pages_if_changed`).
+    - The payload is streamed and diffed against existing rows by `api_id` in
+      chunks of `batch_size`, and only new or changed rows are written, via batched
+      upserts (`INSERT ... ON CONFLICT (api_id) DO UPDATE`).
+    - Existing users keep their avatar; only users never seen before are
+      created, with a random one.
+
+    Args:
+        url (Optional[str], optional): The upstream URL. Defaults to the
+            `TODO_API_URL` setting.
+        conditional (bool, optional): Send the stored validators. Pass False to
+            force a full comparison. Defaults to True.
+        batch_size (int, optional): Items diffed and upserted per statement.
+
+    Returns:
+        SyncResult: Counts of created, updated and unchanged rows.
+
+    Raises:
+        requests.RequestException: If the upstream request fails after all retries.
+    """
+    if url is None:
+        url = config("TODO_API_URL", cast=str)
+
+    state, _ = SyncState.objects.get_or_create(source=url)
+    if settings.TODO_API_PAGINATION == "none":
+        fetch = fetch_todos_if_changed
+    else:
+        fetch = fetch_todo_pages_if_changed
+    data, etag, last_modified = fetch(
+        url,
+        etag=state.etag if conditional else "",
+        last_modified=state.last_modified if conditional else "",
+    )
+
+    result = SyncResult()
+    if data is None:
+        logger.info(f"Upstream todos at {url} not modified since last sync.")
+        result.not_modified = True
+        return result
+
+    known_users: Set[int] = set()
+    for chunk in iter_chunks(data, batch_size):
+        _sync_chunk(chunk, known_users, result)
+
+    state.etag = etag
+    state.last_modified = last_modified
+    state.synced_at = timezone.now()
+    state.save(update_fields=["etag", "last_modified", "synced_at"])
+
+    logger.info(
+        f"Synced todos from {url}: {result.created} created, "
+        f"{result.updated} updated, {result.unchanged} unchanged."
+    )
+    return result
@@ -0,0 +1,174 @@
+import os
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from todos.instrumentation import track
+from todos.metrics import UPSTREAM_DURATION, UPSTREAM_ERRORS, UPSTREAM_RETRIES
+
+
+class UpstreamClient:
+    """
+    A long-lived HTTP client for the upstream todo API.
+
+    Wraps one `requests.Session` whose adapter keeps a pool of keep-alive
+    connections per host, so repeated fetches reuse TCP/TLS connections
+    instead of paying a new handshake each time.
+
+    The pooled connections are thread-safe; cookie storage is disabled so the
+    session carries no other mutable state and can be shared by all threads
+    of a worker. Use `get_upstream_client()` rather than instantiating this
+    directly, so the instance is shared and replaced after a fork.
+
+    Args:
+        retries (int, optional): Maximum number of retry attempts. Defaults to 3.
+        backoff_factor (float, optional): A factor to calculate the delay between retries. Defaults to 0.3.
+        status_forcelist (Optional[List[int]], optional): HTTP status codes that should trigger a retry.
+            Defaults to [500, 502, 503, 504] if not provided.
+        pool_connections (Optional[int], optional): Number of per-host pools to keep.
+            Defaults to `settings.UPSTREAM_POOL_CONNECTIONS`.
+        pool_maxsize (Optional[int], optional): Keep-alive connections kept per host.
+            Defaults to `settings.UPSTREAM_POOL_MAXSIZE`.
+        pool_block (Optional[bool], optional): If True, never open more than
+            `pool_maxsize` connections to one host; callers wait for a free one.
+            Defaults to `settings.UPSTREAM_POOL_BLOCK`.
+        connect_timeout (Optional[float], optional): Seconds to establish a connection.
+            Defaults to `settings.UPSTREAM_CONNECT_TIMEOUT`.
+        read_timeout (Optional[float], optional): Seconds to wait between bytes of the response.
+            Defaults to `settings.UPSTREAM_READ_TIMEOUT`.
+    """
+
+    def __init__(
+        self,
+        retries: int = 3,
+        backoff_factor: float = 0.3,
+        status_forcelist: Optional[List[int]] = None,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+    ) -> None:
+        if status_forcelist is None:
+            status_forcelist = [500, 502, 503, 504]
+
+        retry_strategy = Retry(
+            total=retries,
+            read=retries,
+            connect=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=status_forcelist,
+            raise_on_status=True,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections or settings.UPSTREAM_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize or settings.UPSTREAM_POOL_MAXSIZE,
+            pool_block=(
+                settings.UPSTREAM_POOL_BLOCK if pool_block is None else pool_block
+            ),
+            max_retries=retry_strategy,
+        )
+
+        self.session = requests.Session()
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.timeout: Tuple[float, float] = (
+            connect_timeout or settings.UPSTREAM_CONNECT_TIMEOUT,
+            read_timeout or settings.UPSTREAM_READ_TIMEOUT,
+        )
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a GET through the pooled session with the client's timeouts.
+
+        The duration, the retries urllib3 made and failures are recorded in
+        the upstream metrics.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.perf_counter()
+        try:
+            with track("upstream"):
+                response = self.session.get(url, **kwargs)
+        except requests.RequestException:
+            UPSTREAM_ERRORS.inc()
+            raise
+        finally:
+            UPSTREAM_DURATION.observe(time.perf_counter() - start)
+
+        retries = getattr(response.raw, "retries", None)
+        if isinstance(retries, Retry) and retries.history:
+            UPSTREAM_RETRIES.inc(len(retries.history))
+        return response
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_clients: Dict[Tuple[int, float, Tuple[int, ...]], UpstreamClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_upstream_client(
+    retries: int = 3,
+    backoff_factor: float = 0.3,
+    status_forcelist: Optional[List[int]] = None,
+) -> UpstreamClient:
+    """
+    Return the process-wide client for a retry policy, creating it on first use.
+
+    Args:
+        retries (int, optional): Maximum number of retry attempts. Defaults to 3.
+        backoff_factor (float, optional): A factor to calculate the delay between retries. Defaults to 0.3.
+        status_forcelist (Optional[List[int]], optional): HTTP status codes that should trigger a retry.
+            Defaults to [500, 502, 503, 504] if not provided.
+
+    Returns:
+        UpstreamClient: A client shared by every caller using the same policy.
+    """
+    if status_forcelist is None:
+        status_forcelist = [500, 502, 503, 504]
+    key = (retries, backoff_factor, tuple(status_forcelist))
+
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = UpstreamClient(retries, backoff_factor, list(status_forcelist))
+                _clients[key] = client
+    return client
+
+
+def reset_upstream_clients() -> None:
+    """
+    Close and forget every shared client; the next call builds fresh ones.
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+def _forget_clients_after_fork() -> None:
+    """
+    Drop the parent's clients in a forked child without closing them.
+
+    The child inherits the parent's pooled sockets; sharing them would
+    interleave two processes' traffic on one connection, and closing them
+    could disturb the parent. Dropping the references makes the child open
+    its own connections on first use.
+    """
+    global _clients_lock
+    _clients.clear()
+    _clients_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_clients_after_fork)
@@ -0,0 +1,173 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TypeVar
+
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.template.response import TemplateResponse
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Sentinel for an exhausted iterator in `track_iter`.
+_DONE: Any = object()
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Queries and timings collected while serving one request.
+
+    Attributes:
+        queries (int): Statements sent to the database.
+        db_time (float): Seconds spent executing them.
+        timings (Dict[str, float]): Seconds per named phase, e.g. `render`
+            or `upstream` (see `track`).
+    """
+
+    started: float = field(default_factory=time.perf_counter)
+    queries: int = 0
+    db_time: float = 0.0
+    timings: Dict[str, float] = field(default_factory=dict)
+    # `sync_to_async` hands the same object to executor threads.
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add_query(self, seconds: float) -> None:
+        with self.lock:
+            self.queries += 1
+            self.db_time += seconds
+
+    def add(self, name: str, seconds: float) -> None:
+        with self.lock:
+            self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+
+current_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "current_metrics", default=None
+)
+
+
+def record_query(
+    execute: Callable[..., Any], sql: str, params: Any, many: bool, context: Any
+) -> Any:
+    """
+    Database execute wrapper counting and timing statements of the current request.
+
+    Statements outside a request being recorded pass straight through.
+    """
+    metrics = current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.add_query(time.perf_counter() - start)
+
+
+def install_query_recorder(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    """
+    Add `record_query` to a connection's execute wrappers, once.
+
+    Connected to `connection_created` when `REQUEST_TIMING` is on, so every
+    thread's connections are covered, including those used by
+    `sync_to_async` executors.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@contextmanager
+def record_request() -> Iterator[RequestMetrics]:
+    """
+    Collect queries and `track`ed timings into a fresh `RequestMetrics`.
+    """
+    # Connections opened before the signal was connected.
+    for connection in connections.all(initialized_only=True):
+        install_query_recorder(connection)
+
+    metrics = RequestMetrics()
+    token = current_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        current_metrics.reset(token)
+
+
+@contextmanager
+def track(name: str) -> Iterator[None]:
+    """
+    Add the time spent in the block to the current request's `name` timing.
+
+    A no-op outside a recorded request.
+    """
+    metrics = current_metrics.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add(name, time.perf_counter() - start)
+
+
+def track_iter(items: Iterable[T], name: str) -> Iterator[T]:
+    """
+    Yield from `items`, adding the time spent waiting on each one to `name`.
+
+    For response bodies read lazily, e.g. `response.iter_content()`, so only
+    the wait for the upstream is counted, not the caller's work in between.
+    """
+    iterator = iter(items)
+    while True:
+        with track(name):
+            item = next(iterator, _DONE)
+        if item is _DONE:
+            return
+        yield item
+
+
+class TimedTemplateResponse(TemplateResponse):
+    """
+    A `TemplateResponse` reporting its render time as the `render` timing.
+    """
+
+    @property
+    def rendered_content(self) -> str:
+        with track("render"):
+            return super().rendered_content
+
+
+def query_budget(limit: int) -> Callable[[F], F]:
+    """
+    Declare the most queries a function view may issue per request.
+
+    Class-based views set a `query_budget` attribute instead. The budget is
+    reported by `RequestTimingMiddleware` and enforced in the tests.
+
+    Args:
+        limit (int): Maximum number of statements.
+    """
+
+    def decorator(view: F) -> F:
+        view.query_budget = limit  # type: ignore[attr-defined]
+        return view
+
+    return decorator
+
+
+def get_query_budget(view: Callable[..., Any]) -> Optional[int]:
+    """
+    Return the query budget declared by a resolved view, or None.
+    """
+    budget = getattr(view, "query_budget", None)
+    if budget is None:
+        budget = getattr(getattr(view, "view_class", None), "query_budget", None)
+    return budget
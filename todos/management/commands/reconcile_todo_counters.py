@@ -0,0 +1,44 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from todos.models import TodoCounter, TodoUser
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the Todo table and repair any drift in the maintained global "
+        "and per-user counters."
+    )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        before = TodoCounter.objects.filter(scope=TodoCounter.GLOBAL_SCOPE).first()
+        after = TodoCounter.rebuild()
+
+        if before is None:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Counter row was missing; created it with {after.total} total, "
+                    f"{after.completed} completed."
+                )
+            )
+        elif (before.total, before.completed) != (after.total, after.completed):
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Repaired drift: total {before.total} -> {after.total}, "
+                    f"completed {before.completed} -> {after.completed}."
+                )
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Counters are in sync ({after.total} total, "
+                    f"{after.completed} completed)."
+                )
+            )
+
+        drifted_users = TodoUser.rebuild_counts()
+        if drifted_users:
+            self.stdout.write(
+                self.style.WARNING(f"Repaired the counts of {drifted_users} user(s).")
+            )
@@ -0,0 +1,37 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from todos.helpers import get_external_todo_data, seed_todos_if_empty
+from todos.models import TodoCounter
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed the Todo table from the external API ahead of traffic. Uses the "
+        "same cross-process lock as the list view, so it is safe to run while "
+        "workers are serving requests."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--wait",
+            type=float,
+            default=120.0,
+            help="Seconds to wait for a seed already running elsewhere (default: 120).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if TodoCounter.snapshot().total:
+            self.stdout.write(self.style.SUCCESS("Todos are already seeded."))
+            return
+
+        if not seed_todos_if_empty(get_external_todo_data, timeout=options["wait"]):
+            raise CommandError(
+                "Timed out waiting for another process to finish seeding todos."
+            )
+
+        total = TodoCounter.snapshot().total
+        if not total:
+            raise CommandError("Seeding finished but no todos were stored.")
+        self.stdout.write(self.style.SUCCESS(f"Seeded {total} todos."))
@@ -0,0 +1,123 @@
+from argparse import BooleanOptionalAction
+from typing import Any, Callable, Dict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils.module_loading import import_string
+
+from todos.helpers import warm_up
+from todos.metrics import clear_multiprocess_dir, multiprocess_dir, worker_exited
+
+ASGI_WORKER_CLASS = "uvicorn.workers.UvicornWorker"
+
+
+def build_gunicorn_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Translate the command's options into gunicorn settings.
+
+    Args:
+        options (Dict[str, Any]): Parsed command options.
+
+    Returns:
+        Dict[str, Any]: Settings for gunicorn's `Config`.
+    """
+    threads = options["threads"]
+    if options["asgi"]:
+        worker_class = ASGI_WORKER_CLASS
+    elif threads > 1:
+        worker_class = "gthread"
+    else:
+        worker_class = "sync"
+
+    return {
+        "bind": options["bind"],
+        "workers": options["workers"],
+        "threads": threads,
+        "worker_class": worker_class,
+        "max_requests": options["max_requests"],
+        "max_requests_jitter": options["max_requests_jitter"],
+        "timeout": options["timeout"],
+        "graceful_timeout": options["timeout"],
+        "keepalive": options["keepalive"],
+        "preload_app": True,
+        "accesslog": "-" if options["access_log"] else None,
+        # Workers share metrics through PROMETHEUS_MULTIPROC_DIR; forget the
+        # live gauges of the ones that exit.
+        "child_exit": worker_exited if multiprocess_dir() else None,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve the project with gunicorn: the application is loaded and warmed "
+        "once in the master, then forked into the configured workers."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--bind", default=settings.WEB_BIND)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.WEB_CONCURRENCY,
+            help="Worker processes (WEB_CONCURRENCY).",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=settings.WEB_THREADS,
+            help="Threads per worker; more than 1 uses the gthread worker.",
+        )
+        parser.add_argument(
+            "--max-requests",
+            type=int,
+            default=settings.WEB_MAX_REQUESTS,
+            help="Recycle a worker after this many requests (0 disables).",
+        )
+        parser.add_argument(
+            "--max-requests-jitter",
+            type=int,
+            default=settings.WEB_MAX_REQUESTS_JITTER,
+            help="Random extra requests so workers do not recycle together.",
+        )
+        parser.add_argument("--timeout", type=int, default=settings.WEB_TIMEOUT)
+        parser.add_argument("--keepalive", type=int, default=settings.WEB_KEEPALIVE)
+        parser.add_argument(
+            "--asgi",
+            action=BooleanOptionalAction,
+            default=settings.ASYNC_VIEWS,
+            help=(
+                "Serve config.asgi with uvicorn workers; --no-asgi serves "
+                "config.wsgi (default: ASYNC_VIEWS)."
+            ),
+        )
+        parser.add_argument("--access-log", action="store_true")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            from gunicorn.app.base import BaseApplication
+        except ImportError as e:
+            raise CommandError("gunicorn is required to serve the project.") from e
+
+        application_path = (
+            settings.ASGI_APPLICATION if options["asgi"] else settings.WSGI_APPLICATION
+        )
+        gunicorn_options = build_gunicorn_options(options)
+        clear_multiprocess_dir()
+
+        class PreloadedApplication(BaseApplication):
+            def load_config(self) -> None:
+                for key, value in gunicorn_options.items():
+                    if value is not None:
+                        self.cfg.set(key, value)
+
+            def load(self) -> Callable:
+                application = import_string(application_path)
+                warm_up()
+                return application
+
+        self.stdout.write(
+            f"Serving {application_path} on {options['bind']} with "
+            f"{options['workers']} x {gunicorn_options['worker_class']} workers "
+            f"({options['threads']} threads each)."
+        )
+        PreloadedApplication().run()
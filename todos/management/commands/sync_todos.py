@@ -0,0 +1,33 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from todos.helpers import sync_external_todo_data
+
+
+class Command(BaseCommand):
+    help = (
+        "Incrementally sync todos from the external API, writing only new or "
+        "changed rows. Skips all work when the upstream answers 304."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Ignore the stored ETag/Last-Modified and compare every item.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        result = sync_external_todo_data(conditional=not options["full"])
+        if result.not_modified:
+            self.stdout.write(
+                self.style.SUCCESS("Upstream not modified; nothing to do.")
+            )
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Synced todos: {result.created} created, {result.updated} updated, "
+                f"{result.unchanged} unchanged."
+            )
+        )
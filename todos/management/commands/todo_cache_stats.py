@@ -0,0 +1,37 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from todos.helpers import (
+    page_cache_stats,
+    page_cache_stats_enabled,
+    reset_page_cache_stats,
+)
+
+
+class Command(BaseCommand):
+    help = "Show hit/miss counters for the rendered todo list page cache."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the counters to zero after printing them.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not page_cache_stats_enabled():
+            self.stdout.write(
+                self.style.WARNING(
+                    "Page cache stats are off; set TODO_PAGE_CACHE_STATS=True."
+                )
+            )
+        stats = page_cache_stats()
+        ratio = stats["hits"] / stats["lookups"] if stats["lookups"] else 0.0
+        self.stdout.write(
+            f"Page cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({ratio:.1%} hit rate)."
+        )
+        if options["reset"]:
+            reset_page_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
@@ -0,0 +1,213 @@
+import os
+import shutil
+import weakref
+from typing import Any, Iterator, Tuple
+
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+try:
+    import prometheus_client
+    from prometheus_client import multiprocess
+    from prometheus_client.core import (
+        CounterMetricFamily,
+        GaugeMetricFamily,
+        Metric,
+    )
+except ImportError:  # the `metrics` extra is not installed
+    prometheus_client = None
+
+# Set in the environment of every worker (and of `sync_todos` runs) to
+# aggregate their metrics through files in this directory.
+MULTIPROC_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def metrics_available() -> bool:
+    return prometheus_client is not None
+
+
+def multiprocess_dir() -> str:
+    return os.environ.get(MULTIPROC_ENV, "")
+
+
+class NullMetric:
+    """
+    Stands in for every metric when prometheus_client is not installed, so
+    call sites can record unconditionally.
+    """
+
+    def labels(self, *args: Any, **kwargs: Any) -> "NullMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def observe(self, amount: float) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+
+if prometheus_client is not None:
+    # Our own registry, so re-imports (e.g. in tests) cannot clash with the
+    # client's global one.
+    REGISTRY = prometheus_client.CollectorRegistry()
+
+    REQUEST_LATENCY = prometheus_client.Histogram(
+        "todo_http_request_duration_seconds",
+        "Time to produce a response, per view.",
+        ["view", "method"],
+        registry=REGISTRY,
+    )
+    TOGGLES = prometheus_client.Counter(
+        "todo_toggle_requests",
+        "Requests to /toggle-todo/ by outcome.",
+        ["outcome"],
+        registry=REGISTRY,
+    )
+    UPSTREAM_DURATION = prometheus_client.Histogram(
+        "todo_upstream_request_duration_seconds",
+        "Time for upstream todo API requests, retries included.",
+        registry=REGISTRY,
+    )
+    UPSTREAM_RETRIES = prometheus_client.Counter(
+        "todo_upstream_retries",
+        "Retried upstream todo API requests.",
+        registry=REGISTRY,
+    )
+    UPSTREAM_ERRORS = prometheus_client.Counter(
+        "todo_upstream_errors",
+        "Upstream todo API requests that failed after all retries.",
+        registry=REGISTRY,
+    )
+    INGESTED_ROWS = prometheus_client.Counter(
+        "todo_ingested_rows",
+        "Todos created from the upstream feed.",
+        registry=REGISTRY,
+    )
+    DB_CONNECTIONS_OPENED = prometheus_client.Counter(
+        "todo_db_connections_opened",
+        "Database connections opened.",
+        registry=REGISTRY,
+    )
+    DB_CONNECTIONS_OPEN = prometheus_client.Gauge(
+        "todo_db_connections_open",
+        "Database connections currently open, summed over live workers.",
+        registry=REGISTRY,
+        multiprocess_mode="livesum",
+    )
+else:
+    REGISTRY = None
+    REQUEST_LATENCY = TOGGLES = NullMetric()
+    UPSTREAM_DURATION = UPSTREAM_RETRIES = UPSTREAM_ERRORS = NullMetric()
+    INGESTED_ROWS = DB_CONNECTIONS_OPENED = DB_CONNECTIONS_OPEN = NullMetric()
+
+
+class TodoStateCollector:
+    """
+    Report state shared by all workers, read when `/metrics` is scraped: the
+    todo counts, page cache hits/misses (with `TODO_PAGE_CACHE_STATS`) and the
+    last upstream sync per source.
+
+    Costs two queries and at most one cache lookup per scrape.
+    """
+
+    def collect(self) -> Iterator["Metric"]:
+        from todos.helpers import page_cache_stats, page_cache_stats_enabled
+        from todos.models import SyncState, TodoCounter
+
+        counters = TodoCounter.snapshot()
+        todos = GaugeMetricFamily("todo_items", "Todos by state.", labels=["state"])
+        todos.add_metric(["completed"], counters.completed)
+        todos.add_metric(["uncompleted"], counters.uncompleted)
+        yield todos
+
+        if page_cache_stats_enabled():
+            stats = page_cache_stats()
+            for name in ("hits", "misses"):
+                yield CounterMetricFamily(
+                    f"todo_page_cache_{name}", f"Page cache {name}.", value=stats[name]
+                )
+
+        synced = GaugeMetricFamily(
+            "todo_last_sync_timestamp_seconds",
+            "When each upstream source was last synced.",
+            labels=["source"],
+        )
+        for source, synced_at in SyncState.objects.exclude(synced_at=None).values_list(
+            "source", "synced_at"
+        ):
+            synced.add_metric([source], synced_at.timestamp())
+        yield synced
+
+
+if prometheus_client is not None:
+    REGISTRY.register(TodoStateCollector())
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    Render every metric in the Prometheus text format.
+
+    With `PROMETHEUS_MULTIPROC_DIR` set, the process metrics are aggregated
+    from the files all workers write there, so any worker can answer the
+    scrape.
+
+    Returns:
+        Tuple[bytes, str]: The body and its content type.
+    """
+    registry = REGISTRY
+    if multiprocess_dir():
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        registry.register(TodoStateCollector())
+    return (
+        prometheus_client.generate_latest(registry),
+        prometheus_client.CONTENT_TYPE_LATEST,
+    )
+
+
+# Every database connection wrapper of this process, across threads.
+_connections: "weakref.WeakSet[BaseDatabaseWrapper]" = weakref.WeakSet()
+
+
+def update_connection_gauge(**kwargs: Any) -> None:
+    """
+    Set the open connections gauge from this process's connection wrappers.
+
+    Connected to `request_finished` after Django closes expired connections.
+    """
+    DB_CONNECTIONS_OPEN.set(
+        sum(1 for wrapper in list(_connections) if wrapper.connection is not None)
+    )
+
+
+def count_connection(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    """
+    Count a newly opened database connection (`connection_created`).
+    """
+    _connections.add(connection)
+    DB_CONNECTIONS_OPENED.inc()
+    update_connection_gauge()
+
+
+def clear_multiprocess_dir() -> None:
+    """
+    Remove the metric files of a previous server run.
+
+    Called by `manage.py serve` before the workers start; stale files would
+    otherwise be added to the new run's counters.
+    """
+    path = multiprocess_dir()
+    if not path:
+        return
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def worker_exited(server: Any, worker: Any) -> None:
+    """
+    gunicorn `child_exit` hook: drop the live gauges of a dead worker.
+    """
+    if metrics_available() and multiprocess_dir():
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,152 @@
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Union
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+
+from todos.instrumentation import RequestMetrics, get_query_budget, record_request
+from todos.metrics import REQUEST_LATENCY
+
+logger = logging.getLogger("todos.timing")
+
+# Methods the latency histogram labels as such; any other is labelled `other`.
+METRIC_METHODS = frozenset({"GET", "POST", "HEAD"})
+
+
+class RequestTimingMiddleware:
+    """
+    Report the queries and time spent on each request (`REQUEST_TIMING=True`).
+
+    Every response gets a `Server-Timing` header, which browser dev tools
+    show next to the request:
+
+        Server-Timing: db;dur=1.84;desc="3 queries", render;dur=4.10, total;dur=7.52
+
+    and one `key=value` line is logged on the `todos.timing` logger, with the
+    same fields in the record's `timing` attribute for structured handlers.
+    `upstream` covers waiting on the upstream todo API, `render` the template.
+
+    A view whose queries exceed its declared budget (see
+    `todos.instrumentation.query_budget`) is logged as a warning instead.
+    Works in front of both sync and async views.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[
+            [HttpRequest], Union[HttpResponse, Awaitable[HttpResponse]]
+        ],
+    ) -> None:
+        if not settings.REQUEST_TIMING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with record_request() as metrics:
+            response = self.get_response(request)
+        return self.report(request, response, metrics)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        with record_request() as metrics:
+            response = await self.get_response(request)
+        return self.report(request, response, metrics)
+
+    def report(
+        self, request: HttpRequest, response: HttpResponse, metrics: RequestMetrics
+    ) -> HttpResponse:
+        """
+        Add the `Server-Timing` header and log the request's figures.
+        """
+        total = metrics.elapsed()
+        response.headers["Server-Timing"] = server_timing(metrics, total)
+
+        match = getattr(request, "resolver_match", None)
+        budget = get_query_budget(match.func) if match else None
+        fields: Dict[str, Any] = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "queries": metrics.queries,
+            "budget": budget,
+            "db_ms": round(metrics.db_time * 1000, 2),
+            **{
+                f"{name}_ms": round(seconds * 1000, 2)
+                for name, seconds in metrics.timings.items()
+            },
+            "total_ms": round(total * 1000, 2),
+        }
+        line = " ".join(f"{key}={value}" for key, value in fields.items())
+        if budget is not None and metrics.queries > budget:
+            logger.warning("over query budget %s", line, extra={"timing": fields})
+        else:
+            logger.info(line, extra={"timing": fields})
+        return response
+
+
+def server_timing(metrics: RequestMetrics, total: float) -> str:
+    """
+    Format `metrics` as a `Server-Timing` header value (durations in ms).
+    """
+    queries = f"{metrics.queries} quer{'y' if metrics.queries == 1 else 'ies'}"
+    entries = [f'db;dur={metrics.db_time * 1000:.2f};desc="{queries}"']
+    entries += [
+        f"{name};dur={seconds * 1000:.2f}"
+        for name, seconds in sorted(metrics.timings.items())
+    ]
+    entries.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(entries)
+
+
+class RequestMetricsMiddleware:
+    """
+    Observe each response's latency in the `todo_http_request_duration_seconds`
+    histogram, labelled with the URL name of the view (`METRICS_ENABLED=True`).
+
+    Requests that match no URL are labelled `unmatched`, and methods outside
+    `METRIC_METHODS` `other`, so clients cannot create new series.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[
+            [HttpRequest], Union[HttpResponse, Awaitable[HttpResponse]]
+        ],
+    ) -> None:
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start = time.perf_counter()
+        response = self.get_response(request)
+        self.observe(request, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        self.observe(request, time.perf_counter() - start)
+        return response
+
+    def observe(self, request: HttpRequest, seconds: float) -> None:
+        match = getattr(request, "resolver_match", None)
+        view = (match.url_name if match else None) or "unmatched"
+        method = request.method if request.method in METRIC_METHODS else "other"
+        REQUEST_LATENCY.labels(view=view, method=method).observe(seconds)
@@ -0,0 +1,34 @@
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def populate_counters(apps, schema_editor):
+    Todo = apps.get_model("todos", "Todo")
+    TodoCounter = apps.get_model("todos", "TodoCounter")
+    counts = Todo.objects.aggregate(
+        total=Count("pk"), completed=Count("pk", filter=Q(completed=True))
+    )
+    TodoCounter.objects.update_or_create(scope="all", defaults=counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TodoCounter",
+            fields=[
+                (
+                    "scope",
+                    models.CharField(max_length=32, primary_key=True, serialize=False),
+                ),
+                ("total", models.BigIntegerField(default=0)),
+                ("completed", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
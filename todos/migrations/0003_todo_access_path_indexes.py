@@ -0,0 +1,39 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0002_todocounter"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(
+                fields=["completed", "api_id"], name="todo_completed_api_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(
+                condition=models.Q(("completed", True)),
+                fields=["api_id"],
+                name="todo_complete_api_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(
+                condition=models.Q(("completed", False)),
+                fields=["api_id"],
+                name="todo_pending_api_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(
+                fields=["user_id", "api_id"], name="todo_user_api_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0004_syncstate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="todocounter",
+            name="version",
+            field=models.BigIntegerField(default=0),
+        ),
+    ]
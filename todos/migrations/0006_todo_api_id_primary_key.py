@@ -0,0 +1,88 @@
+import uuid
+
+from django.db import migrations, models
+
+
+def _old_fields(Todo):
+    """
+    Build the `api_id` and `uuid` fields as they were before this migration.
+    """
+    old_api_id = models.IntegerField(unique=True)
+    old_api_id.set_attributes_from_name("api_id")
+    old_api_id.model = Todo
+    old_uuid = models.UUIDField(
+        default=uuid.uuid4, editable=False, primary_key=True, serialize=False
+    )
+    old_uuid.set_attributes_from_name("uuid")
+    old_uuid.model = Todo
+    return old_api_id, old_uuid
+
+
+def swap_primary_key(apps, schema_editor):
+    """
+    Move the table's primary key from `uuid` to `api_id`.
+
+    Runs after the state change, so `Todo` here is already the target model:
+    `api_id` the primary key and `uuid` unique.
+    """
+    Todo = apps.get_model("todos", "Todo")
+    if schema_editor.connection.vendor == "sqlite":
+        # SQLite cannot alter a primary key in place; copy into a table built
+        # from the model, where `api_id` becomes the rowid.
+        schema_editor._remake_table(Todo)
+        return
+    old_api_id, old_uuid = _old_fields(Todo)
+    # A field losing the primary key drops its constraint, so `uuid` goes
+    # first; the unique constraint on `api_id` is then replaced by the key.
+    schema_editor.alter_field(Todo, old_uuid, Todo._meta.get_field("uuid"))
+    schema_editor.alter_field(Todo, old_api_id, Todo._meta.get_field("api_id"))
+
+
+def restore_uuid_primary_key(apps, schema_editor):
+    """
+    Move the primary key back from `api_id` to `uuid`.
+    """
+    Todo = apps.get_model("todos", "Todo")
+    old_api_id, old_uuid = _old_fields(Todo)
+    api_id, uuid_field = Todo._meta.get_field("api_id"), Todo._meta.get_field("uuid")
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor._remake_table(
+            Todo, alter_fields=[(api_id, old_api_id), (uuid_field, old_uuid)]
+        )
+        return
+    schema_editor.alter_field(Todo, api_id, old_api_id)
+    schema_editor.alter_field(Todo, uuid_field, old_uuid)
+
+
+# Make the upstream `api_id` the primary key. Random UUIDs scatter inserts
+# across the whole primary key index and make it (and any foreign key pointing
+# at it) four times as wide as the integer; `api_id` is already unique and
+# arrives in order, so it replaces the UUID key without adding an index.
+# `uuid` stays unique so public ids and the toggle endpoints are unchanged.
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0005_todocounter_version"),
+    ]
+
+    operations = [
+        # `api_id` becomes a primary key before `uuid` stops being one, so the
+        # model state never lacks a primary key in between.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="todo",
+                    name="api_id",
+                    field=models.IntegerField(primary_key=True, serialize=False),
+                ),
+                migrations.AlterField(
+                    model_name="todo",
+                    name="uuid",
+                    field=models.UUIDField(
+                        default=uuid.uuid4, editable=False, unique=True
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(swap_primary_key, restore_uuid_primary_key),
+    ]
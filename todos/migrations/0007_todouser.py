@@ -0,0 +1,111 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Min
+
+# Avatar for users whose stored image is not a number.
+DEFAULT_AVATAR = 1
+
+
+def create_users(apps, schema_editor):
+    """
+    Create one TodoUser per distinct `user_id`, keeping the image their todos
+    already showed.
+    """
+    Todo = apps.get_model("todos", "Todo")
+    TodoUser = apps.get_model("todos", "TodoUser")
+    images = (
+        Todo.objects.values("user_id")
+        .annotate(image=Min("image"))
+        .values_list("user_id", "image")
+    )
+    TodoUser.objects.bulk_create(
+        [
+            TodoUser(
+                id=user_id,
+                avatar=int(image) if image.isdigit() else DEFAULT_AVATAR,
+            )
+            for user_id, image in images.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+def restore_images(apps, schema_editor):
+    """
+    Copy each user's avatar back onto their todos' `image` column.
+    """
+    Todo = apps.get_model("todos", "Todo")
+    TodoUser = apps.get_model("todos", "TodoUser")
+    for user_id, avatar in TodoUser.objects.values_list("id", "avatar").iterator():
+        Todo.objects.filter(user_id=user_id).update(image=str(avatar))
+
+
+# Move the per-row avatar onto a per-user table. `Todo.user_id` keeps its
+# column and values and becomes a foreign key to the new table.
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0006_todo_api_id_primary_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TodoUser",
+            fields=[
+                ("id", models.IntegerField(primary_key=True, serialize=False)),
+                ("avatar", models.PositiveSmallIntegerField()),
+            ],
+        ),
+        migrations.RunPython(create_users, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name="todo",
+            name="todo_user_api_id_idx",
+        ),
+        migrations.SeparateDatabaseAndState(
+            # Only the constraint is new; the column stays as it is.
+            database_operations=[
+                migrations.AlterField(
+                    model_name="todo",
+                    name="user_id",
+                    field=models.ForeignKey(
+                        db_column="user_id",
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="todos.todouser",
+                    ),
+                ),
+            ],
+            state_operations=[
+                migrations.RemoveField(
+                    model_name="todo",
+                    name="user_id",
+                ),
+                migrations.AddField(
+                    model_name="todo",
+                    name="user",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="todos",
+                        to="todos.todouser",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(fields=["user", "api_id"], name="todo_user_api_id_idx"),
+        ),
+        # Nullable first, so that when reversing the column comes back empty
+        # and is filled by `restore_images` before it is NOT NULL again.
+        migrations.AlterField(
+            model_name="todo",
+            name="image",
+            field=models.TextField(null=True),
+        ),
+        migrations.RunPython(migrations.RunPython.noop, restore_images),
+        migrations.RemoveField(
+            model_name="todo",
+            name="image",
+        ),
+    ]
@@ -0,0 +1,55 @@
+from django.db import migrations
+from django.db.utils import DatabaseError
+
+INDEX_NAME = "todo_title_trgm_idx"
+
+
+def create_trigram_index(apps, schema_editor):
+    """
+    Index `UPPER(title)` with trigrams, the expression `title__icontains`
+    compiles to on PostgreSQL, so `?q=` substring searches avoid a full scan.
+
+    Skipped on other backends, and on PostgreSQL servers where the pg_trgm
+    extension is not available or cannot be enabled; searches then still
+    work, by scanning. After installing the extension, re-run this
+    migration (`migrate todos 0007 && migrate todos`).
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = schema_editor.quote_name(apps.get_model("todos", "Todo")._meta.db_table)
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+        try:
+            cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except DatabaseError:
+            # Creating an extension needs extra privileges.
+            return
+        # CONCURRENTLY keeps the table writable while a large index builds.
+        cursor.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX_NAME} "
+            f'ON {table} USING gin ((UPPER("title"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX_NAME}")
+
+
+# The index lives outside the model state: its operator class and extension
+# are PostgreSQL-only.
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("todos", "0007_todouser"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
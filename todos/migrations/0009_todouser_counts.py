@@ -0,0 +1,54 @@
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def count_todos(apps, schema_editor):
+    """
+    Fill the new per-user counts with one GROUP BY over the existing todos.
+    """
+    Todo = apps.get_model("todos", "Todo")
+    TodoUser = apps.get_model("todos", "TodoUser")
+    counts = (
+        Todo.objects.values("user_id")
+        .annotate(total=Count("pk"), completed=Count("pk", filter=Q(completed=True)))
+        .values_list("user_id", "total", "completed")
+        .order_by()
+    )
+    TodoUser.objects.bulk_update(
+        [
+            TodoUser(id=user_id, total=total, completed=completed)
+            for user_id, total, completed in counts.iterator()
+        ],
+        ["total", "completed"],
+        batch_size=1000,
+    )
+
+
+# Maintained per-user counts for the user summary page, and the index behind
+# `?user=` pages filtered by completion.
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("todos", "0008_todo_title_trigram_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="todouser",
+            name="total",
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="todouser",
+            name="completed",
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="todo",
+            index=models.Index(
+                fields=["user", "completed", "api_id"],
+                name="todo_user_completed_api_id_idx",
+            ),
+        ),
+        migrations.RunPython(count_todos, migrations.RunPython.noop),
+    ]
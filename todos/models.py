@@ -1,19 +1,409 @@
 import uuid
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
 
-from django.db import models
+from asgiref.sync import sync_to_async
+from django.db import connection, models, transaction
+from django.db.models import Case, Count, F, Q, Value, When
+from django.utils import timezone
+
+
+class TodoUser(models.Model):
+    """
+    An upstream user and the avatar shown next to their todos.
+
+    The primary key is the upstream `userId`, so `Todo.user_id` keeps the
+    value it had before users got a table of their own. The avatar is stored
+    once per user as the number of an image in `static/images`, instead of
+    being copied onto every todo.
+
+    `total` and `completed` are maintained per user like the global
+    `TodoCounter`: every write path adjusts them in the same transaction as
+    the change (see `adjust_counts`), so a summary of all users reads one row
+    per user instead of grouping the whole Todo table.
+    """
+
+    id = models.IntegerField(primary_key=True)
+    avatar = models.PositiveSmallIntegerField()
+    total = models.BigIntegerField(default=0)
+    completed = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return f"User {self.id} (avatar {self.avatar})"
+
+    @property
+    def uncompleted(self) -> int:
+        return self.total - self.completed
+
+    @classmethod
+    def adjust_counts(cls, deltas: Dict[int, Tuple[int, int]]) -> None:
+        """
+        Apply `(total, completed)` deltas to many users with one UPDATE.
+
+        Like `TodoCounter.adjust`, the deltas are added inside the database,
+        so concurrent writers never overwrite each other's counts. Call it
+        before `TodoCounter.adjust`: every write path locks the user rows
+        before the counter row, so concurrent writers cannot deadlock.
+
+        Args:
+            deltas (Dict[int, Tuple[int, int]]): Deltas per user id. Users
+                whose deltas are both zero are not written.
+        """
+        deltas = {user_id: delta for user_id, delta in deltas.items() if any(delta)}
+        if not deltas:
+            return
+
+        updates = {}
+        for position, name in enumerate(("total", "completed")):
+            if not any(delta[position] for delta in deltas.values()):
+                continue
+            if len(deltas) == 1:
+                # The common single-user case (toggles, single-row saves)
+                # skips the CASE, which is costly to compile.
+                (delta,) = deltas.values()
+                updates[name] = F(name) + delta[position]
+            else:
+                updates[name] = F(name) + Case(
+                    *(
+                        When(id=user_id, then=Value(delta[position]))
+                        for user_id, delta in deltas.items()
+                    ),
+                    default=Value(0),
+                    output_field=models.BigIntegerField(),
+                )
+        cls.objects.filter(id__in=list(deltas)).update(**updates)
+
+    @classmethod
+    def rebuild_counts(cls) -> int:
+        """
+        Recount the todos of every user in one GROUP BY and store the result.
+
+        Returns:
+            int: The number of users whose stored counts were wrong.
+        """
+        counts = {
+            user_id: (total, completed)
+            for user_id, total, completed in Todo.objects.values("user_id")
+            .annotate(
+                total=Count("pk"), completed=Count("pk", filter=Q(completed=True))
+            )
+            .values_list("user_id", "total", "completed")
+            .order_by()
+        }
+        drifted = []
+        for user in cls.objects.only("id", "total", "completed").iterator():
+            expected = counts.get(user.id, (0, 0))
+            if (user.total, user.completed) != expected:
+                user.total, user.completed = expected
+                drifted.append(user)
+        cls.objects.bulk_update(drifted, ["total", "completed"], batch_size=1000)
+        return len(drifted)
 
 
 class Todo(models.Model):
-    uuid = models.UUIDField(
-        default=uuid.uuid4, editable=False, unique=True, primary_key=True
+    # The primary key is the upstream `api_id` (a compact integer that arrives
+    # in order, so inserts append to its index); `uuid` stays the public
+    # identifier used in URLs, templates and the toggle endpoints.
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    api_id = models.IntegerField(primary_key=True)
+    # The user indexes lead with `user_id`, so no separate FK index.
+    user = models.ForeignKey(
+        TodoUser, on_delete=models.CASCADE, related_name="todos", db_index=False
     )
-    api_id = models.IntegerField(unique=True)
-    user_id = models.IntegerField()
     title = models.CharField(max_length=200)
-    image = models.TextField()
     completed = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Seek/sort path for the `?filter=todo` and `?filter=complete` pages.
+            models.Index(
+                fields=["completed", "api_id"], name="todo_completed_api_id_idx"
+            ),
+            # Smaller per-state variants; used where partial indexes are supported.
+            models.Index(
+                fields=["api_id"],
+                condition=models.Q(completed=True),
+                name="todo_complete_api_id_idx",
+            ),
+            models.Index(
+                fields=["api_id"],
+                condition=models.Q(completed=False),
+                name="todo_pending_api_id_idx",
+            ),
+            # Seek/sort paths for `?user=`: all of a user's todos, and one
+            # user's todos in one state.
+            models.Index(fields=["user", "api_id"], name="todo_user_api_id_idx"),
+            models.Index(
+                fields=["user", "completed", "api_id"],
+                name="todo_user_completed_api_id_idx",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.title} (ID: {self.api_id}) - (USER: {self.user_id})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the persisted completion state and user so the counter
+        signals can tell whether a later `save()` actually changed them.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_completed = instance.__dict__.get("completed")
+        instance._loaded_user_id = instance.__dict__.get("user_id")
+        return instance
+
+    @classmethod
+    def toggle_completed(cls, todo_id: Any) -> Optional[bool]:
+        """
+        Flip the `completed` flag of one Todo in a single conditional UPDATE.
+
+        The flag is negated inside the database, so concurrent toggles of the
+        same row serialise on its row lock instead of racing on a
+        read-modify-write. Only `completed` and `updated_at` are written, and
+        the maintained counters (global and the todo's user) are adjusted in
+        the same transaction.
+
+        On PostgreSQL the new value comes back through `UPDATE ... RETURNING`
+        and the user's count is adjusted in the same round trip; other
+        backends re-read the row inside the transaction, while the UPDATE
+        still holds the row lock.
+
+        Args:
+            todo_id (Any): The UUID (or its string form) of the Todo.
+
+        Returns:
+            Optional[bool]: The new completion state, or None if no Todo matched.
+
+        Raises:
+            ValidationError: If `todo_id` is not a valid UUID.
+        """
+        pk = cls._meta.get_field("uuid").to_python(todo_id)
+        now = timezone.now()
+
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                qn = connection.ops.quote_name
+                users = qn(TodoUser._meta.db_table)
+                with connection.cursor() as cursor:
+                    # The user's count moves in the same statement, through a
+                    # data-modifying CTE.
+                    cursor.execute(
+                        f"WITH toggled AS ("
+                        f"UPDATE {qn(cls._meta.db_table)} "
+                        f"SET {qn('completed')} = NOT {qn('completed')}, "
+                        f"{qn('updated_at')} = %s "
+                        f"WHERE {qn('uuid')} = %s "
+                        f"RETURNING {qn('completed')}, {qn('user_id')}), "
+                        f"counted AS ("
+                        f"UPDATE {users} "
+                        f"SET {qn('completed')} = {users}.{qn('completed')} "
+                        f"+ CASE WHEN toggled.{qn('completed')} THEN 1 ELSE -1 END "
+                        f"FROM toggled "
+                        f"WHERE {users}.{qn('id')} = toggled.{qn('user_id')}) "
+                        f"SELECT {qn('completed')} FROM toggled",
+                        [now, pk],
+                    )
+                    row = cursor.fetchone()
+                completed = None if row is None else row[0]
+            else:
+                updated = cls.objects.filter(uuid=pk).update(
+                    completed=Case(
+                        When(completed=True, then=Value(False)), default=Value(True)
+                    ),
+                    updated_at=now,
+                )
+                row = (
+                    cls.objects.filter(uuid=pk)
+                    .values_list("completed", "user_id")
+                    .get()
+                    if updated
+                    else None
+                )
+                completed = None
+                if row is not None:
+                    completed, user_id = row
+                    TodoUser.adjust_counts({user_id: (0, 1 if completed else -1)})
+
+            if completed is not None:
+                TodoCounter.adjust(completed=1 if completed else -1)
+        return completed
+
+    @classmethod
+    async def atoggle_completed(cls, todo_id: Any) -> Optional[bool]:
+        """
+        Async version of `toggle_completed`.
+
+        The toggle needs a transaction, which the async ORM does not provide,
+        so it runs in the request's thread-sensitive executor.
+        """
+        return await sync_to_async(cls.toggle_completed)(todo_id)
+
+    @classmethod
+    def set_completed_many(
+        cls, targets: Dict[UUID, Optional[bool]]
+    ) -> Dict[UUID, bool]:
+        """
+        Apply many completion changes with a bounded number of statements.
+
+        In one transaction the matching rows are locked and read with a single
+        SELECT, toggle requests are resolved against the locked values, and
+        the changes are written with at most two set-based UPDATEs (one per
+        target state). Rows already in their target state are not written.
+
+        Args:
+            targets (Dict[UUID, Optional[bool]]): Target state per Todo
+                UUID; None means "toggle".
+
+        Returns:
+            Dict[UUID, bool]: The resulting state of every Todo that
+            exists. UUIDs that matched no row are omitted.
+        """
+        if not targets:
+            return {}
+
+        with transaction.atomic():
+            # Locked in primary key order, so overlapping batches cannot
+            # deadlock on each other's rows.
+            rows = (
+                cls.objects.select_for_update()
+                .filter(uuid__in=list(targets))
+                .order_by("pk")
+                .values_list("uuid", "completed", "user_id")
+            )
+            current = {}
+            users = {}
+            for pk, completed, user_id in rows:
+                current[pk] = completed
+                users[pk] = user_id
+            final = {
+                pk: (not current[pk] if target is None else target)
+                for pk, target in targets.items()
+                if pk in current
+            }
+            to_complete = [
+                pk for pk, state in final.items() if state and not current[pk]
+            ]
+            to_reopen = [pk for pk, state in final.items() if not state and current[pk]]
+
+            now = timezone.now()
+            if to_complete:
+                cls.objects.filter(uuid__in=to_complete).update(
+                    completed=True, updated_at=now
+                )
+            if to_reopen:
+                cls.objects.filter(uuid__in=to_reopen).update(
+                    completed=False, updated_at=now
+                )
+            if to_complete or to_reopen:
+                user_deltas: Dict[int, int] = {}
+                for pk in to_complete:
+                    user_deltas[users[pk]] = user_deltas.get(users[pk], 0) + 1
+                for pk in to_reopen:
+                    user_deltas[users[pk]] = user_deltas.get(users[pk], 0) - 1
+                TodoUser.adjust_counts(
+                    {user_id: (0, delta) for user_id, delta in user_deltas.items()}
+                )
+                TodoCounter.adjust(completed=len(to_complete) - len(to_reopen))
+        return final
+
+
+class TodoCounter(models.Model):
+    """
+    Maintained totals for the Todo table.
+
+    A single row (scope `"all"`) holds the total and completed counts so the
+    list view can read every counter with one primary key lookup instead of
+    running `COUNT(*)` over the whole table. Every write path adjusts it in the
+    same transaction as the change; `reconcile_todo_counters` repairs drift.
+
+    `version` and `updated_at` move on every adjustment, including zero-delta
+    ones for edits that do not change the counts, so together they serve as a
+    cheap validator for conditional GETs of the list page.
+    """
+
+    GLOBAL_SCOPE = "all"
+
+    scope = models.CharField(max_length=32, primary_key=True)
+    total = models.BigIntegerField(default=0)
+    completed = models.BigIntegerField(default=0)
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.scope}: {self.completed}/{self.total} completed"
+
+    @property
+    def uncompleted(self) -> int:
+        return self.total - self.completed
+
+    @classmethod
+    def snapshot(cls) -> "TodoCounter":
+        """
+        Return the global counter row, building it from the table if missing.
+        """
+        counter = cls.objects.filter(scope=cls.GLOBAL_SCOPE).first()
+        if counter is None:
+            counter = cls.rebuild()
+        return counter
+
+    @classmethod
+    async def asnapshot(cls) -> "TodoCounter":
+        """
+        Async version of `snapshot`.
+        """
+        counter = await cls.objects.filter(scope=cls.GLOBAL_SCOPE).afirst()
+        if counter is None:
+            counter = await sync_to_async(cls.rebuild)()
+        return counter
+
+    @classmethod
+    def adjust(cls, total: int = 0, completed: int = 0) -> None:
+        """
+        Apply deltas to the global counter with a single atomic UPDATE.
+
+        Always bumps `version`, so call it with no deltas to record an edit
+        that changes no counts. If the row does not exist yet it is rebuilt
+        from the table, which already includes the write that triggered the
+        adjustment.
+        """
+        updated = cls.objects.filter(scope=cls.GLOBAL_SCOPE).update(
+            total=F("total") + total,
+            completed=F("completed") + completed,
+            version=F("version") + 1,
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            cls.rebuild()
+
+    @classmethod
+    def rebuild(cls) -> "TodoCounter":
+        """
+        Recount the Todo table in one aggregate query and store the result.
+        """
+        counts = Todo.objects.aggregate(
+            total=Count("pk"), completed=Count("pk", filter=Q(completed=True))
+        )
+        counter, _ = cls.objects.update_or_create(
+            scope=cls.GLOBAL_SCOPE, defaults=counts
+        )
+        return counter
+
+
+class SyncState(models.Model):
+    """
+    Bookkeeping for incremental syncs from an upstream todo source.
+
+    Stores the HTTP validators of the last successful fetch so the next sync
+    can send a conditional request and skip all work on a 304.
+    """
+
+    source = models.URLField(max_length=500, unique=True)
+    etag = models.CharField(max_length=255, blank=True, default="")
+    last_modified = models.CharField(max_length=64, blank=True, default="")
+    synced_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.source} (synced at {self.synced_at})"
@@ -0,0 +1,72 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from todos.models import Todo, TodoCounter, TodoUser
+
+
+@receiver(post_save, sender=Todo)
+def update_counters_on_save(
+    sender: type, instance: Todo, created: bool, **kwargs: Any
+) -> None:
+    """
+    Keep the maintained counters in step with single-row saves.
+
+    Every update touches the counter, even when `completed` is unchanged, so
+    its version reflects edits such as a new title.
+
+    The per-user counts follow creates, completion changes and moves of a
+    todo to another user.
+
+    Bulk writes (`bulk_create`, `QuerySet.update`) do not send signals and
+    adjust the counters themselves.
+    """
+    completed = int(instance.completed)
+    # User rows are locked before the counter row, as on every write path.
+    if created:
+        TodoUser.adjust_counts({instance.user_id: (1, completed)})
+        TodoCounter.adjust(total=1, completed=completed)
+    else:
+        previous = getattr(instance, "_loaded_completed", None)
+        previous_user_id = getattr(instance, "_loaded_user_id", None)
+        if previous is not None and previous_user_id is not None:
+            if previous_user_id != instance.user_id:
+                TodoUser.adjust_counts(
+                    {
+                        previous_user_id: (-1, -int(previous)),
+                        instance.user_id: (1, completed),
+                    }
+                )
+            else:
+                TodoUser.adjust_counts(
+                    {instance.user_id: (0, completed - int(previous))}
+                )
+        if previous is not None and previous != instance.completed:
+            TodoCounter.adjust(completed=1 if instance.completed else -1)
+        else:
+            TodoCounter.adjust()
+    instance._loaded_completed = instance.completed
+    instance._loaded_user_id = instance.user_id
+
+
+@receiver(post_delete, sender=Todo)
+def update_counters_on_delete(sender: type, instance: Todo, **kwargs: Any) -> None:
+    """
+    Remove a deleted Todo from the maintained counters.
+    """
+    TodoUser.adjust_counts({instance.user_id: (-1, -int(instance.completed))})
+    TodoCounter.adjust(total=-1, completed=-int(instance.completed))
+
+
+@receiver(post_save, sender=TodoUser)
+def touch_counters_on_user_save(
+    sender: type, instance: TodoUser, **kwargs: Any
+) -> None:
+    """
+    Move the counter version when a user changes, e.g. gets a new avatar.
+
+    Rendered list pages show the avatar, so their validators and page cache
+    keys (both built from the version) must change with it.
+    """
+    TodoCounter.adjust()
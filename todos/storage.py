@@ -0,0 +1,23 @@
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class TodoStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    Content-hashed, precompressed static files.
+
+    `collectstatic` writes `name.<hash>.ext` copies plus gzip (and, with
+    `brotli` installed, brotli) variants and a manifest; templates resolve
+    `{% static %}` through the manifest, and WhiteNoise serves the hashed
+    names with far-future immutable caching.
+
+    Before `collectstatic` has run (tests, a fresh checkout), names missing
+    from the manifest resolve to their unhashed path instead of raising.
+    """
+
+    manifest_strict = False
+
+    def stored_name(self, name: str) -> str:
+        try:
+            return super().stored_name(name)
+        except ValueError:
+            return name
@@ -0,0 +1,17 @@
+from typing import Iterable
+
+from django import template
+from django.utils.safestring import SafeString
+
+from todos.helpers import render_todo_rows
+from todos.models import Todo
+
+register = template.Library()
+
+
+@register.simple_tag
+def todo_rows(todos: Iterable[Todo]) -> SafeString:
+    """
+    Render the task rows, reusing cached HTML for unchanged todos.
+    """
+    return render_todo_rows(todos)
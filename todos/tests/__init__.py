@@ -1,3 +1,67 @@
 import logging
+from typing import Any
 
 logging.disable(logging.CRITICAL)
+
+
+class TodoUsersMixin:
+    """
+    Create the users that the todos built by a test case point at.
+
+    Tests use `user_id` values 0-4; every user gets `TEST_AVATAR`.
+    """
+
+    TEST_AVATAR = 3
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        from todos.models import TodoUser
+
+        TodoUser.objects.bulk_create(
+            [TodoUser(id=user_id, avatar=cls.TEST_AVATAR) for user_id in range(5)]
+        )
+
+
+class QueryBudgetMixin:
+    """
+    Assert that requests stay within their view's declared query budget.
+
+    Budgets are declared with `todos.instrumentation.query_budget` or a
+    `query_budget` class attribute. Savepoints are not counted: a test case
+    runs inside a transaction, so `atomic()` blocks issue them here but not
+    in production.
+    """
+
+    def assertWithinQueryBudget(
+        self, path: str, data: Any = None, method: str = "get", **extra: Any
+    ) -> Any:
+        """
+        Request `path` with the test client and return the response.
+
+        Fails if the resolved view declares no budget or if the request
+        issues more queries than the budget, listing the queries.
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from django.urls import resolve
+
+        from todos.instrumentation import get_query_budget
+
+        view = resolve(path).func
+        budget = get_query_budget(view)
+        if budget is None:
+            self.fail(f"{view.__name__} declares no query budget")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = getattr(self.client, method)(path, data, **extra)
+        queries = [
+            q["sql"] for q in ctx.captured_queries if "SAVEPOINT" not in q["sql"]
+        ]
+        if len(queries) > budget:
+            self.fail(
+                f"{method.upper()} {path} issued {len(queries)} queries, "
+                f"over its budget of {budget}:\n"
+                + "\n".join(f"{n}. {sql}" for n, sql in enumerate(queries, 1))
+            )
+        return response
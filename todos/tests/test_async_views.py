@@ -0,0 +1,267 @@
+import asyncio
+import json
+from unittest.mock import Mock, patch
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from todos.helpers import (
+    AsyncUpstreamClient,
+    aget_external_todo_data,
+    get_async_upstream_client,
+    render_todo_rows,
+)
+from todos.models import Todo, TodoCounter, TodoUser
+from todos.tests import TodoUsersMixin
+from todos.views import (
+    AsyncTodoFragmentView,
+    AsyncTodoListView,
+    TodoListView,
+    atoggle_todo_completion,
+)
+
+FEED = [
+    {"userId": 1, "id": 1, "title": "Todo 1", "completed": False},
+    {"userId": 1, "id": 2, "title": "Todo 2", "completed": True},
+    {"userId": 2, "id": 3, "title": "Todo 3", "completed": False},
+]
+
+
+def mock_transport(responses):
+    """
+    Serve the given `httpx.Response`s (or raise the given exceptions) in order.
+    """
+    queue = list(responses)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        item = queue.pop(0)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    return httpx.MockTransport(handler), requests
+
+
+class AsyncTodoListViewTests(TodoUsersMixin, TestCase):
+    """Test suite for the async list and fragment views."""
+
+    def setUp(self) -> None:
+        self.factory = AsyncRequestFactory()
+        for i in range(25):
+            Todo.objects.create(
+                api_id=i, title=f"Todo {i}", completed=i % 2 == 0, user_id=1
+            )
+
+    async def test_matches_sync_view_context(self) -> None:
+        """
+        The async view renders the same page and counters as the sync one.
+        """
+        request = self.factory.get("/", {"filter": "todo"})
+        response = await AsyncTodoListView.as_view()(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["X-Cache"], "MISS")
+        self.assertIn("ETag", response.headers)
+        self.assertContains(response, 'class="task"', count=12)
+        self.assertEqual(response.context_data["total_todos"], 25)
+        self.assertEqual(response.context_data["uncompleted_todos"], 12)
+
+        sync_request = self.factory.get("/", {"filter": "todo"})
+        sync_response = await sync_to_async(TodoListView.as_view())(sync_request)
+        self.assertEqual(response.headers["ETag"], sync_response.headers["ETag"])
+
+    async def test_user_filter_reads_the_users_counts(self) -> None:
+        await Todo.objects.acreate(api_id=25, title="Todo 25", user_id=2)
+
+        response = await AsyncTodoListView.as_view()(self.factory.get("/", {"user": 2}))
+
+        self.assertEqual([todo.api_id for todo in response.context_data["todos"]], [25])
+        self.assertEqual(response.context_data["total_todos"], 1)
+        self.assertEqual(response.context_data["uncompleted_todos"], 1)
+
+    async def test_follows_cursor(self) -> None:
+        first = await AsyncTodoListView.as_view()(self.factory.get("/"))
+        cursor = first.context_data["next_cursor"]
+
+        response = await AsyncTodoFragmentView.as_view()(
+            self.factory.get("/todos/more/", {"after": cursor})
+        )
+        api_ids = [todo.api_id for todo in response.context_data["todos"]]
+        self.assertEqual(api_ids, list(range(20, 25)))
+        self.assertNotIn("total_todos", response.context_data)
+
+    async def test_renders_rows_off_the_event_loop(self) -> None:
+        """
+        Rendering reads the blocking row cache, so cursor pages render in a
+        worker thread rather than on the event loop.
+        """
+        loops = []
+
+        def spy(todos):
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return render_todo_rows(todos)
+
+        with patch("todos.templatetags.todo_tags.render_todo_rows", spy):
+            await AsyncTodoListView.as_view()(self.factory.get("/"))
+            await AsyncTodoFragmentView.as_view()(self.factory.get("/todos/more/"))
+
+        self.assertEqual(loops, [None, None])
+
+    async def test_legacy_page_number(self) -> None:
+        response = await AsyncTodoListView.as_view()(self.factory.get("/", {"page": 2}))
+        self.assertEqual(len(response.context_data["todos"]), 5)
+
+    async def test_conditional_get(self) -> None:
+        first = await AsyncTodoListView.as_view()(self.factory.get("/"))
+
+        response = await AsyncTodoListView.as_view()(
+            self.factory.get("/", headers={"If-None-Match": first.headers["ETag"]})
+        )
+        self.assertEqual(response.status_code, 304)
+
+    @patch("todos.views.aget_external_todo_data")
+    async def test_seeds_empty_table(self, mock_aget_external) -> None:
+        await Todo.objects.all().adelete()
+
+        response = await AsyncTodoListView.as_view()(self.factory.get("/"))
+
+        self.assertEqual(response.status_code, 200)
+        mock_aget_external.assert_awaited_once()
+        self.assertFalse(response.context_data["warming_up"])
+
+
+class AsyncToggleTodoCompletionTests(TodoUsersMixin, TestCase):
+    """Test suite for the async toggle endpoint."""
+
+    def setUp(self) -> None:
+        self.factory = AsyncRequestFactory()
+        self.todo = Todo.objects.create(
+            api_id=1, title="Todo", completed=False, user_id=1
+        )
+
+    def post(self, payload):
+        return self.factory.post(
+            reverse("toggle_todo"),
+            data=json.dumps(payload),
+            content_type="application/json",
+        )
+
+    async def test_toggles_and_updates_counters(self) -> None:
+        response = await atoggle_todo_completion(
+            self.post({"todo_id": str(self.todo.uuid)})
+        )
+
+        self.assertEqual(
+            json.loads(response.content), {"success": True, "completed": True}
+        )
+        counter = await TodoCounter.asnapshot()
+        self.assertEqual(counter.completed, 1)
+
+    async def test_errors(self) -> None:
+        missing = await atoggle_todo_completion(self.post({}))
+        self.assertEqual(missing.status_code, 400)
+
+        not_found = await atoggle_todo_completion(
+            self.post({"todo_id": "00000000-0000-0000-0000-000000000000"})
+        )
+        self.assertEqual(not_found.status_code, 404)
+
+        get = await atoggle_todo_completion(self.factory.get(reverse("toggle_todo")))
+        self.assertEqual(get.status_code, 405)
+
+
+@override_settings(UPSTREAM_CONNECT_TIMEOUT=1, UPSTREAM_READ_TIMEOUT=1)
+class AsyncUpstreamClientTests(TestCase):
+    """Test suite for the async upstream client and async ingestion."""
+
+    def make_client(self, responses, retries=2) -> AsyncUpstreamClient:
+        client = AsyncUpstreamClient(retries=retries, backoff_factor=0)
+        transport, self.requests = mock_transport(responses)
+        client.client = httpx.AsyncClient(transport=transport)
+        return client
+
+    async def test_retries_on_forcelist_status(self) -> None:
+        client = self.make_client([httpx.Response(503), httpx.Response(200, json=FEED)])
+
+        response = await client.get("http://upstream/todos")
+
+        self.assertEqual(response.json(), FEED)
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_retries_on_transport_error_then_gives_up(self) -> None:
+        client = self.make_client([httpx.ConnectError("down")] * 3, retries=2)
+
+        with self.assertRaises(httpx.ConnectError):
+            await client.get("http://upstream/todos")
+        self.assertEqual(len(self.requests), 3)
+
+    async def test_client_error_is_not_retried(self) -> None:
+        client = self.make_client([httpx.Response(404)])
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await client.get("http://upstream/todos")
+        self.assertEqual(len(self.requests), 1)
+
+    async def test_shared_client_per_event_loop(self) -> None:
+        self.assertIs(get_async_upstream_client(), get_async_upstream_client())
+        self.assertIsNot(get_async_upstream_client(), get_async_upstream_client(5))
+
+    def test_clients_are_closed_with_their_event_loop(self) -> None:
+        async def get_clients():
+            return get_async_upstream_client(), get_async_upstream_client(5)
+
+        clients = asyncio.run(get_clients())
+
+        self.assertTrue(all(client.client.is_closed for client in clients))
+
+    @patch("todos.helpers.todo_list_view_helper.config", return_value="http://x")
+    @patch("todos.helpers.todo_list_view_helper.get_async_upstream_client")
+    async def test_aget_external_todo_data(self, mock_get_client, mock_config) -> None:
+        mock_get_client.return_value = self.make_client(
+            [httpx.Response(500), httpx.Response(200, json=FEED)]
+        )
+
+        result = await aget_external_todo_data(batch_size=2)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(await Todo.objects.acount(), 3)
+        counter = await TodoCounter.asnapshot()
+        self.assertEqual((counter.total, counter.completed), (3, 1))
+        self.assertEqual(await TodoUser.objects.acount(), 2)
+
+    @override_settings(TODO_API_PAGINATION="page", TODO_API_PAGE_SIZE=2)
+    @patch("todos.helpers.todo_list_view_helper.config", return_value="http://x")
+    @patch("todos.helpers.paged_fetch.get_upstream_client")
+    async def test_aget_external_todo_data_reads_every_page(
+        self, mock_get_client, mock_config
+    ) -> None:
+        def get(url, params, **kwargs):
+            start = (params["page"] - 1) * params["limit"]
+            page = FEED[start : start + params["limit"]]
+            return Mock(status_code=200, json=Mock(return_value=page))
+
+        mock_get_client.return_value.get.side_effect = get
+
+        result = await aget_external_todo_data(batch_size=2)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(await Todo.objects.acount(), 3)
+        counter = await TodoCounter.asnapshot()
+        self.assertEqual((counter.total, counter.completed), (3, 1))
+
+    @patch("todos.helpers.todo_list_view_helper.config", return_value="http://x")
+    @patch("todos.helpers.todo_list_view_helper.get_async_upstream_client")
+    async def test_aget_external_todo_data_handles_errors(
+        self, mock_get_client, mock_config
+    ) -> None:
+        mock_get_client.return_value = self.make_client([httpx.Response(404)])
+
+        self.assertIsNone(await aget_external_todo_data())
+        self.assertEqual(await Todo.objects.acount(), 0)
@@ -0,0 +1,170 @@
+import json
+import logging
+import re
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from todos.helpers import encode_cursor
+from todos.helpers.upstream_client import UpstreamClient
+from todos.instrumentation import (
+    current_metrics,
+    get_query_budget,
+    query_budget,
+    record_request,
+    track,
+    track_iter,
+)
+from todos.models import Todo
+from todos.tests import QueryBudgetMixin, TodoUsersMixin
+from todos.views import TodoFragmentView, TodoListView, toggle_todo_completion
+
+
+class InstrumentationHelperTests(SimpleTestCase):
+    """Test suite for the request metrics primitives."""
+
+    def test_track_is_a_no_op_outside_a_request(self) -> None:
+        with track("upstream"):
+            pass
+        self.assertIsNone(current_metrics.get())
+
+    def test_track_and_track_iter_add_up_per_name(self) -> None:
+        with record_request() as metrics:
+            with track("render"):
+                pass
+            with track("render"):
+                pass
+            self.assertEqual(list(track_iter([b"a", b"b"], "upstream")), [b"a", b"b"])
+        self.assertIsNone(current_metrics.get())
+        self.assertEqual(set(metrics.timings), {"render", "upstream"})
+
+    def test_upstream_client_reports_upstream_time(self) -> None:
+        client = UpstreamClient()
+        with patch.object(client.session, "get", return_value=MagicMock()):
+            with record_request() as metrics:
+                client.get("http://upstream.invalid/todos")
+        self.assertIn("upstream", metrics.timings)
+
+    def test_query_budget_survives_view_decorators(self) -> None:
+        @query_budget(5)
+        def view(request):
+            pass
+
+        self.assertEqual(get_query_budget(view), 5)
+        self.assertEqual(get_query_budget(toggle_todo_completion), 4)
+        self.assertEqual(get_query_budget(TodoListView.as_view()), 4)
+        self.assertIsNone(get_query_budget(lambda request: None))
+
+
+class RequestTimingMiddlewareTests(TodoUsersMixin, TestCase):
+    """Test suite for the opt-in RequestTimingMiddleware."""
+
+    def setUp(self) -> None:
+        for i in range(3):
+            Todo.objects.create(api_id=i, title=f"Todo {i}", user_id=1)
+        # The test package silences logging; the log line is asserted here.
+        logging.disable(logging.NOTSET)
+        self.addCleanup(logging.disable, logging.CRITICAL)
+
+    def test_disabled_by_default(self) -> None:
+        response = self.client.get(reverse("todo_list"))
+        self.assertNotIn("Server-Timing", response.headers)
+
+    @override_settings(REQUEST_TIMING=True)
+    def test_server_timing_header_and_log_line(self) -> None:
+        with self.assertLogs("todos.timing", "INFO") as logs:
+            response = self.client.get(reverse("todo_list"), {"page": 1})
+
+        header = response.headers["Server-Timing"]
+        queries = int(re.search(r'db;dur=[\d.]+;desc="(\d+) quer', header)[1])
+        self.assertGreater(queries, 0)
+        self.assertRegex(header, r"render;dur=[\d.]+")
+        self.assertRegex(header, r"total;dur=[\d.]+$")
+
+        (record,) = logs.records
+        self.assertEqual(record.levelno, logging.INFO)
+        self.assertEqual(record.timing["path"], "/")
+        self.assertEqual(record.timing["status"], 200)
+        self.assertEqual(record.timing["queries"], queries)
+        self.assertEqual(record.timing["budget"], TodoListView.query_budget)
+        self.assertIn("render_ms", record.timing)
+        self.assertIn(f"queries={queries} ", record.getMessage())
+
+    @override_settings(REQUEST_TIMING=True)
+    def test_request_over_budget_logs_a_warning(self) -> None:
+        with patch.object(TodoFragmentView, "query_budget", 0):
+            with self.assertLogs("todos.timing", "WARNING") as logs:
+                self.client.get(reverse("todo_fragment"))
+
+        self.assertIn("over query budget", logs.output[0])
+
+    @override_settings(REQUEST_TIMING=True)
+    def test_page_cache_hit_skips_render(self) -> None:
+        url = reverse("todo_list")
+        with self.assertLogs("todos.timing", "INFO"):
+            self.client.get(url)
+            response = self.client.get(url)
+
+        self.assertEqual(response.headers["X-Cache"], "HIT")
+        self.assertNotIn("render;", response.headers["Server-Timing"])
+
+
+class QueryBudgetTests(QueryBudgetMixin, TodoUsersMixin, TestCase):
+    """Keep the views within the query budgets they declare."""
+
+    def setUp(self) -> None:
+        for i in range(30):
+            Todo.objects.create(
+                api_id=i, title=f"Todo {i}", completed=i % 2 == 0, user_id=i % 4
+            )
+
+    def test_list_view(self) -> None:
+        url = reverse("todo_list")
+        for params in (
+            {},
+            {"filter": "todo"},
+            {"after": encode_cursor(10)},
+            {"page": 2},
+            {"user": 1, "filter": "todo", "page": 1},
+        ):
+            with self.subTest(params=params):
+                response = self.assertWithinQueryBudget(url, params)
+                self.assertEqual(response.status_code, 200)
+
+    def test_user_summary_view(self) -> None:
+        response = self.assertWithinQueryBudget(reverse("todo_users"))
+        self.assertEqual(len(response.context["users"]), 5)
+
+    def test_fragment_view(self) -> None:
+        url = reverse("todo_fragment")
+        for params in ({"after": encode_cursor(10)}, {"page": 2}):
+            with self.subTest(params=params):
+                self.assertWithinQueryBudget(url, params)
+
+    def test_toggle_views(self) -> None:
+        todos = list(Todo.objects.order_by("api_id")[:5])
+        response = self.assertWithinQueryBudget(
+            reverse("toggle_todo"),
+            json.dumps({"todo_id": str(todos[0].uuid)}),
+            method="post",
+            content_type="application/json",
+        )
+        self.assertTrue(response.json()["success"])
+
+        items = [{"todo_id": str(todo.uuid)} for todo in todos]
+        items[0]["completed"] = True
+        response = self.assertWithinQueryBudget(
+            reverse("toggle_todos_batch"),
+            json.dumps({"items": items}),
+            method="post",
+            content_type="application/json",
+        )
+        self.assertTrue(response.json()["success"])
+
+    def test_exceeding_the_budget_fails_with_the_queries(self) -> None:
+        with patch.object(TodoFragmentView, "query_budget", 0):
+            with self.assertRaises(AssertionError) as ctx:
+                self.assertWithinQueryBudget(reverse("todo_fragment"))
+        self.assertIn("over its budget of 0", str(ctx.exception))
+        self.assertIn('FROM "todos_todo"', str(ctx.exception))
@@ -0,0 +1,63 @@
+import json
+
+from django.test import SimpleTestCase
+
+from todos.helpers.json_stream import iter_json_array
+
+
+def split(raw: bytes, size: int) -> list:
+    return [raw[i : i + size] for i in range(0, len(raw), size)]
+
+
+class IterJsonArrayTests(SimpleTestCase):
+    """Test suite for the incremental iter_json_array parser."""
+
+    def setUp(self) -> None:
+        self.items = [
+            {"userId": 1, "id": 1, "title": "Ação — naïve", "completed": False},
+            {
+                "userId": 2,
+                "id": 2,
+                "title": "with [brackets], {braces}",
+                "completed": True,
+            },
+            12345,
+            "plain string",
+            [1, 2.5, None, True],
+        ]
+        self.raw = json.dumps(self.items, ensure_ascii=False).encode()
+
+    def test_parses_any_chunking(self) -> None:
+        """
+        Elements, multi-byte characters and numbers split across chunk
+        boundaries are reassembled correctly.
+        """
+        for size in (1, 2, 3, 7, 64, len(self.raw)):
+            with self.subTest(chunk_size=size):
+                self.assertEqual(
+                    list(iter_json_array(split(self.raw, size))), self.items
+                )
+
+    def test_empty_array_and_whitespace(self) -> None:
+        self.assertEqual(list(iter_json_array([b"  [ ", b" ]\n"])), [])
+
+    def test_yields_lazily(self) -> None:
+        """
+        The first element is available before later chunks are read.
+        """
+        consumed = []
+
+        def chunks():
+            for chunk in split(self.raw, 16):
+                consumed.append(chunk)
+                yield chunk
+
+        first = next(iter_json_array(chunks()))
+        self.assertEqual(first, self.items[0])
+        self.assertLess(len(consumed), len(split(self.raw, 16)))
+
+    def test_rejects_malformed_bodies(self) -> None:
+        for body in (b"", b"{}", b"[1,", b"[1 2]", b'[{"a":}]', b"[1"):
+            with self.subTest(body=body):
+                with self.assertRaises(ValueError):
+                    list(iter_json_array([body]))
@@ -0,0 +1,176 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import skipUnless
+from unittest.mock import MagicMock, patch
+
+from django.conf import settings
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from urllib3.util import Retry
+
+from todos.helpers import UpstreamClient, store_todo_items
+from todos.metrics import MULTIPROC_ENV, REGISTRY, metrics_available, render_metrics
+from todos.models import SyncState, Todo
+from todos.tests import TodoUsersMixin
+from todos.views import metrics
+
+
+def sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@skipUnless(metrics_available(), "prometheus_client is not installed")
+class MetricsTests(TodoUsersMixin, TestCase):
+    """Test suite for the Prometheus metrics and the /metrics view."""
+
+    def setUp(self) -> None:
+        self.todo = Todo.objects.create(api_id=1, title="Todo", user_id=1)
+
+    @override_settings(TODO_PAGE_CACHE_STATS=True)
+    def test_metrics_view_serves_text_format(self) -> None:
+        SyncState.objects.create(
+            source="http://upstream.invalid/todos", synced_at=self.todo.created_at
+        )
+
+        response = metrics(RequestFactory().get("/metrics"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+        body = response.content.decode()
+        self.assertIn('todo_items{state="uncompleted"} 1.0', body)
+        self.assertIn("todo_page_cache_hits_total", body)
+        self.assertIn(
+            'todo_last_sync_timestamp_seconds{source="http://upstream.invalid/todos"}',
+            body,
+        )
+        self.assertIn("# TYPE todo_toggle_requests_total counter", body)
+
+    def test_toggle_outcomes_are_counted(self) -> None:
+        url = reverse("toggle_todo")
+        before = {
+            outcome: sample("todo_toggle_requests_total", outcome=outcome)
+            for outcome in ("success", "not_found", "invalid_json")
+        }
+
+        for body in (
+            json.dumps({"todo_id": str(self.todo.uuid)}),
+            json.dumps({"todo_id": "00000000-0000-0000-0000-000000000000"}),
+            "{not json",
+        ):
+            self.client.post(url, data=body, content_type="application/json")
+
+        for outcome, count in before.items():
+            with self.subTest(outcome=outcome):
+                self.assertEqual(
+                    sample("todo_toggle_requests_total", outcome=outcome), count + 1
+                )
+
+    @override_settings(METRICS_ENABLED=True)
+    def test_middleware_observes_latency_per_view(self) -> None:
+        before = sample(
+            "todo_http_request_duration_seconds_count", view="todo_list", method="GET"
+        )
+        unmatched = sample(
+            "todo_http_request_duration_seconds_count", view="unmatched", method="GET"
+        )
+
+        self.client.get(reverse("todo_list"))
+        self.client.get("/no-such-page/")
+
+        self.assertEqual(
+            sample(
+                "todo_http_request_duration_seconds_count",
+                view="todo_list",
+                method="GET",
+            ),
+            before + 1,
+        )
+        self.assertEqual(
+            sample(
+                "todo_http_request_duration_seconds_count",
+                view="unmatched",
+                method="GET",
+            ),
+            unmatched + 1,
+        )
+
+    @override_settings(METRICS_ENABLED=True)
+    def test_unknown_methods_share_one_label(self) -> None:
+        before = sample(
+            "todo_http_request_duration_seconds_count", view="todo_list", method="other"
+        )
+
+        for method in ("PURGE", "X-RANDOM-1", "X-RANDOM-2"):
+            self.client.generic(method, reverse("todo_list"))
+
+        self.assertEqual(
+            sample(
+                "todo_http_request_duration_seconds_count",
+                view="todo_list",
+                method="other",
+            ),
+            before + 3,
+        )
+        self.assertEqual(
+            sample(
+                "todo_http_request_duration_seconds_count",
+                view="todo_list",
+                method="PURGE",
+            ),
+            0.0,
+        )
+
+    def test_upstream_requests_record_duration_and_retries(self) -> None:
+        client = UpstreamClient()
+        response = MagicMock()
+        response.raw.retries = Retry(total=1, history=("first", "second"))
+        count = sample("todo_upstream_request_duration_seconds_count")
+        retries = sample("todo_upstream_retries_total")
+
+        with patch.object(client.session, "get", return_value=response):
+            client.get("http://upstream.invalid/todos")
+
+        self.assertEqual(
+            sample("todo_upstream_request_duration_seconds_count"), count + 1
+        )
+        self.assertEqual(sample("todo_upstream_retries_total"), retries + 2)
+
+    def test_ingested_rows_are_counted(self) -> None:
+        before = sample("todo_ingested_rows_total")
+        items = [
+            {"id": api_id, "userId": 1, "title": f"Todo {api_id}"}
+            for api_id in range(2, 7)
+        ]
+
+        store_todo_items(iter(items), batch_size=2)
+
+        self.assertEqual(sample("todo_ingested_rows_total"), before + 5)
+
+
+@skipUnless(metrics_available(), "prometheus_client is not installed")
+class MultiprocessMetricsTests(TodoUsersMixin, TestCase):
+    """Metrics from several processes are aggregated through a shared directory."""
+
+    def test_counters_are_summed_across_processes(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            env = {**os.environ, MULTIPROC_ENV: directory}
+            script = (
+                "import django; django.setup(); "
+                "from todos.metrics import INGESTED_ROWS; INGESTED_ROWS.inc(5)"
+            )
+            for _ in range(2):
+                subprocess.run(
+                    [sys.executable, "-c", script],
+                    check=True,
+                    cwd=settings.BASE_DIR,
+                    env={**env, "DJANGO_SETTINGS_MODULE": "config.settings"},
+                )
+
+            with patch.dict(os.environ, {MULTIPROC_ENV: directory}):
+                body, _ = render_metrics()
+
+        self.assertIn(b"todo_ingested_rows_total 10.0", body)
+        self.assertIn(b"todo_items{", body)
@@ -0,0 +1,47 @@
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+from todos.models import Todo
+
+BEFORE_API_ID_PK = [("todos", "0005_todocounter_version")]
+
+
+class ApiIdPrimaryKeyMigrationTests(TransactionTestCase):
+    """Migration 0006 (and the ones after it) can be rolled back and reapplied."""
+
+    def migrate(self, targets) -> MigrationExecutor:
+        executor = MigrationExecutor(connection)
+        executor.migrate(targets)
+        return executor
+
+    def tearDown(self) -> None:
+        executor = MigrationExecutor(connection)
+        self.migrate(executor.loader.graph.leaf_nodes("todos"))
+
+    def test_round_trip_keeps_rows_and_avatars(self) -> None:
+        executor = self.migrate(BEFORE_API_ID_PK)
+        OldTodo = executor.loader.project_state(BEFORE_API_ID_PK).apps.get_model(
+            "todos", "Todo"
+        )
+        uuids = {
+            api_id: OldTodo.objects.create(
+                api_id=api_id, title="Todo", user_id=7, image="4"
+            ).uuid
+            for api_id in (2, 1)
+        }
+
+        self.migrate(executor.loader.graph.leaf_nodes("todos"))
+
+        self.assertEqual(dict(Todo.objects.values_list("pk", "uuid")), uuids)
+        self.assertEqual(Todo.objects.get(pk=1).user.avatar, 4)
+        Todo.objects.create(api_id=3, title="New", user_id=7)
+
+        executor = self.migrate(BEFORE_API_ID_PK)
+        OldTodo = executor.loader.project_state(BEFORE_API_ID_PK).apps.get_model(
+            "todos", "Todo"
+        )
+        self.assertEqual(
+            sorted(OldTodo.objects.values_list("api_id", "image")),
+            [(1, "4"), (2, "4"), (3, "4")],
+        )
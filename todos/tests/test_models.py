@@ -0,0 +1,429 @@
+import threading
+import uuid
+from io import StringIO
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from todos.helpers import encode_cursor
+from todos.models import Todo, TodoCounter, TodoUser
+from todos.tests import TodoUsersMixin
+
+
+class TodoCounterTests(TodoUsersMixin, TestCase):
+    """Test suite for the maintained TodoCounter row."""
+
+    def assertCounters(self, total: int, completed: int) -> None:
+        counter = TodoCounter.snapshot()
+        self.assertEqual(counter.total, total)
+        self.assertEqual(counter.completed, completed)
+        self.assertEqual(counter.uncompleted, total - completed)
+
+    def test_snapshot_builds_missing_row_from_table(self) -> None:
+        """
+        If the counter row does not exist, snapshot() recounts the table.
+        """
+        Todo.objects.create(api_id=1, title="Todo 1", completed=True, user_id=1)
+        Todo.objects.create(api_id=2, title="Todo 2", completed=False, user_id=1)
+        TodoCounter.objects.all().delete()
+
+        self.assertCounters(total=2, completed=1)
+
+    def test_every_write_bumps_version(self) -> None:
+        """
+        Edits that leave the counts unchanged still move the counter version.
+        """
+        todo = Todo.objects.create(api_id=1, title="Todo", completed=False, user_id=1)
+        before = TodoCounter.snapshot()
+
+        todo.title = "Renamed"
+        todo.save()
+
+        after = TodoCounter.snapshot()
+        self.assertEqual(after.version, before.version + 1)
+        self.assertGreaterEqual(after.updated_at, before.updated_at)
+        self.assertEqual((after.total, after.completed), (1, 0))
+
+    def test_create_toggle_and_delete_keep_counters_in_sync(self) -> None:
+        """
+        Single-row creates, completion changes and deletes adjust the counters.
+        """
+        todo = Todo.objects.create(api_id=1, title="Todo", completed=False, user_id=1)
+        self.assertCounters(total=1, completed=0)
+
+        todo = Todo.objects.get(pk=todo.pk)
+        todo.completed = True
+        todo.save()
+        self.assertCounters(total=1, completed=1)
+
+        # Saving again without changing the flag must not double count.
+        todo.save()
+        self.assertCounters(total=1, completed=1)
+
+        todo.delete()
+        self.assertCounters(total=0, completed=0)
+
+    def test_queryset_delete_adjusts_counters(self) -> None:
+        """
+        QuerySet.delete() sends post_delete per row, so counters follow it too.
+        """
+        for i in range(3):
+            Todo.objects.create(
+                api_id=i, title=f"Todo {i}", completed=i == 0, user_id=1
+            )
+
+        Todo.objects.filter(completed=False).delete()
+        self.assertCounters(total=1, completed=1)
+
+    def test_reconcile_command_repairs_drift(self) -> None:
+        """
+        reconcile_todo_counters overwrites drifted values with a fresh recount.
+        """
+        Todo.objects.create(api_id=1, title="Todo 1", completed=True, user_id=1)
+        TodoCounter.objects.update(total=42, completed=0)
+
+        out = StringIO()
+        call_command("reconcile_todo_counters", stdout=out)
+
+        self.assertIn("Repaired drift", out.getvalue())
+        self.assertCounters(total=1, completed=1)
+
+    def test_reconcile_command_reports_in_sync(self) -> None:
+        Todo.objects.create(api_id=1, title="Todo 1", completed=False, user_id=1)
+
+        out = StringIO()
+        call_command("reconcile_todo_counters", stdout=out)
+
+        self.assertIn("in sync", out.getvalue())
+
+
+class TodoIndexPlanTests(TodoUsersMixin, TestCase):
+    """
+    Check that the list view's queries are planned on the access path indexes.
+
+    The queries are captured from real requests and re-run under EXPLAIN. On
+    PostgreSQL sequential and bitmap scans are disabled for the session so the
+    planner reports which index it would pick on a large table rather than the
+    seq scan it prefers for a handful of test rows.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        for i in range(60):
+            Todo.objects.create(
+                api_id=i, title=f"Todo {i}", completed=i % 3 == 0, user_id=i % 4
+            )
+
+    def setUp(self) -> None:
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET enable_seqscan = off")
+                cursor.execute("SET enable_bitmapscan = off")
+
+    def list_page_plan(self, params: dict) -> str:
+        """
+        Request the list view and return the plan of its page query.
+        """
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(reverse("todo_list"), params)
+        sql = next(
+            q["sql"]
+            for q in ctx.captured_queries
+            if 'FROM "todos_todo"' in q["sql"] and "LIMIT" in q["sql"]
+        )
+        prefix = "EXPLAIN QUERY PLAN " if connection.vendor == "sqlite" else "EXPLAIN "
+        with connection.cursor() as cursor:
+            cursor.execute(prefix + sql)
+            return "\n".join(str(row[-1]) for row in cursor.fetchall())
+
+    def assertPlanUsesIndex(self, plan: str, index_names: set) -> None:
+        self.assertTrue(
+            any(name in plan for name in index_names),
+            f"Expected one of {sorted(index_names)} in plan:\n{plan}",
+        )
+        # The index order must satisfy ORDER BY api_id without a separate sort.
+        self.assertNotIn("TEMP B-TREE", plan)
+        self.assertNotIn("Sort Key", plan)
+
+    def test_filtered_pages_use_completion_indexes(self) -> None:
+        for filter_param, partial in (
+            ("todo", "todo_pending_api_id_idx"),
+            ("complete", "todo_complete_api_id_idx"),
+        ):
+            with self.subTest(filter=filter_param):
+                first = self.list_page_plan({"filter": filter_param})
+                deep = self.list_page_plan(
+                    {"filter": filter_param, "after": encode_cursor(30)}
+                )
+                for plan in (first, deep):
+                    self.assertPlanUsesIndex(
+                        plan, {"todo_completed_api_id_idx", partial}
+                    )
+
+    def test_search_uses_trigram_index_when_available(self) -> None:
+        """
+        Migration 0008 only builds the index where pg_trgm can be enabled.
+        """
+        if connection.vendor != "postgresql":
+            self.skipTest("Trigram indexes are PostgreSQL-only.")
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_indexes WHERE indexname = 'todo_title_trgm_idx'"
+            )
+            if cursor.fetchone() is None:
+                self.skipTest("pg_trgm is not available on this server.")
+
+        plan = Todo.objects.filter(title__icontains="todo 4").explain()
+        self.assertIn("todo_title_trgm_idx", plan)
+
+    def test_user_and_api_id_index_serves_user_scoped_scans(self) -> None:
+        qs = Todo.objects.filter(user_id=2).order_by("api_id")[:21]
+        self.assertIn("todo_user_api_id_idx", qs.explain())
+
+    def test_user_pages_use_user_indexes(self) -> None:
+        """
+        `?user=` pages of a user with few todos seek on the user indexes, per
+        state where the backend can.
+
+        The table is skewed towards other users and analyzed, as the planner
+        rightly prefers the completion indexes while every user holds a large
+        share of the rows. SQLite cannot seek on the boolean column for the
+        `NOT "completed"` that `completed=False` compiles to, so it seeks on
+        `todo_user_api_id_idx` and filters the state.
+        """
+        Todo.objects.bulk_create(
+            Todo(api_id=i, title=f"Todo {i}", completed=i % 3 == 0, user_id=i % 2)
+            for i in range(100, 3100)
+        )
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE todos_todo")
+            state_index = "todo_user_completed_api_id_idx"
+        else:
+            state_index = "todo_user_api_id_idx"
+
+        for params, index in (
+            ({"user": 2}, "todo_user_api_id_idx"),
+            ({"user": 2, "filter": "todo"}, state_index),
+            ({"user": 2, "filter": "complete"}, state_index),
+        ):
+            with self.subTest(params=params):
+                deep = self.list_page_plan({**params, "after": encode_cursor(30)})
+                self.assertPlanUsesIndex(deep, {index})
+
+
+class TodoUserCountsTests(TodoUsersMixin, TestCase):
+    """Test suite for the maintained per-user counts on TodoUser."""
+
+    def assertUserCounts(self, user_id: int, total: int, completed: int) -> None:
+        user = TodoUser.objects.get(id=user_id)
+        self.assertEqual((user.total, user.completed), (total, completed))
+        self.assertEqual(user.uncompleted, total - completed)
+
+    def test_single_row_writes_keep_counts_in_sync(self) -> None:
+        todo = Todo.objects.create(api_id=1, title="Todo", completed=True, user_id=1)
+        Todo.objects.create(api_id=2, title="Other", completed=False, user_id=1)
+        self.assertUserCounts(1, total=2, completed=1)
+
+        Todo.toggle_completed(todo.uuid)
+        self.assertUserCounts(1, total=2, completed=0)
+
+        todo = Todo.objects.get(pk=todo.pk)
+        todo.user_id = 2
+        todo.completed = True
+        todo.save()
+        self.assertUserCounts(1, total=1, completed=0)
+        self.assertUserCounts(2, total=1, completed=1)
+
+        todo.delete()
+        self.assertUserCounts(2, total=0, completed=0)
+
+    def test_set_completed_many_adjusts_each_user_in_one_update(self) -> None:
+        todos = [
+            Todo.objects.create(api_id=i, title=f"Todo {i}", user_id=i % 3)
+            for i in range(9)
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            Todo.set_completed_many({todo.uuid: True for todo in todos[:5]})
+
+        user_updates = [
+            q for q in ctx.captured_queries if 'UPDATE "todos_todouser"' in q["sql"]
+        ]
+        self.assertEqual(len(user_updates), 1)
+        self.assertUserCounts(0, total=3, completed=2)
+        self.assertUserCounts(1, total=3, completed=2)
+        self.assertUserCounts(2, total=3, completed=1)
+
+    def test_rebuild_counts_repairs_drift(self) -> None:
+        Todo.objects.create(api_id=1, title="Todo", completed=True, user_id=1)
+        TodoUser.objects.filter(id__in=[1, 2]).update(total=7, completed=7)
+
+        self.assertEqual(TodoUser.rebuild_counts(), 2)
+        self.assertUserCounts(1, total=1, completed=1)
+        self.assertUserCounts(2, total=0, completed=0)
+        self.assertEqual(TodoUser.rebuild_counts(), 0)
+
+    def test_reconcile_command_repairs_user_counts(self) -> None:
+        Todo.objects.create(api_id=1, title="Todo", completed=False, user_id=1)
+        TodoUser.objects.filter(id=1).update(total=0)
+
+        out = StringIO()
+        call_command("reconcile_todo_counters", stdout=out)
+
+        self.assertIn("Repaired the counts of 1 user(s).", out.getvalue())
+        self.assertUserCounts(1, total=1, completed=0)
+
+
+class TodoToggleCompletedTests(TodoUsersMixin, TestCase):
+    """Test suite for the single-statement Todo.toggle_completed."""
+
+    def setUp(self) -> None:
+        self.todo = Todo.objects.create(
+            api_id=1, title="Todo", completed=False, user_id=1
+        )
+
+    def test_toggle_flips_flag_and_counters(self) -> None:
+        self.assertTrue(Todo.toggle_completed(str(self.todo.uuid)))
+        self.assertEqual(TodoCounter.snapshot().completed, 1)
+
+        self.assertFalse(Todo.toggle_completed(self.todo.uuid))
+        self.assertEqual(TodoCounter.snapshot().completed, 0)
+
+    def test_toggle_missing_todo_returns_none(self) -> None:
+        self.assertIsNone(Todo.toggle_completed(uuid.uuid4()))
+        self.assertEqual(TodoCounter.snapshot().completed, 0)
+
+    def test_toggle_addresses_todos_by_uuid_not_primary_key(self) -> None:
+        """
+        The integer primary key is internal; toggles only accept the UUID.
+        """
+        other = Todo.objects.create(api_id=2, title="Other", user_id=1)
+        self.assertIsInstance(self.todo.pk, int)
+        self.assertGreater(other.pk, self.todo.pk)
+
+        with self.assertRaises(ValidationError):
+            Todo.toggle_completed(str(self.todo.pk))
+        self.assertTrue(Todo.toggle_completed(other.uuid))
+        self.assertFalse(Todo.objects.get(uuid=self.todo.uuid).completed)
+
+    def test_toggle_writes_only_completed_and_updated_at(self) -> None:
+        """
+        The UPDATE must not rewrite the other columns of the row.
+        """
+        previous_updated_at = self.todo.updated_at
+        with CaptureQueriesContext(connection) as ctx:
+            Todo.toggle_completed(self.todo.uuid)
+
+        toggle_sql = next(
+            q["sql"] for q in ctx.captured_queries if 'UPDATE "todos_todo"' in q["sql"]
+        )
+        # The user is only read back (RETURNING) for the per-user counts.
+        assignments = toggle_sql.split(" WHERE ")[0]
+        self.assertIn('"completed"', assignments)
+        self.assertIn('"updated_at"', assignments)
+        for column in ("title", "user_id", "api_id", "created_at"):
+            self.assertNotIn(f'"{column}"', assignments)
+
+        self.todo.refresh_from_db()
+        self.assertGreater(self.todo.updated_at, previous_updated_at)
+
+
+@skipUnlessDBFeature("has_select_for_update")
+class ConcurrentToggleTests(TransactionTestCase):
+    """
+    Hammer one row with toggles from many threads.
+
+    With a read-modify-write two threads can both read `completed=False` and
+    lose a flip; the single conditional UPDATE must serialise them. Needs a
+    backend with row-level locking (the in-memory SQLite test database rejects
+    concurrent writers outright).
+    """
+
+    THREADS = 16
+    TOGGLES_PER_THREAD = 5
+
+    def test_concurrent_toggles_are_not_lost(self) -> None:
+        TodoUser.objects.create(id=1, avatar=1)
+        todo = Todo.objects.create(api_id=1, title="Todo", completed=False, user_id=1)
+        start = threading.Barrier(self.THREADS)
+        results = []
+        errors = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            try:
+                start.wait()
+                for _ in range(self.TOGGLES_PER_THREAD):
+                    completed = Todo.toggle_completed(todo.uuid)
+                    with lock:
+                        results.append(completed)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        total = self.THREADS * self.TOGGLES_PER_THREAD
+        # Every flip is observed exactly once, so the returned states alternate
+        # and split evenly; a lost update would skew the split.
+        self.assertEqual(results.count(True), total // 2)
+        self.assertEqual(results.count(False), total // 2)
+
+        todo.refresh_from_db()
+        self.assertEqual(todo.completed, total % 2 == 1)
+        self.assertEqual(TodoCounter.snapshot().completed, int(todo.completed))
+        self.assertEqual(TodoUser.objects.get(id=1).completed, int(todo.completed))
+
+    def test_toggles_and_batches_across_users_do_not_deadlock(self) -> None:
+        """
+        Single toggles and batches lock user rows before the counter row.
+        """
+        TodoUser.objects.bulk_create([TodoUser(id=i, avatar=1) for i in range(3)])
+        todos = [
+            Todo.objects.create(api_id=i, title=f"Todo {i}", user_id=i % 3)
+            for i in range(12)
+        ]
+        start = threading.Barrier(self.THREADS)
+        errors = []
+
+        def worker(n: int) -> None:
+            try:
+                start.wait()
+                for i in range(self.TOGGLES_PER_THREAD):
+                    if n % 2:
+                        Todo.toggle_completed(todos[(n + i) % len(todos)].uuid)
+                    else:
+                        Todo.set_completed_many(
+                            {todo.uuid: None for todo in todos[i % 3 :: 3]}
+                        )
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=worker, args=(n,)) for n in range(self.THREADS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(TodoUser.rebuild_counts(), 0)
+        self.assertEqual(
+            TodoCounter.snapshot().completed,
+            Todo.objects.filter(completed=True).count(),
+        )
@@ -0,0 +1,98 @@
+import json
+import tempfile
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from todos.helpers import page_cache_stats, reset_page_cache_stats
+from todos.models import Todo
+from todos.tests import TodoUsersMixin
+
+
+class PageCacheTests(TodoUsersMixin, TestCase):
+    """Test suite for the rendered todo list page cache."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.url = reverse("todo_list")
+        self.todo = Todo.objects.create(
+            api_id=1, title="Todo 1", completed=False, user_id=1
+        )
+
+    def test_repeat_request_is_served_from_cache(self) -> None:
+        """
+        An unchanged page is rendered once; the repeat costs one counter lookup.
+        """
+        first = self.client.get(self.url)
+        self.assertEqual(first.headers["X-Cache"], "MISS")
+
+        with self.assertNumQueries(1):
+            second = self.client.get(self.url)
+        self.assertEqual(second.headers["X-Cache"], "HIT")
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second.headers["ETag"], first.headers["ETag"])
+
+    def test_pages_are_keyed_by_filter_and_cursor(self) -> None:
+        self.client.get(self.url)
+
+        for params in ({"filter": "todo"}, {"filter": "complete"}, {"after": "MQ"}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.headers["X-Cache"], "MISS", params)
+
+    def test_toggle_invalidates_cached_pages(self) -> None:
+        self.client.get(self.url, {"filter": "complete"})
+
+        self.client.post(
+            reverse("toggle_todo"),
+            data=json.dumps({"todo_id": str(self.todo.uuid)}),
+            content_type="application/json",
+        )
+
+        response = self.client.get(self.url, {"filter": "complete"})
+        self.assertEqual(response.headers["X-Cache"], "MISS")
+        self.assertContains(response, "Todo 1")
+
+    @override_settings(TODO_PAGE_CACHE_STATS=True)
+    def test_hit_and_miss_counters(self) -> None:
+        reset_page_cache_stats()
+
+        self.client.get(self.url)
+        self.client.get(self.url)
+        self.client.get(self.url)
+
+        self.assertEqual(page_cache_stats(), {"hits": 2, "misses": 1, "lookups": 3})
+
+        out = StringIO()
+        call_command("todo_cache_stats", "--reset", stdout=out)
+        self.assertIn("2 hits, 1 misses (66.7% hit rate)", out.getvalue())
+        self.assertEqual(page_cache_stats()["lookups"], 0)
+
+    def test_counters_are_off_by_default(self) -> None:
+        reset_page_cache_stats()
+
+        self.client.get(self.url)
+        self.client.get(self.url)
+
+        self.assertEqual(page_cache_stats()["lookups"], 0)
+
+    @override_settings(TODO_PAGE_CACHE_TIMEOUT=0)
+    def test_disabled_cache_always_renders(self) -> None:
+        self.client.get(self.url)
+        response = self.client.get(self.url)
+
+        self.assertNotIn("X-Cache", response.headers)
+        self.assertIn("todos", response.context)
+
+    def test_file_backend(self) -> None:
+        with tempfile.TemporaryDirectory() as location:
+            backend = "django.core.cache.backends.filebased.FileBasedCache"
+            caches = {"default": {"BACKEND": backend, "LOCATION": location}}
+            with override_settings(CACHES=caches):
+                self.client.get(self.url)
+                response = self.client.get(self.url)
+
+        self.assertEqual(response.headers["X-Cache"], "HIT")
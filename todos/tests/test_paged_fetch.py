@@ -0,0 +1,314 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from todos.helpers import (
+    fetch_todo_pages_if_changed,
+    get_external_todo_data,
+    iter_todo_pages,
+    sync_external_todo_data,
+)
+from todos.models import SyncState, Todo, TodoCounter
+from todos.tests import TodoUsersMixin
+
+TOTAL_ITEMS = 45
+
+
+def make_items(start: int, stop: int) -> List[Dict[str, Any]]:
+    return [
+        {"userId": i % 3 + 1, "id": i, "title": f"Todo {i}", "completed": i % 2 == 0}
+        for i in range(start, stop)
+    ]
+
+
+class FakeResponse:
+    def __init__(self, payload: Any, status_code: int = 200) -> None:
+        self.payload = payload
+        self.status_code = status_code
+        self.headers = {"ETag": '"v1"'}
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> Any:
+        return self.payload
+
+
+class FakePagedClient:
+    """Serve `TOTAL_ITEMS` todos in pages, tracking how many requests overlap."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests: List[Dict[str, Any]] = []
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs):
+        with self.lock:
+            self.requests.append(dict(params))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            limit = params["limit"]
+            if "page" in params:
+                start = (params["page"] - 1) * limit + 1
+                return FakeResponse(
+                    make_items(start, min(start + limit, TOTAL_ITEMS + 1))
+                )
+            start = int(params.get("cursor", 1))
+            stop = min(start + limit, TOTAL_ITEMS + 1)
+            return FakeResponse(
+                {
+                    "results": make_items(start, stop),
+                    "next": str(stop) if stop <= TOTAL_ITEMS else None,
+                }
+            )
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class IterTodoPagesTests(SimpleTestCase):
+    """Test suite for concurrent fetching of paginated upstream sources."""
+
+    def setUp(self) -> None:
+        self.client_stub = FakePagedClient()
+        patcher = patch(
+            "todos.helpers.paged_fetch.get_upstream_client",
+            return_value=self.client_stub,
+        )
+        self.mock_get_client = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_page_mode_fetches_every_page_concurrently(self) -> None:
+        """
+        Test that numbered pages are requested in parallel, bounded by the
+        worker count, and that every item is returned exactly once.
+        """
+        pages = list(iter_todo_pages("http://x", mode="page", page_size=5, workers=3))
+
+        ids = sorted(item["id"] for page in pages for item in page)
+        self.assertEqual(ids, list(range(1, TOTAL_ITEMS + 1)))
+        self.assertEqual(self.client_stub.max_in_flight, 3)
+        self.assertTrue(all(len(page) == 5 for page in pages))
+
+    def test_page_mode_stops_after_short_page(self) -> None:
+        """
+        Test that no pages beyond the in-flight window are requested once a
+        short page marks the end of the source.
+        """
+        list(iter_todo_pages("http://x", mode="page", page_size=10, workers=2))
+
+        requested = sorted(params["page"] for params in self.client_stub.requests)
+        # Page 5 is short; at most one more page (6) can already be in flight.
+        self.assertEqual(requested[:5], [1, 2, 3, 4, 5])
+        self.assertLessEqual(max(requested), 6)
+
+    def test_page_mode_yields_before_all_pages_are_fetched(self) -> None:
+        """
+        Test that the first page reaches the caller while later pages are still
+        being downloaded, so writes can overlap with fetching.
+        """
+        pages = iter_todo_pages("http://x", mode="page", page_size=5, workers=2)
+        next(pages)
+
+        self.assertLess(len(self.client_stub.requests), TOTAL_ITEMS // 5)
+        pages.close()
+
+    def test_page_mode_stops_when_upstream_ignores_paging(self) -> None:
+        """
+        Test that an upstream answering every page with the same full page is
+        read once instead of forever.
+        """
+        requests = []
+
+        def unpaged_get(url: str, params: Dict[str, Any], **kwargs) -> FakeResponse:
+            requests.append(params)
+            return FakeResponse(make_items(1, 11))
+
+        self.client_stub.get = unpaged_get
+
+        pages = list(iter_todo_pages("http://x", mode="page", page_size=10, workers=3))
+
+        self.assertEqual(pages, [make_items(1, 11)])
+        self.assertLessEqual(len(requests), 6)
+
+    @override_settings(TODO_API_MAX_PAGES=3)
+    def test_page_mode_stops_at_max_pages(self) -> None:
+        """
+        Test that no page past `TODO_API_MAX_PAGES` is requested.
+        """
+        pages = list(iter_todo_pages("http://x", mode="page", page_size=5, workers=2))
+
+        ids = sorted(item["id"] for page in pages for item in page)
+        self.assertEqual(ids, list(range(1, 16)))
+        self.assertEqual(
+            sorted(params["page"] for params in self.client_stub.requests), [1, 2, 3]
+        )
+
+    def test_cursor_mode_follows_next_cursor(self) -> None:
+        """
+        Test that cursor pages are followed until the upstream returns no
+        `next` cursor.
+        """
+        pages = list(iter_todo_pages("http://x", mode="cursor", page_size=20))
+
+        self.assertEqual([len(page) for page in pages], [20, 20, 5])
+        self.assertEqual(
+            [params.get("cursor") for params in self.client_stub.requests],
+            [None, "21", "41"],
+        )
+
+    def test_page_error_is_raised(self) -> None:
+        """
+        Test that a page that still fails after its retries aborts the fetch.
+        """
+
+        def failing_get(url: str, **kwargs) -> None:
+            raise ConnectionError("boom")
+
+        self.client_stub.get = failing_get
+
+        with self.assertRaises(ConnectionError):
+            list(iter_todo_pages("http://x", mode="page", page_size=5, workers=2))
+
+    def test_retry_policy_is_applied_per_page(self) -> None:
+        """
+        Test that every page request goes through the shared client configured
+        with the caller's retry settings.
+        """
+        list(
+            iter_todo_pages("http://x", mode="page", page_size=20, workers=2, retries=5)
+        )
+
+        self.assertEqual(
+            self.mock_get_client.call_count, len(self.client_stub.requests)
+        )
+        self.mock_get_client.assert_called_with(
+            retries=5, backoff_factor=0.3, status_forcelist=None
+        )
+
+    def test_cursor_mode_accepts_a_bare_array_page(self) -> None:
+        """
+        Test that a cursor page without a wrapper object ends the fetch.
+        """
+        self.client_stub.get = lambda url, **kwargs: FakeResponse(make_items(1, 4))
+
+        pages = list(iter_todo_pages("http://x", mode="cursor", page_size=20))
+
+        self.assertEqual([len(page) for page in pages], [3])
+
+    def test_unknown_mode_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            iter_todo_pages("http://x", mode="offset")
+
+
+class FetchTodoPagesIfChangedTests(SimpleTestCase):
+    """Test suite for the conditional fetch of paginated sources."""
+
+    def setUp(self) -> None:
+        self.client_stub = FakePagedClient(delay=0)
+        patcher = patch(
+            "todos.helpers.paged_fetch.get_upstream_client",
+            return_value=self.client_stub,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_not_modified_first_page_ends_the_fetch(self) -> None:
+        client = MagicMock()
+        client.get.return_value = FakeResponse(None, status_code=304)
+        with patch(
+            "todos.helpers.paged_fetch.get_upstream_client", return_value=client
+        ):
+            data, etag, last_modified = fetch_todo_pages_if_changed(
+                "http://x", etag='"v1"', last_modified="lm", mode="page", page_size=5
+            )
+
+        self.assertIsNone(data)
+        self.assertEqual((etag, last_modified), ('"v1"', "lm"))
+        client.get.assert_called_once_with(
+            "http://x",
+            params={"limit": 5, "page": 1},
+            headers={"If-None-Match": '"v1"', "If-Modified-Since": "lm"},
+        )
+
+    def test_page_mode_returns_every_item_and_validators(self) -> None:
+        data, etag, _ = fetch_todo_pages_if_changed(
+            "http://x", mode="page", page_size=10, workers=2
+        )
+
+        ids = sorted(item["id"] for item in data)
+        self.assertEqual(ids, list(range(1, TOTAL_ITEMS + 1)))
+        self.assertEqual(etag, '"v1"')
+        self.assertEqual(
+            sum(params["page"] == 1 for params in self.client_stub.requests), 1
+        )
+
+    def test_page_mode_skips_pages_repeating_the_first(self) -> None:
+        self.client_stub.get = lambda url, **kwargs: FakeResponse(make_items(1, 11))
+
+        data, _, _ = fetch_todo_pages_if_changed(
+            "http://x", mode="page", page_size=10, workers=2
+        )
+
+        self.assertEqual(list(data), make_items(1, 11))
+
+    def test_cursor_mode_continues_from_the_first_cursor(self) -> None:
+        data, _, _ = fetch_todo_pages_if_changed(
+            "http://x", mode="cursor", page_size=20
+        )
+
+        self.assertEqual(len(list(data)), TOTAL_ITEMS)
+        self.assertEqual(
+            [params.get("cursor") for params in self.client_stub.requests],
+            [None, "21", "41"],
+        )
+
+
+@override_settings(TODO_API_PAGINATION="page", TODO_API_PAGE_SIZE=10)
+class GetExternalTodoDataPagedTests(TestCase):
+    """Test suite for ingesting a paginated upstream source."""
+
+    @patch("todos.helpers.todo_list_view_helper.config", return_value="http://x")
+    @patch("todos.helpers.paged_fetch.get_upstream_client")
+    def test_get_external_todo_data_ingests_all_pages(
+        self, mock_get_client, mock_config
+    ) -> None:
+        """
+        Test that every page of a paginated source is stored and counted.
+        """
+        mock_get_client.return_value = FakePagedClient(delay=0)
+
+        result = get_external_todo_data(batch_size=15)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(Todo.objects.count(), TOTAL_ITEMS)
+        self.assertEqual(TodoCounter.snapshot().total, TOTAL_ITEMS)
+        self.assertEqual(
+            TodoCounter.snapshot().completed,
+            Todo.objects.filter(completed=True).count(),
+        )
+
+
+@override_settings(TODO_API_PAGINATION="page", TODO_API_PAGE_SIZE=10)
+class SyncPagedTests(TodoUsersMixin, TestCase):
+    """Test suite for incrementally syncing a paginated upstream source."""
+
+    @patch("todos.helpers.paged_fetch.get_upstream_client")
+    def test_sync_reads_every_page_and_stores_validators(self, mock_get_client) -> None:
+        mock_get_client.return_value = FakePagedClient(delay=0)
+        Todo.objects.create(api_id=1, title="Old", completed=False, user_id=2)
+
+        result = sync_external_todo_data("http://x", batch_size=15)
+
+        self.assertEqual((result.created, result.updated), (TOTAL_ITEMS - 1, 1))
+        self.assertEqual(Todo.objects.count(), TOTAL_ITEMS)
+        self.assertEqual(Todo.objects.get(api_id=1).title, "Todo 1")
+        self.assertEqual(TodoCounter.snapshot().total, TOTAL_ITEMS)
+        self.assertEqual(SyncState.objects.get(source="http://x").etag, '"v1"')
@@ -0,0 +1,104 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.template.loader import get_template
+from django.test import TestCase, override_settings
+
+from todos.helpers import render_todo_rows, row_cache_key
+from todos.models import Todo
+from todos.tests import TodoUsersMixin
+
+
+class RowCacheTests(TodoUsersMixin, TestCase):
+    """Test suite for per-row HTML caching of the task list."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.todos = [
+            Todo.objects.create(api_id=i, title=f"Todo {i}", completed=False, user_id=1)
+            for i in range(3)
+        ]
+
+    def test_renders_every_row(self) -> None:
+        html = render_todo_rows(self.todos)
+
+        self.assertEqual(html.count('class="task"'), 3)
+        self.assertIn("Todo 2", html)
+        self.assertIn("images/3.png", html)
+
+    def test_unchanged_rows_are_not_rerendered(self) -> None:
+        """
+        The second render is served from one get_many without touching the
+        row template; an edited row is the only one rendered again.
+        """
+        first = render_todo_rows(self.todos)
+
+        template = get_template("todo_row.html")
+        with patch.object(template, "render", wraps=template.render) as render:
+            with patch("todos.helpers.row_cache.get_template", return_value=template):
+                self.assertEqual(render_todo_rows(self.todos), first)
+                self.assertEqual(render.call_count, 0)
+
+                todo = self.todos[1]
+                todo.title = "Renamed"
+                todo.save()
+                html = render_todo_rows(self.todos)
+
+        self.assertEqual(render.call_count, 1)
+        self.assertIn("Renamed", html)
+
+    def test_toggle_changes_row_key(self) -> None:
+        todo = self.todos[0]
+        before = row_cache_key(todo)
+
+        Todo.toggle_completed(todo.uuid)
+        todo.refresh_from_db()
+
+        self.assertNotEqual(row_cache_key(todo), before)
+        self.assertIn('class="check completed"', render_todo_rows([todo]))
+
+    def test_avatar_change_changes_row_key(self) -> None:
+        """
+        The avatar is not on the todo row, so it is part of the key itself.
+        """
+        todo = Todo.objects.select_related("user").get(pk=self.todos[0].pk)
+        before = row_cache_key(todo)
+
+        todo.user.avatar = 6
+        todo.user.save()
+
+        self.assertNotEqual(row_cache_key(todo), before)
+        self.assertIn("images/6.png", render_todo_rows([todo]))
+
+    def test_deploy_changes_row_key(self) -> None:
+        """
+        A new row template, static manifest or `TODO_ROW_CACHE_VERSION`
+        moves the row to a fresh key.
+        """
+        todo = Todo.objects.select_related("user").get(pk=self.todos[0].pk)
+        before = row_cache_key(todo)
+
+        with override_settings(TODO_ROW_CACHE_VERSION="2"):
+            self.assertNotEqual(row_cache_key(todo), before)
+
+        template = get_template("todo_row.html")
+        source = template.template.source + "<!-- v2 -->"
+        with patch.object(template.template, "source", source):
+            with patch("todos.helpers.row_cache.get_template", return_value=template):
+                self.assertNotEqual(row_cache_key(todo), before)
+
+        with patch(
+            "todos.helpers.row_cache.staticfiles_storage",
+            Mock(manifest_hash="abc123"),
+        ):
+            self.assertNotEqual(row_cache_key(todo), before)
+
+        self.assertEqual(row_cache_key(todo), before)
+
+    @override_settings(TODO_ROW_CACHE_TIMEOUT=0)
+    def test_disabled_cache_renders_without_storing(self) -> None:
+        html = render_todo_rows(self.todos)
+
+        self.assertEqual(html.count('class="task"'), 3)
+        self.assertIsNone(cache.get(row_cache_key(self.todos[0])))
@@ -0,0 +1,103 @@
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from todos.helpers import warm_up
+from todos.helpers.warmup import WARM_TEMPLATES
+from todos.management.commands.serve import build_gunicorn_options
+
+OPTIONS = {
+    "bind": "127.0.0.1:9000",
+    "workers": 3,
+    "threads": 1,
+    "max_requests": 500,
+    "max_requests_jitter": 50,
+    "timeout": 20,
+    "keepalive": 5,
+    "asgi": False,
+    "access_log": False,
+}
+
+
+class BuildGunicornOptionsTests(SimpleTestCase):
+    def test_worker_class_follows_threads_and_asgi(self) -> None:
+        self.assertEqual(build_gunicorn_options(OPTIONS)["worker_class"], "sync")
+        self.assertEqual(
+            build_gunicorn_options({**OPTIONS, "threads": 4})["worker_class"],
+            "gthread",
+        )
+        self.assertEqual(
+            build_gunicorn_options({**OPTIONS, "asgi": True})["worker_class"],
+            "uvicorn.workers.UvicornWorker",
+        )
+
+    def test_always_preloads_and_recycles(self) -> None:
+        gunicorn_options = build_gunicorn_options(OPTIONS)
+
+        self.assertTrue(gunicorn_options["preload_app"])
+        self.assertEqual(gunicorn_options["max_requests"], 500)
+        self.assertEqual(gunicorn_options["max_requests_jitter"], 50)
+        self.assertIsNone(gunicorn_options["accesslog"])
+
+
+class ServeCommandTests(SimpleTestCase):
+    """Test suite for the `serve` management command."""
+
+    @override_settings(WEB_CONCURRENCY=4, WEB_THREADS=2, ASYNC_VIEWS=False)
+    @patch("todos.management.commands.serve.warm_up")
+    @patch("gunicorn.app.base.BaseApplication.run", autospec=True)
+    def test_configures_preloaded_gunicorn(self, mock_run, mock_warm_up) -> None:
+        """
+        The command hands gunicorn the settings-derived configuration and a
+        loader that imports and warms the WSGI application.
+        """
+        out = StringIO()
+        call_command("serve", "--max-requests", "10", stdout=out)
+
+        app = mock_run.call_args.args[0]
+        self.assertEqual(app.cfg.workers, 4)
+        self.assertEqual(app.cfg.threads, 2)
+        self.assertEqual(app.cfg.max_requests, 10)
+        self.assertTrue(app.cfg.preload_app)
+        self.assertIn("config.wsgi.application", out.getvalue())
+
+        from config.wsgi import application
+
+        self.assertIs(app.load(), application)
+        mock_warm_up.assert_called_once()
+
+    @override_settings(ASYNC_VIEWS=True)
+    @patch("todos.management.commands.serve.warm_up")
+    @patch("gunicorn.app.base.BaseApplication.run", autospec=True)
+    def test_no_asgi_overrides_async_views(self, mock_run, mock_warm_up) -> None:
+        out = StringIO()
+        call_command("serve", "--no-asgi", stdout=out)
+
+        self.assertIn("config.wsgi.application", out.getvalue())
+        self.assertEqual(mock_run.call_args.args[0].cfg.worker_class_str, "sync")
+
+
+class WarmUpTests(SimpleTestCase):
+    @patch("todos.helpers.warmup.gc.freeze")
+    @patch("todos.helpers.warmup.connections.close_all")
+    def test_compiles_templates_and_closes_connections(
+        self, mock_close_all, mock_freeze
+    ) -> None:
+        with patch("django.template.loaders.cached.Loader.get_template") as get:
+            warm_up(["todos.html", "404.html"])
+        self.assertEqual(
+            [call.args[0] for call in get.call_args_list], ["todos.html", "404.html"]
+        )
+
+        mock_close_all.assert_called_once()
+        mock_freeze.assert_called_once()
+
+    def test_warms_every_app_template(self) -> None:
+        templates = Path(settings.BASE_DIR, "todos", "templates")
+        self.assertEqual(
+            sorted(WARM_TEMPLATES), sorted(p.name for p in templates.glob("*.html"))
+        )
@@ -0,0 +1,135 @@
+import threading
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from todos.helpers import seed_todos_if_empty, single_flight_lock
+from todos.helpers.single_flight import SEED_LOCK_NAME
+from todos.models import Todo
+from todos.tests import TodoUsersMixin
+
+
+class HeldLock:
+    """
+    Hold a single-flight lock from another thread (and DB connection) until
+    released, to simulate a seed running in another worker.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.acquired = threading.Event()
+        self.release = threading.Event()
+        self.thread = threading.Thread(target=self.run)
+
+    def run(self) -> None:
+        try:
+            with single_flight_lock(self.name, timeout=5) as acquired:
+                assert acquired
+                self.acquired.set()
+                self.release.wait(10)
+        finally:
+            connection.close()
+
+    def __enter__(self) -> "HeldLock":
+        self.thread.start()
+        self.acquired.wait(5)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release.set()
+        self.thread.join()
+
+
+class SingleFlightLockTests(TestCase):
+    """Test suite for the cross-process single_flight_lock."""
+
+    def test_lock_is_exclusive_and_released(self) -> None:
+        with HeldLock("test-lock"):
+            with single_flight_lock("test-lock", timeout=0.2) as acquired:
+                self.assertFalse(acquired)
+
+        with single_flight_lock("test-lock", timeout=0.2) as acquired:
+            self.assertTrue(acquired)
+
+    def test_different_names_do_not_conflict(self) -> None:
+        with HeldLock("test-lock-a"):
+            with single_flight_lock("test-lock-b", timeout=0.2) as acquired:
+                self.assertTrue(acquired)
+
+
+class SeedTodosIfEmptyTests(TodoUsersMixin, TestCase):
+    """Test suite for seed_todos_if_empty."""
+
+    def test_runs_loader_when_empty(self) -> None:
+        loader = MagicMock()
+        self.assertTrue(seed_todos_if_empty(loader, timeout=0.2))
+        loader.assert_called_once()
+
+    def test_skips_loader_when_already_seeded(self) -> None:
+        """
+        A worker that got the lock after another finished seeding must not
+        fetch the upstream again.
+        """
+        Todo.objects.create(api_id=1, title="Todo", completed=False, user_id=1)
+        loader = MagicMock()
+        self.assertTrue(seed_todos_if_empty(loader, timeout=0.2))
+        loader.assert_not_called()
+
+    def test_returns_false_while_another_worker_seeds(self) -> None:
+        loader = MagicMock()
+        with HeldLock(SEED_LOCK_NAME):
+            self.assertFalse(seed_todos_if_empty(loader, timeout=0.2))
+        loader.assert_not_called()
+
+    def test_loader_errors_are_logged_not_raised(self) -> None:
+        loader = MagicMock(side_effect=Exception("upstream down"))
+        self.assertTrue(seed_todos_if_empty(loader, timeout=0.2))
+
+
+class WarmingUpViewTests(TestCase):
+    """The list view while another worker holds the seed lock."""
+
+    @override_settings(TODO_SEED_WAIT_TIMEOUT=0.2)
+    @patch("todos.views.get_external_todo_data")
+    def test_serves_warming_up_page(self, mock_get_external: MagicMock) -> None:
+        with HeldLock(SEED_LOCK_NAME):
+            response = self.client.get(reverse("todo_list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.context["warming_up"])
+        self.assertContains(response, "loading your tasks")
+        mock_get_external.assert_not_called()
+
+
+class SeedTodosCommandTests(TodoUsersMixin, TestCase):
+    """Test suite for the seed_todos management command."""
+
+    @patch("todos.management.commands.seed_todos.get_external_todo_data")
+    def test_seeds_empty_table(self, mock_get_external: MagicMock) -> None:
+        def create_todo() -> None:
+            Todo.objects.create(api_id=1, title="Todo", completed=False, user_id=1)
+
+        mock_get_external.side_effect = create_todo
+        out = StringIO()
+        call_command("seed_todos", wait=0.2, stdout=out)
+
+        mock_get_external.assert_called_once()
+        self.assertIn("Seeded 1 todos", out.getvalue())
+
+    @patch("todos.management.commands.seed_todos.get_external_todo_data")
+    def test_already_seeded(self, mock_get_external: MagicMock) -> None:
+        Todo.objects.create(api_id=1, title="Todo", completed=False, user_id=1)
+        out = StringIO()
+        call_command("seed_todos", stdout=out)
+
+        mock_get_external.assert_not_called()
+        self.assertIn("already seeded", out.getvalue())
+
+    @patch("todos.management.commands.seed_todos.get_external_todo_data")
+    def test_fails_when_nothing_was_stored(self, mock_get_external: MagicMock) -> None:
+        with self.assertRaises(CommandError):
+            call_command("seed_todos", wait=0.2, stdout=StringIO())
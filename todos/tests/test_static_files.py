@@ -0,0 +1,66 @@
+import importlib.util
+import os
+import shutil
+import tempfile
+
+from django.core.management import call_command
+from django.template.loader import render_to_string
+from django.templatetags.static import static
+from django.test import SimpleTestCase, override_settings
+
+STATIC_ROOT = tempfile.mkdtemp()
+# Brotli variants are only built when the optional `brotli` package is installed.
+HAS_BROTLI = importlib.util.find_spec("brotli") is not None
+
+
+@override_settings(STATIC_ROOT=STATIC_ROOT, WHITENOISE_USE_FINDERS=False)
+class HashedStaticFilesTests(SimpleTestCase):
+    """Test suite for the hashed, precompressed static pipeline."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.addClassCleanup(shutil.rmtree, STATIC_ROOT, ignore_errors=True)
+        call_command("collectstatic", interactive=False, verbosity=0)
+
+    def test_collectstatic_writes_hashed_and_compressed_files(self) -> None:
+        url = static("css/styles.css")
+
+        self.assertRegex(url, r"^/static/css/styles\.[0-9a-f]{12}\.css$")
+        path = os.path.join(STATIC_ROOT, url[len("/static/") :])
+        self.assertTrue(os.path.exists(path))
+        self.assertTrue(os.path.exists(path + ".gz"))
+        self.assertEqual(os.path.exists(path + ".br"), HAS_BROTLI)
+
+    def test_hashed_files_are_immutable_and_negotiated(self) -> None:
+        url = static("js/todos.js")
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.headers["Content-Encoding"], "br" if HAS_BROTLI else "gzip"
+        )
+        self.assertIn("immutable", response.headers["Cache-Control"])
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+
+        plain = self.client.get(url)
+        self.assertNotIn("Content-Encoding", plain.headers)
+        response.close()
+        plain.close()
+
+    def test_rows_link_hashed_avatars(self) -> None:
+        html = render_to_string(
+            "todo_row.html",
+            {"todo": {"uuid": "x", "title": "T", "user": {"avatar": 3}, "user_id": 1}},
+        )
+
+        self.assertRegex(html, r'src="/static/images/3\.[0-9a-f]{12}\.png"')
+
+
+class UnhashedFallbackTests(SimpleTestCase):
+    def test_missing_manifest_falls_back_to_plain_name(self) -> None:
+        """
+        Without a collectstatic run, templates still resolve static names.
+        """
+        with tempfile.TemporaryDirectory() as root, override_settings(STATIC_ROOT=root):
+            self.assertEqual(static("css/styles.css"), "/static/css/styles.css")
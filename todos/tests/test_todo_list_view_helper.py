@@ -1,24 +1,38 @@
+import json
+import tracemalloc
+from typing import Iterator
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
 import requests
+from django.conf import settings
 from django.test import TestCase
 
-from todos.helpers import fetch_todos_from_api, get_external_todo_data
-from todos.models import Todo
+from todos.helpers import (
+    fetch_todos_from_api,
+    get_external_todo_data,
+    stream_todos_from_api,
+)
+from todos.helpers.upstream_client import reset_upstream_clients
+from todos.models import Todo, TodoCounter, TodoUser
+
+UPSTREAM_TIMEOUT = (settings.UPSTREAM_CONNECT_TIMEOUT, settings.UPSTREAM_READ_TIMEOUT)
 
 
 class FetchTodosFromApiTests(TestCase):
     """Test suite for the fetch_todos_from_api helper function."""
 
     def setUp(self) -> None:
+        # Build the shared client from the patched Session, and drop it afterwards.
+        reset_upstream_clients()
+        self.addCleanup(reset_upstream_clients)
         self.url = "https://example.com/api/todos"
         self.mock_json_data = [
             {"userId": 1, "id": 1, "title": "Test Todo 1", "completed": False},
             {"userId": 2, "id": 2, "title": "Test Todo 2", "completed": True},
         ]
 
-    @patch("todos.helpers.todo_list_view_helper.requests.Session")
+    @patch("todos.helpers.upstream_client.requests.Session")
     def test_fetch_todos_successful(self, mock_session: MagicMock) -> None:
         """
         Test that fetch_todos_from_api returns JSON data on a successful response (HTTP 200).
@@ -35,9 +49,11 @@ class FetchTodosFromApiTests(TestCase):
         self.assertIsInstance(todos, list)
         self.assertEqual(todos, self.mock_json_data)
         # Ensure requests.Session.get was called once with the correct URL
-        mock_session_instance.get.assert_called_once_with(self.url, timeout=10)
+        mock_session_instance.get.assert_called_once_with(
+            self.url, timeout=UPSTREAM_TIMEOUT
+        )
 
-    @patch("todos.helpers.todo_list_view_helper.requests.Session")
+    @patch("todos.helpers.upstream_client.requests.Session")
     def test_fetch_todos_raises_exception_on_http_error(
         self, mock_session: MagicMock
     ) -> None:
@@ -57,7 +73,7 @@ class FetchTodosFromApiTests(TestCase):
         with self.assertRaises(requests.RequestException):
             fetch_todos_from_api(url=self.url)
 
-    @patch("todos.helpers.todo_list_view_helper.requests.Session")
+    @patch("todos.helpers.upstream_client.requests.Session")
     def test_fetch_todos_custom_status_forcelist(self, mock_session: MagicMock) -> None:
         """
         Test that the function respects a custom status_forcelist.
@@ -78,7 +94,7 @@ class FetchTodosFromApiTests(TestCase):
 
         self.assertEqual(mock_session_instance.get.call_count, 1)
 
-    @patch("todos.helpers.todo_list_view_helper.requests.Session")
+    @patch("todos.helpers.upstream_client.requests.Session")
     def test_fetch_todos_timeout(self, mock_session: MagicMock) -> None:
         """
         Test that a timeout error is raised if the request times out.
@@ -90,7 +106,9 @@ class FetchTodosFromApiTests(TestCase):
             fetch_todos_from_api(url=self.url)
 
         # Should have attempted at least once
-        mock_session_instance.get.assert_called_once_with(self.url, timeout=10)
+        mock_session_instance.get.assert_called_once_with(
+            self.url, timeout=UPSTREAM_TIMEOUT
+        )
 
 
 class GetExternalTodoDataTests(TestCase):
@@ -104,7 +122,7 @@ class GetExternalTodoDataTests(TestCase):
         ]
 
     @patch("todos.helpers.todo_list_view_helper.config")
-    @patch("todos.helpers.todo_list_view_helper.fetch_todos_from_api")
+    @patch("todos.helpers.todo_list_view_helper.stream_todos_from_api")
     def test_successful_data_fetch(
         self, mock_fetch: MagicMock, mock_config: MagicMock
     ) -> None:
@@ -114,7 +132,7 @@ class GetExternalTodoDataTests(TestCase):
         """
         # Mock config to return a test URL
         mock_config.return_value = "http://fakeurl.com"
-        # Mock fetch_todos_from_api to return our sample payload
+        # Mock stream_todos_from_api to return our sample payload
         mock_fetch.return_value = self.test_todos_payload
 
         result = get_external_todo_data()
@@ -132,7 +150,25 @@ class GetExternalTodoDataTests(TestCase):
         mock_fetch.assert_called_once_with("http://fakeurl.com")
 
     @patch("todos.helpers.todo_list_view_helper.config")
-    @patch("todos.helpers.todo_list_view_helper.fetch_todos_from_api", return_value=[])
+    @patch("todos.helpers.todo_list_view_helper.stream_todos_from_api")
+    def test_bulk_import_adjusts_counters(
+        self, mock_fetch: MagicMock, mock_config: MagicMock
+    ) -> None:
+        """
+        bulk_create skips model signals, so the import must adjust the
+        maintained counters itself.
+        """
+        mock_config.return_value = "http://fakeurl.com"
+        mock_fetch.return_value = self.test_todos_payload
+
+        get_external_todo_data()
+
+        counter = TodoCounter.snapshot()
+        self.assertEqual(counter.total, 3)
+        self.assertEqual(counter.completed, 1)
+
+    @patch("todos.helpers.todo_list_view_helper.config")
+    @patch("todos.helpers.todo_list_view_helper.stream_todos_from_api", return_value=[])
     def test_empty_data_returns_none(
         self, mock_fetch: MagicMock, mock_config: MagicMock
     ) -> None:
@@ -149,7 +185,7 @@ class GetExternalTodoDataTests(TestCase):
 
     @patch("todos.helpers.todo_list_view_helper.config")
     @patch(
-        "todos.helpers.todo_list_view_helper.fetch_todos_from_api",
+        "todos.helpers.todo_list_view_helper.stream_todos_from_api",
         side_effect=Exception("API error"),
     )
     @patch("todos.helpers.todo_list_view_helper.logger")
@@ -172,14 +208,14 @@ class GetExternalTodoDataTests(TestCase):
         )
 
     @patch("todos.helpers.todo_list_view_helper.config")
-    @patch("todos.helpers.todo_list_view_helper.fetch_todos_from_api")
+    @patch("todos.helpers.todo_list_view_helper.stream_todos_from_api")
     @patch("todos.helpers.todo_list_view_helper.random.randint", return_value=5)
-    def test_random_user_image_is_assigned(
+    def test_random_user_avatar_is_assigned(
         self, mock_randint: MagicMock, mock_fetch: MagicMock, mock_config: MagicMock
     ) -> None:
         """
-        Test that each new user gets a random image assigned, and that the same user
-        in the same payload gets the same image.
+        Test that each new user gets a random avatar assigned, and that the same user
+        in the same payload gets only one.
         """
         mock_config.return_value = "http://fakeurl.com"
         mock_fetch.return_value = self.test_todos_payload
@@ -201,28 +237,23 @@ class GetExternalTodoDataTests(TestCase):
 
         get_external_todo_data()
 
-        todos_user_1 = Todo.objects.filter(user_id=1)
-        todos_user_2 = Todo.objects.filter(user_id=2)
-
-        # Both user 1 items should have image=5
-        for t in todos_user_1:
-            self.assertEqual(t.image, "5")
-
-        # user 2 item should have image=3
-        for t in todos_user_2:
-            self.assertEqual(t.image, "3")
+        # user 1 should have avatar=5, user 2 avatar=3
+        self.assertEqual(
+            dict(TodoUser.objects.values_list("id", "avatar")), {1: 5, 2: 3}
+        )
+        self.assertEqual(Todo.objects.filter(user_id=1).count(), 2)
 
         # We expected random.randint to be called exactly 2 times (for 2 distinct userIds)
         self.assertEqual(mock_randint.call_count, 2)
 
     @patch("todos.helpers.todo_list_view_helper.config")
-    @patch("todos.helpers.todo_list_view_helper.fetch_todos_from_api")
-    def test_same_user_image_consistency(
+    @patch("todos.helpers.todo_list_view_helper.stream_todos_from_api")
+    def test_same_user_avatar_consistency(
         self, mock_fetch: MagicMock, mock_config: MagicMock
     ) -> None:
         """
-        Another approach to confirm the same user ID retains the same image
-        within one API fetch, even if random has multiple calls.
+        Another approach to confirm the same user ID gets a single user row
+        within one API fetch, and every todo points at it.
         """
         mock_config.return_value = "http://fakeurl.com"
         payload = [
@@ -235,10 +266,10 @@ class GetExternalTodoDataTests(TestCase):
         get_external_todo_data()
         user1_todos = Todo.objects.filter(user_id=1)
 
-        # All belong to the same user => must have the same 'image'.
-        images = set(todo.image for todo in user1_todos)
+        # All belong to the same user => one user row holds the avatar.
+        self.assertEqual(TodoUser.objects.count(), 1)
         self.assertEqual(
-            len(images), 1, "All todos for the same user should share the same image"
+            user1_todos.count(), 3, "All todos for the same user should share it"
         )
 
     @patch("todos.helpers.todo_list_view_helper.config")
@@ -257,3 +288,94 @@ class GetExternalTodoDataTests(TestCase):
 
         # No objects created
         self.assertEqual(Todo.objects.count(), 0)
+
+
+def fake_feed(count: int, chunk_size: int = 8192) -> Iterator[bytes]:
+    """
+    Generate the body of an upstream feed with `count` todos, chunk by chunk,
+    without ever holding the whole body in memory.
+    """
+    pending = b"["
+    for i in range(count):
+        item = json.dumps(
+            {
+                "userId": i % 10,
+                "id": i,
+                "title": f"Generated todo number {i}",
+                "completed": i % 3 == 0,
+            }
+        ).encode()
+        pending += (b"," if i else b"") + item
+        if len(pending) >= chunk_size:
+            yield pending
+            pending = b""
+    yield pending + b"]"
+
+
+class StreamTodosFromApiTests(TestCase):
+    """Test suite for the streaming stream_todos_from_api helper."""
+
+    def setUp(self) -> None:
+        reset_upstream_clients()
+        self.addCleanup(reset_upstream_clients)
+
+    @patch("todos.helpers.upstream_client.requests.Session")
+    def test_yields_items_from_chunked_body(self, mock_session: MagicMock) -> None:
+        mock_response = mock.Mock(status_code=200)
+        mock_response.iter_content.return_value = fake_feed(50, chunk_size=64)
+        mock_session.return_value.get.return_value = mock_response
+
+        items = list(stream_todos_from_api("https://example.com/api/todos"))
+
+        self.assertEqual([item["id"] for item in items], list(range(50)))
+        mock_session.return_value.get.assert_called_once_with(
+            "https://example.com/api/todos", stream=True, timeout=UPSTREAM_TIMEOUT
+        )
+        mock_response.close.assert_called_once()
+
+    @patch("todos.helpers.upstream_client.requests.Session")
+    def test_raises_on_http_error(self, mock_session: MagicMock) -> None:
+        mock_response = mock.Mock(status_code=500)
+        mock_response.raise_for_status.side_effect = requests.HTTPError("Server Error")
+        mock_session.return_value.get.return_value = mock_response
+
+        with self.assertRaises(requests.RequestException):
+            list(stream_todos_from_api("https://example.com/api/todos"))
+        mock_response.close.assert_called_once()
+
+
+@patch("todos.helpers.todo_list_view_helper.config", return_value="http://fakeurl.com")
+class GetExternalTodoDataMemoryTests(TestCase):
+    """
+    Check that ingestion memory stays flat as the upstream feed grows.
+    """
+
+    def ingest_peak(self, count: int) -> int:
+        """
+        Ingest a generated feed of `count` todos and return the peak traced memory.
+        """
+        Todo.objects.all().delete()
+        reset_upstream_clients()
+        self.addCleanup(reset_upstream_clients)
+        with patch("todos.helpers.upstream_client.requests.Session") as mock_session:
+            mock_response = mock.Mock(status_code=200)
+            mock_response.iter_content.return_value = fake_feed(count)
+            mock_session.return_value.get.return_value = mock_response
+
+            tracemalloc.start()
+            try:
+                get_external_todo_data(batch_size=100)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        self.assertEqual(Todo.objects.count(), count)
+        return peak
+
+    def test_peak_memory_is_flat_in_feed_size(self, mock_config: MagicMock) -> None:
+        small = self.ingest_peak(500)
+        large = self.ingest_peak(5_000)
+
+        # Ten times the rows must not need anywhere near ten times the memory;
+        # a body-at-once implementation fails this by a wide margin.
+        self.assertLess(large, small * 1.5, f"small={small} large={large}")
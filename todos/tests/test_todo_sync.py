@@ -0,0 +1,207 @@
+import threading
+from io import StringIO
+from unittest import mock
+from unittest.mock import MagicMock, patch
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, skipUnlessDBFeature
+
+from todos.helpers import fetch_todos_if_changed, sync_external_todo_data
+from todos.helpers.todo_list_view_helper import store_todo_users
+from todos.helpers.upstream_client import reset_upstream_clients
+from todos.models import SyncState, Todo, TodoCounter, TodoUser
+
+URL = "http://fakeurl.com"
+UPSTREAM_TIMEOUT = (settings.UPSTREAM_CONNECT_TIMEOUT, settings.UPSTREAM_READ_TIMEOUT)
+
+
+class FetchTodosIfChangedTests(TestCase):
+    """Test suite for the conditional fetch_todos_if_changed helper."""
+
+    def setUp(self) -> None:
+        reset_upstream_clients()
+        self.addCleanup(reset_upstream_clients)
+
+    @patch("todos.helpers.upstream_client.requests.Session")
+    def test_sends_validators_and_returns_none_on_304(
+        self, mock_session: MagicMock
+    ) -> None:
+        mock_response = mock.Mock(status_code=304)
+        mock_session.return_value.get.return_value = mock_response
+
+        data, etag, last_modified = fetch_todos_if_changed(
+            URL, etag='"v1"', last_modified="Tue, 11 Feb 2025 09:30:00 GMT"
+        )
+
+        self.assertIsNone(data)
+        self.assertEqual(
+            (etag, last_modified), ('"v1"', "Tue, 11 Feb 2025 09:30:00 GMT")
+        )
+        mock_session.return_value.get.assert_called_once_with(
+            URL,
+            headers={
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Tue, 11 Feb 2025 09:30:00 GMT",
+            },
+            stream=True,
+            timeout=UPSTREAM_TIMEOUT,
+        )
+
+    @patch("todos.helpers.upstream_client.requests.Session")
+    def test_returns_data_and_new_validators(self, mock_session: MagicMock) -> None:
+        mock_response = mock.Mock(status_code=200, headers={"ETag": '"v2"'})
+        mock_response.iter_content.return_value = [b'[{"id": 1},', b' {"id": 2}]']
+        mock_session.return_value.get.return_value = mock_response
+
+        data, etag, last_modified = fetch_todos_if_changed(URL)
+
+        self.assertEqual(list(data), [{"id": 1}, {"id": 2}])
+        self.assertEqual((etag, last_modified), ('"v2"', ""))
+        mock_session.return_value.get.assert_called_once_with(
+            URL, headers={}, stream=True, timeout=UPSTREAM_TIMEOUT
+        )
+        mock_response.close.assert_called_once()
+
+
+@patch("todos.helpers.todo_sync.fetch_todos_if_changed")
+class SyncExternalTodoDataTests(TestCase):
+    """Test suite for the incremental sync_external_todo_data."""
+
+    def setUp(self) -> None:
+        TodoUser.objects.create(id=1, avatar=4)
+        Todo.objects.create(api_id=1, title="Old", completed=False, user_id=1)
+        Todo.objects.create(api_id=2, title="Same", completed=True, user_id=1)
+        self.payload = [
+            {"userId": 1, "id": 1, "title": "Renamed", "completed": True},
+            {"userId": 1, "id": 2, "title": "Same", "completed": True},
+            {"userId": 1, "id": 3, "title": "New for user 1", "completed": False},
+            {"userId": 2, "id": 4, "title": "New user", "completed": True},
+        ]
+
+    def test_upserts_only_changed_rows(self, mock_fetch: MagicMock) -> None:
+        mock_fetch.return_value = (self.payload, '"v1"', "")
+        untouched = Todo.objects.get(api_id=2)
+
+        result = sync_external_todo_data(URL, batch_size=2)
+
+        self.assertEqual((result.created, result.updated, result.unchanged), (2, 1, 1))
+        self.assertEqual(Todo.objects.get(api_id=1).title, "Renamed")
+        self.assertTrue(Todo.objects.get(api_id=1).completed)
+        self.assertEqual(Todo.objects.get(api_id=2).updated_at, untouched.updated_at)
+        self.assertEqual(Todo.objects.count(), 4)
+
+        counter = TodoCounter.snapshot()
+        self.assertEqual((counter.total, counter.completed), (4, 3))
+
+    def test_keeps_per_user_counts_in_step(self, mock_fetch: MagicMock) -> None:
+        payload = self.payload + [
+            {"userId": 2, "id": 2, "title": "Same", "completed": True}
+        ]
+        mock_fetch.return_value = (payload[:1] + payload[2:], "", "")
+
+        sync_external_todo_data(URL, batch_size=2)
+
+        # Todo 2 moved from user 1 to user 2.
+        counts = dict(TodoUser.objects.values_list("id", "total"))
+        self.assertEqual(counts, {1: 2, 2: 2})
+        self.assertEqual(TodoUser.objects.get(id=2).completed, 2)
+        self.assertEqual(TodoUser.rebuild_counts(), 0)
+
+    def test_keeps_each_users_avatar_stable(self, mock_fetch: MagicMock) -> None:
+        mock_fetch.return_value = (self.payload, "", "")
+        original_uuid = Todo.objects.get(api_id=1).uuid
+
+        sync_external_todo_data(URL, batch_size=1)
+
+        self.assertEqual(TodoUser.objects.get(id=1).avatar, 4)
+        self.assertTrue(TodoUser.objects.filter(id=2).exists())
+        self.assertEqual(Todo.objects.filter(user_id=2).count(), 1)
+        # Upserts keep the existing primary key.
+        self.assertEqual(Todo.objects.get(api_id=1).uuid, original_uuid)
+
+    def test_not_modified_costs_no_writes(self, mock_fetch: MagicMock) -> None:
+        SyncState.objects.create(source=URL, etag='"v1"', last_modified="lm")
+        mock_fetch.return_value = (None, '"v1"', "lm")
+
+        with self.assertNumQueries(1):
+            result = sync_external_todo_data(URL)
+
+        self.assertTrue(result.not_modified)
+        mock_fetch.assert_called_once_with(URL, etag='"v1"', last_modified="lm")
+
+    def test_stores_validators_for_next_sync(self, mock_fetch: MagicMock) -> None:
+        mock_fetch.return_value = (
+            self.payload,
+            '"v2"',
+            "Wed, 12 Feb 2025 10:00:00 GMT",
+        )
+
+        sync_external_todo_data(URL)
+        sync_external_todo_data(URL)
+
+        state = SyncState.objects.get(source=URL)
+        self.assertEqual(state.etag, '"v2"')
+        self.assertIsNotNone(state.synced_at)
+        mock_fetch.assert_called_with(
+            URL, etag='"v2"', last_modified="Wed, 12 Feb 2025 10:00:00 GMT"
+        )
+
+    def test_full_sync_ignores_validators(self, mock_fetch: MagicMock) -> None:
+        SyncState.objects.create(source=URL, etag='"v1"')
+        mock_fetch.return_value = (self.payload, '"v1"', "")
+
+        sync_external_todo_data(URL, conditional=False)
+
+        mock_fetch.assert_called_once_with(URL, etag="", last_modified="")
+
+    @patch("todos.helpers.todo_sync.config", return_value=URL)
+    def test_sync_command(self, mock_config: MagicMock, mock_fetch: MagicMock) -> None:
+        mock_fetch.return_value = (self.payload, "", "")
+        out = StringIO()
+
+        call_command("sync_todos", stdout=out)
+
+        self.assertIn("2 created, 1 updated, 1 unchanged", out.getvalue())
+
+
+@skipUnlessDBFeature("has_select_for_update")
+@patch("todos.helpers.todo_sync.fetch_todos_if_changed")
+class ConcurrentSyncTests(TransactionTestCase):
+    """A toggle racing a sync must not be overwritten with stale upstream state."""
+
+    def test_toggle_during_sync_waits_for_the_upsert(
+        self, mock_fetch: MagicMock
+    ) -> None:
+        TodoUser.objects.create(id=1, avatar=4)
+        todo = Todo.objects.create(api_id=1, title="Old", completed=False, user_id=1)
+        mock_fetch.return_value = (
+            [{"userId": 1, "id": 1, "title": "Renamed", "completed": True}],
+            "",
+            "",
+        )
+        toggler = threading.Thread(
+            target=lambda: (Todo.toggle_completed(todo.uuid), connection.close())
+        )
+
+        def toggle_between_diff_and_upsert(*args, **kwargs) -> None:
+            toggler.start()
+            toggler.join(timeout=0.5)
+            # The chunk's rows are locked, so the toggle cannot commit yet.
+            self.assertTrue(toggler.is_alive())
+            store_todo_users(*args, **kwargs)
+
+        with patch(
+            "todos.helpers.todo_sync.store_todo_users",
+            side_effect=toggle_between_diff_and_upsert,
+        ):
+            sync_external_todo_data(URL)
+        toggler.join()
+
+        todo.refresh_from_db()
+        self.assertEqual(todo.title, "Renamed")
+        # The toggle applied on top of the synced state.
+        self.assertFalse(todo.completed)
+        self.assertEqual(TodoCounter.snapshot().completed, 0)
+        self.assertEqual(TodoUser.rebuild_counts(), 0)
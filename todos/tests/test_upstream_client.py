@@ -0,0 +1,120 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import SimpleTestCase, override_settings
+
+from todos.helpers import fetch_todos_from_api
+from todos.helpers.upstream_client import get_upstream_client, reset_upstream_clients
+
+PAYLOAD = json.dumps([{"userId": 1, "id": 1, "title": "Todo", "completed": False}])
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Serve a fixed todo payload over HTTP/1.1, recording client connections."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        with self.server.lock:
+            self.server.connections.add(self.client_address)
+        body = PAYLOAD.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+class UpstreamClientTests(SimpleTestCase):
+    """Test suite for the shared, pooled upstream client."""
+
+    def setUp(self) -> None:
+        reset_upstream_clients()
+        self.addCleanup(reset_upstream_clients)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+        self.server.connections = set()
+        self.server.lock = threading.Lock()
+        self.server.daemon_threads = True
+        thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/todos"
+
+    def test_client_is_shared_per_retry_policy(self) -> None:
+        client = get_upstream_client()
+        self.assertIs(get_upstream_client(), client)
+        self.assertIs(get_upstream_client(3, 0.3, [500, 502, 503, 504]), client)
+        self.assertIsNot(get_upstream_client(retries=1), client)
+
+    @override_settings(
+        UPSTREAM_POOL_CONNECTIONS=2,
+        UPSTREAM_POOL_MAXSIZE=5,
+        UPSTREAM_POOL_BLOCK=True,
+        UPSTREAM_CONNECT_TIMEOUT=1.5,
+        UPSTREAM_READ_TIMEOUT=7.0,
+    )
+    def test_pool_and_timeouts_come_from_settings(self) -> None:
+        client = get_upstream_client()
+        adapter = client.session.get_adapter(self.url)
+
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 5)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(client.timeout, (1.5, 7.0))
+
+    def test_sequential_fetches_reuse_one_connection(self) -> None:
+        for _ in range(5):
+            self.assertEqual(fetch_todos_from_api(self.url), json.loads(PAYLOAD))
+
+        self.assertEqual(len(self.server.connections), 1)
+
+    @override_settings(UPSTREAM_POOL_MAXSIZE=4, UPSTREAM_POOL_BLOCK=True)
+    def test_threads_share_a_bounded_pool(self) -> None:
+        errors = []
+
+        def worker() -> None:
+            try:
+                for _ in range(5):
+                    fetch_todos_from_api(self.url)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(self.server.connections), 4)
+
+    def test_forked_child_gets_its_own_client(self) -> None:
+        parent_client = get_upstream_client()
+        fetch_todos_from_api(self.url)
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            try:
+                child_client = get_upstream_client()
+                ok = child_client is not parent_client
+                ok = ok and fetch_todos_from_api(self.url) == json.loads(PAYLOAD)
+            except Exception:
+                ok = False
+            os._exit(0 if ok else 1)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        self.assertIs(get_upstream_client(), parent_client)
+        # The child opened its own connection instead of borrowing the parent's.
+        self.assertEqual(len(self.server.connections), 2)
@@ -2,13 +2,18 @@ import json
 import uuid
 from unittest.mock import patch
 
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
-from todos.models import Todo
+from todos.helpers import encode_cursor
+from todos.models import Todo, TodoCounter, TodoUser
+from todos.tests import TodoUsersMixin
+from todos.views import MAX_BATCH_SIZE
 
 
-class TodoListViewTest(TestCase):
+class TodoListViewTest(TodoUsersMixin, TestCase):
     def setUp(self):
         self.url = reverse("todo_list")
 
@@ -80,7 +85,7 @@ class TodoListViewTest(TestCase):
         response = self.client.get(self.url, {"filter": "all"})
         self.assertEqual(response.status_code, 200)
         todos = response.context["todos"]
-        self.assertEqual(todos.count(), 2)
+        self.assertEqual(len(todos), 2)
 
     @patch("todos.views.get_external_todo_data")
     def test_context_data_includes_extra_information(self, mock_get_external) -> None:
@@ -127,7 +132,7 @@ class TodoListViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         # Check first page has 20 items
         todos_on_first_page = response.context["todos"]
-        self.assertEqual(todos_on_first_page.count(), 20)
+        self.assertEqual(len(todos_on_first_page), 20)
         # Check pagination is active
         self.assertTrue(response.context["is_paginated"])
 
@@ -136,6 +141,99 @@ class TodoListViewTest(TestCase):
         todos_on_second_page = response_page_2.context["todos"]
         self.assertEqual(todos_on_second_page.count(), 5)
 
+    def test_legacy_page_with_next_page_links_a_cursor(self) -> None:
+        """
+        A `?page=N` page that is not the last one hands over to the cursor.
+        """
+        for i in range(45):
+            Todo.objects.create(api_id=i, title=f"Todo {i}", completed=False, user_id=1)
+
+        response = self.client.get(self.url, {"page": 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["next_cursor"], encode_cursor(39))
+        self.assertEqual(len(response.context["todos"]), 20)
+
+    def test_cursor_pagination(self) -> None:
+        """
+        Test that "Load More" pages seek on api_id using the opaque cursor.
+
+        - Creates 45 Todo objects.
+        - Follows `next_cursor` through three pages of 20, 20 and 5 items.
+        - Verifies that the last page has no cursor and no rows repeat.
+        """
+        for i in range(45):
+            Todo.objects.create(api_id=i, title=f"Todo {i}", completed=False, user_id=1)
+
+        seen = []
+        cursor = None
+        sizes = []
+        for _ in range(3):
+            params = {"after": cursor} if cursor else {}
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 200)
+            todos = response.context["todos"]
+            sizes.append(len(todos))
+            seen.extend(todo.api_id for todo in todos)
+            cursor = response.context["next_cursor"]
+
+        self.assertEqual(sizes, [20, 20, 5])
+        self.assertIsNone(cursor)
+        self.assertEqual(seen, list(range(45)))
+
+    def test_cursor_pagination_respects_filter(self) -> None:
+        """
+        Test that the cursor seeks within the active filter.
+        """
+        for i in range(50):
+            Todo.objects.create(
+                api_id=i, title=f"Todo {i}", completed=i % 2 == 0, user_id=1
+            )
+
+        response = self.client.get(self.url, {"filter": "complete"})
+        cursor = response.context["next_cursor"]
+        self.assertIsNotNone(cursor)
+
+        response = self.client.get(self.url, {"filter": "complete", "after": cursor})
+        todos = response.context["todos"]
+        self.assertEqual([todo.api_id for todo in todos], list(range(40, 50, 2)))
+        self.assertIsNone(response.context["next_cursor"])
+
+    def test_cursor_pagination_skips_count_query(self) -> None:
+        """
+        Test that cursor pages fetch page_size + 1 rows instead of counting.
+        """
+        for i in range(25):
+            Todo.objects.create(api_id=i, title=f"Todo {i}", completed=False, user_id=1)
+
+        with self.assertNumQueries(2):
+            # One counter lookup and one page fetch, joined to the users.
+            response = self.client.get(self.url)
+        self.assertContains(response, 'data-next-cursor="')
+        self.assertContains(response, "images/3.png", count=20)
+
+    def test_malformed_cursor_starts_from_first_page(self) -> None:
+        """
+        Test that an invalid cursor falls back to the first page.
+        """
+        Todo.objects.create(api_id=1, title="Todo 1", completed=False, user_id=1)
+
+        response = self.client.get(self.url, {"after": "not-a-cursor!"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([todo.api_id for todo in response.context["todos"]], [1])
+
+    def test_out_of_range_cursor_starts_from_first_page(self) -> None:
+        """
+        Test that a cursor beyond the 64-bit integer range (or negative) falls
+        back to the first page instead of overflowing the query parameter.
+        """
+        Todo.objects.create(api_id=1, title="Todo 1", completed=False, user_id=1)
+
+        for after in (int("9" * 30), 2**63, -1):
+            response = self.client.get(self.url, {"after": encode_cursor(after)})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual([todo.api_id for todo in response.context["todos"]], [1])
+
     def test_default_ordering(self) -> None:
         """
         Test that the view orders the Todo items by their 'api_id' in ascending order.
@@ -170,7 +268,7 @@ class TodoListViewTest(TestCase):
 
         todos = response.context["todos"]
         # Should return all todos if the filter is invalid
-        self.assertEqual(todos.count(), 2)
+        self.assertEqual(len(todos), 2)
         # Also confirm that the current_filter in context is "all"
         self.assertEqual(response.context["current_filter"], "all")
 
@@ -203,11 +301,350 @@ class TodoListViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         todos = response.context["todos"]
         # Should get all 3
-        self.assertEqual(todos.count(), 3)
+        self.assertEqual(len(todos), 3)
         self.assertEqual(response.context["current_filter"], "all")
 
 
-class ToggleTodoCompletionTests(TestCase):
+class TodoListConditionalGetTests(TodoUsersMixin, TestCase):
+    """Test suite for ETag handling on the todo list page."""
+
+    def setUp(self) -> None:
+        self.url = reverse("todo_list")
+        self.todo = Todo.objects.create(
+            api_id=1, title="Todo 1", completed=False, user_id=1
+        )
+
+    def test_response_carries_validators(self) -> None:
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["ETag"].startswith('"'))
+        self.assertNotIn("Last-Modified", response.headers)
+        self.assertIn("no-cache", response.headers["Cache-Control"])
+
+    def test_matching_etag_returns_304_after_one_query(self) -> None:
+        """
+        A matching If-None-Match is answered from the counter row alone,
+        without running the list query or rendering the template.
+        """
+        etag = self.client.get(self.url).headers["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+
+    def test_if_modified_since_alone_is_not_answered_with_304(self) -> None:
+        """
+        Two writes in the same second share a timestamp, so only an ETag match
+        may skip the page.
+        """
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT"
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_depends_on_filter_and_cursor(self) -> None:
+        etags = {
+            self.client.get(self.url, params).headers["ETag"]
+            for params in (
+                {},
+                {"filter": "todo"},
+                {"filter": "complete"},
+                {"after": "MQ"},
+            )
+        }
+        self.assertEqual(len(etags), 4)
+        self.assertEqual(
+            self.client.get(self.url, {"filter": "bogus"}).headers["ETag"],
+            self.client.get(self.url).headers["ETag"],
+        )
+
+    def test_writes_invalidate_etag(self) -> None:
+        """
+        Toggles and edits that do not change the counts both produce a new ETag.
+        """
+        etag = self.client.get(self.url).headers["ETag"]
+
+        Todo.toggle_completed(self.todo.uuid)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["ETag"]
+
+        todo = Todo.objects.get(pk=self.todo.pk)
+        todo.title = "Renamed"
+        todo.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Renamed")
+
+    def test_avatar_change_invalidates_etag(self) -> None:
+        """
+        Avatars live on TodoUser, but changing one still refreshes the page.
+        """
+        etag = self.client.get(self.url).headers["ETag"]
+
+        user = TodoUser.objects.get(id=1)
+        user.avatar = 6
+        user.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "images/6.png")
+
+    @patch("todos.views.get_external_todo_data")
+    def test_empty_table_is_not_validated(self, mock_get_external) -> None:
+        Todo.objects.all().delete()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response.headers)
+
+
+class TodoFragmentViewTest(TodoUsersMixin, TestCase):
+    """Test suite for the "Load More" fragment endpoint."""
+
+    def setUp(self) -> None:
+        self.url = reverse("todo_fragment")
+        for i in range(25):
+            Todo.objects.create(
+                api_id=i, title=f"Todo {i}", completed=i % 2 == 0, user_id=1
+            )
+
+    def test_renders_only_rows_and_next_page_marker(self) -> None:
+        """
+        The fragment contains task rows and the next-page marker, but none of
+        the page chrome or counters.
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
+        self.assertContains(response, 'class="task"', count=20)
+        self.assertContains(response, 'id="next-page"')
+        self.assertNotContains(response, "<html")
+        self.assertNotContains(response, "Task list")
+        self.assertNotIn("total_todos", response.context)
+        self.assertEqual(
+            response.context["next_cursor"],
+            self.client.get(reverse("todo_list")).context["next_cursor"],
+        )
+
+    def test_follows_cursor_and_filter_with_a_single_query(self) -> None:
+        """
+        A "Load More" click costs one page query: no counters, no seeding check.
+        """
+        first = self.client.get(self.url, {"filter": "todo"})
+        self.assertIsNone(first.context["next_cursor"])
+
+        cursor = self.client.get(self.url).context["next_cursor"]
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"after": cursor})
+        api_ids = [todo.api_id for todo in response.context["todos"]]
+        self.assertEqual(api_ids, list(range(20, 25)))
+        self.assertContains(response, 'data-next-cursor=""')
+
+    @patch("todos.views.get_external_todo_data")
+    def test_does_not_seed_empty_table(self, mock_get_external) -> None:
+        Todo.objects.all().delete()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        mock_get_external.assert_not_called()
+
+
+class TodoSearchTests(TodoUsersMixin, TestCase):
+    """Test suite for the `q` title search."""
+
+    def setUp(self) -> None:
+        self.url = reverse("todo_list")
+        for i in range(40):
+            Todo.objects.create(
+                api_id=i,
+                title=f"Buy milk {i}" if i % 3 == 0 else f"Walk the dog {i}",
+                completed=i % 2 == 0,
+                user_id=1,
+            )
+
+    def api_ids(self, response) -> list:
+        return [todo.api_id for todo in response.context["todos"]]
+
+    def test_matches_substring_ignoring_case(self) -> None:
+        response = self.client.get(self.url, {"q": "  MILK 1"})
+
+        self.assertEqual(self.api_ids(response), [12, 15, 18])
+        self.assertEqual(response.context["search_query"], "MILK 1")
+        self.assertContains(response, 'value="MILK 1"')
+        # The counters in the tabs stay the totals of the whole list.
+        self.assertEqual(response.context["total_todos"], 40)
+
+    def test_combines_with_filter_and_cursor_pages(self) -> None:
+        response = self.client.get(self.url, {"q": "milk", "filter": "todo"})
+        expected = [i for i in range(40) if i % 3 == 0 and i % 2]
+        self.assertEqual(self.api_ids(response), expected)
+        self.assertIsNone(response.context["next_cursor"])
+
+        first = self.client.get(self.url, {"q": "dog"})
+        self.assertEqual(len(self.api_ids(first)), 20)
+        more = self.client.get(
+            reverse("todo_fragment"),
+            {"q": "dog", "after": first.context["next_cursor"]},
+        )
+        self.assertEqual(
+            self.api_ids(first) + self.api_ids(more), [i for i in range(40) if i % 3]
+        )
+
+    def test_nul_characters_are_dropped(self) -> None:
+        response = self.client.get(self.url, {"q": "mi\x00lk 1"})
+        self.assertEqual(self.api_ids(response), [12, 15, 18])
+
+        response = self.client.get(self.url, {"q": "\x00"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["search_query"], "")
+        self.assertEqual(len(self.api_ids(response)), 20)
+
+    def test_legacy_page_honours_search(self) -> None:
+        response = self.client.get(self.url, {"q": "milk", "page": 1})
+        self.assertEqual(self.api_ids(response), list(range(0, 40, 3)))
+
+    def test_tabs_keep_the_search(self) -> None:
+        response = self.client.get(self.url, {"q": "milk & eggs"})
+
+        self.assertContains(response, 'href="?filter=todo&amp;q=milk%20%26%20eggs"')
+        self.assertContains(response, 'class="empty"')
+
+    def test_search_is_part_of_the_etag(self) -> None:
+        plain = self.client.get(self.url).headers["ETag"]
+        searched = self.client.get(self.url, {"q": "milk"}).headers["ETag"]
+        self.assertNotEqual(plain, searched)
+
+        # A cached search page is not served for another search.
+        response = self.client.get(self.url, {"q": "dog"})
+        self.assertNotIn(0, self.api_ids(response))
+
+
+class TodoUserFilterTests(TodoUsersMixin, TestCase):
+    """Test suite for the `user` filter of the list view."""
+
+    def setUp(self) -> None:
+        self.url = reverse("todo_list")
+        for i in range(30):
+            Todo.objects.create(
+                api_id=i, title=f"Todo {i}", completed=i % 2 == 0, user_id=i % 3
+            )
+
+    def api_ids(self, response) -> list:
+        return [todo.api_id for todo in response.context["todos"]]
+
+    def test_shows_only_the_users_todos_and_counts(self) -> None:
+        response = self.client.get(self.url, {"user": 1, "filter": "todo"})
+
+        self.assertEqual(self.api_ids(response), [1, 7, 13, 19, 25])
+        self.assertEqual(response.context["current_user"], 1)
+        self.assertEqual(
+            (
+                response.context["total_todos"],
+                response.context["completed_todos"],
+                response.context["uncompleted_todos"],
+            ),
+            (10, 5, 5),
+        )
+        self.assertContains(response, 'href="?filter=complete&amp;user=1"')
+        self.assertContains(response, 'name="user" value="1"')
+
+    def test_combines_with_cursor_pages_and_search(self) -> None:
+        for i in range(30, 60):
+            Todo.objects.create(api_id=i, title=f"Todo {i}", user_id=2)
+        first = self.client.get(self.url, {"user": 2})
+        more = self.client.get(
+            reverse("todo_fragment"),
+            {"user": 2, "after": first.context["next_cursor"]},
+        )
+        self.assertEqual(
+            self.api_ids(first) + self.api_ids(more),
+            [i for i in range(30) if i % 3 == 2] + list(range(30, 60)),
+        )
+
+        searched = self.client.get(self.url, {"user": 2, "q": "todo 2"})
+        self.assertEqual(self.api_ids(searched), [2, 20, 23, 26, 29])
+
+    def test_invalid_user_is_ignored(self) -> None:
+        plain = self.client.get(self.url)
+        self.assertIsNone(plain.context["current_user"])
+
+        for value in ("", "abc", "-1", "1.5", "²", str(2**31)):
+            with self.subTest(user=value):
+                response = self.client.get(self.url, {"user": value})
+                # The same page as without the parameter, from the page cache.
+                self.assertEqual(response.headers["ETag"], plain.headers["ETag"])
+                self.assertEqual(response.headers["X-Cache"], "HIT")
+
+    def test_unknown_user_has_no_todos(self) -> None:
+        response = self.client.get(self.url, {"user": 99})
+
+        self.assertEqual(self.api_ids(response), [])
+        self.assertEqual(response.context["total_todos"], 0)
+
+    def test_user_is_part_of_the_etag(self) -> None:
+        first = self.client.get(self.url, {"user": 0})
+        second = self.client.get(self.url, {"user": 1})
+
+        self.assertNotEqual(first.headers["ETag"], second.headers["ETag"])
+        # A cached page of one user is not served for another.
+        self.assertEqual(second.headers["X-Cache"], "MISS")
+        self.assertNotIn(0, self.api_ids(second))
+
+
+class TodoUserListViewTests(TodoUsersMixin, TestCase):
+    """Test suite for the per-user summary page."""
+
+    def setUp(self) -> None:
+        self.url = reverse("todo_users")
+        for i in range(12):
+            Todo.objects.create(
+                api_id=i, title=f"Todo {i}", completed=i < 5, user_id=i % 3
+            )
+
+    def test_lists_maintained_counts_per_user(self) -> None:
+        with self.assertNumQueries(3):
+            # Counter row, the paginator's COUNT and one page of users.
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        counts = [
+            (user.id, user.total, user.completed, user.uncompleted)
+            for user in response.context["users"]
+        ]
+        self.assertEqual(
+            counts,
+            [(0, 4, 2, 2), (1, 4, 2, 2), (2, 4, 1, 3), (3, 0, 0, 0), (4, 0, 0, 0)],
+        )
+        self.assertEqual(response.context["total_todos"], 12)
+        self.assertContains(response, f'href="{reverse("todo_list")}?user=2"')
+        self.assertContains(response, "images/3.png", count=5)
+
+    def test_counts_follow_toggles(self) -> None:
+        Todo.toggle_completed(Todo.objects.get(api_id=11).uuid)
+
+        response = self.client.get(self.url)
+
+        user = next(user for user in response.context["users"] if user.id == 2)
+        self.assertEqual((user.total, user.completed), (4, 2))
+
+    def test_conditional_get_and_pagination(self) -> None:
+        first = self.client.get(self.url)
+        response = self.client.get(
+            self.url, headers={"If-None-Match": first.headers["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+
+        with patch("todos.views.TodoUserListView.paginate_by", 2):
+            response = self.client.get(self.url, {"page": 3})
+        self.assertEqual([user.id for user in response.context["users"]], [4])
+        self.assertContains(response, 'href="?page=2"')
+        self.assertNotEqual(response.headers["ETag"], first.headers["ETag"])
+
+
+class ToggleTodoCompletionTests(TodoUsersMixin, TestCase):
     """Test suite for the toggle_todo_completion view."""
 
     def setUp(self) -> None:
@@ -311,11 +748,11 @@ class ToggleTodoCompletionTests(TestCase):
     def test_unexpected_exception(self, mock_logger) -> None:
         """
         Simulate an unexpected exception inside the view (e.g., DB error).
-        We'll patch the 'Todo.objects.get' to raise an Exception,
+        We'll patch 'Todo.toggle_completed' to raise an Exception,
         then verify we handle it gracefully.
         """
         with patch(
-            "todos.models.Todo.objects.get",
+            "todos.models.Todo.toggle_completed",
             side_effect=Exception("Something went wrong"),
         ):
             payload = {"todo_id": str(self.todo.uuid)}
@@ -331,3 +768,119 @@ class ToggleTodoCompletionTests(TestCase):
 
             # Ensure our logger.exception was called.
             mock_logger.assert_called_once()
+
+
+class ToggleTodosBatchTests(TodoUsersMixin, TestCase):
+    """Test suite for the toggle_todos_batch view."""
+
+    def setUp(self) -> None:
+        self.url = reverse("toggle_todos_batch")
+        self.todos = [
+            Todo.objects.create(
+                api_id=i, title=f"Todo {i}", completed=i % 2 == 1, user_id=1
+            )
+            for i in range(4)
+        ]
+
+    def post(self, payload):
+        return self.client.post(
+            self.url, data=json.dumps(payload), content_type="application/json"
+        )
+
+    def test_batch_applies_explicit_states_and_toggles(self) -> None:
+        """
+        Explicit targets are set, items without `completed` are toggled, and
+        results come back in request order.
+        """
+        items = [
+            {"todo_id": str(self.todos[0].uuid), "completed": True},
+            {"todo_id": str(self.todos[1].uuid), "completed": False},
+            {"todo_id": str(self.todos[2].uuid)},
+            {"todo_id": str(self.todos[3].uuid), "completed": True},
+        ]
+        response = self.post({"items": items})
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertTrue(data["success"])
+        self.assertEqual(
+            [(r["todo_id"], r["completed"]) for r in data["results"]],
+            [
+                (item["todo_id"], state)
+                for item, state in zip(items, [True, False, True, True])
+            ],
+        )
+        states = dict(Todo.objects.values_list("api_id", "completed"))
+        self.assertEqual(states, {0: True, 1: False, 2: True, 3: True})
+
+    def test_batch_uses_bounded_number_of_queries(self) -> None:
+        """
+        However many items, the batch costs one locked SELECT, at most two
+        UPDATEs, one counter UPDATE and one UPDATE of the per-user counts
+        (plus the transaction savepoints).
+        """
+        for i in range(4, 100):
+            Todo.objects.create(api_id=i, title=f"Todo {i}", completed=False, user_id=1)
+        items = [
+            (
+                {"todo_id": str(uuid_), "completed": True}
+                if n % 3
+                else {"todo_id": str(uuid_)}
+            )
+            for n, uuid_ in enumerate(Todo.objects.values_list("uuid", flat=True))
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.post({"items": items})
+        self.assertEqual(response.status_code, 200)
+
+        statements = [
+            q["sql"] for q in ctx.captured_queries if "SAVEPOINT" not in q["sql"]
+        ]
+        self.assertLessEqual(len(statements), 5)
+        completed = Todo.objects.filter(completed=True).count()
+        self.assertEqual(TodoCounter.snapshot().completed, completed)
+        self.assertEqual(TodoUser.objects.get(id=1).completed, completed)
+
+    def test_per_item_errors(self) -> None:
+        items = [
+            {"todo_id": str(uuid.uuid4())},
+            {"todo_id": "not-a-uuid"},
+            {"completed": True},
+            {"todo_id": str(self.todos[0].uuid), "completed": "yes"},
+            {"todo_id": str(self.todos[0].uuid)},
+            {"todo_id": str(self.todos[0].uuid)},
+        ]
+        response = self.post({"items": items})
+        self.assertEqual(response.status_code, 200)
+
+        results = response.json()["results"]
+        self.assertEqual(
+            [r.get("error") for r in results],
+            [
+                "Todo not found",
+                "Invalid todo_id",
+                "Missing todo_id",
+                "Invalid completed value",
+                None,
+                "Duplicate todo_id",
+            ],
+        )
+        self.assertTrue(results[4]["completed"])
+
+    def test_batch_size_cap(self) -> None:
+        items = [{"todo_id": str(uuid.uuid4())} for _ in range(MAX_BATCH_SIZE + 1)]
+        response = self.post({"items": items})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()["success"])
+
+    def test_missing_items_and_invalid_json(self) -> None:
+        self.assertEqual(self.post({}).status_code, 400)
+        response = self.client.post(
+            self.url, data="not json", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["error"], "Invalid JSON")
+
+    def test_method_not_allowed(self) -> None:
+        self.assertEqual(self.client.get(self.url).status_code, 405)
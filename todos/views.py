@@ -1,35 +1,194 @@
 import json
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
 from django.db.models import QuerySet
-from django.http import HttpRequest, JsonResponse
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotAllowed,
+    JsonResponse,
+)
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.crypto import md5
+from django.utils.http import quote_etag
 from django.views.decorators.http import require_http_methods
 from django.views.generic import ListView
 
-from todos.helpers import get_external_todo_data
-from todos.models import Todo
+from todos.helpers import (
+    CursorPage,
+    aget_external_todo_data,
+    apaginate_by_cursor,
+    aseed_todos_if_empty,
+    decode_cursor,
+    encode_cursor,
+    get_cached_page,
+    get_external_todo_data,
+    page_cache_enabled,
+    page_cache_key,
+    paginate_by_cursor,
+    seed_todos_if_empty,
+    store_page,
+)
+from todos.instrumentation import TimedTemplateResponse, query_budget
+from todos.metrics import TOGGLES, render_metrics
+from todos.models import Todo, TodoCounter, TodoUser
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on items accepted by `toggle_todos_batch` in one request.
+MAX_BATCH_SIZE = 500
+# Largest `?user=` id; user ids are 32-bit integer columns.
+MAX_USER_ID = 2**31 - 1
 
-class TodoListView(ListView):
+
+class VersionedPageMixin:
+    """
+    Conditional GET and page caching for list views, keyed on the
+    `TodoCounter` version.
+
+    Every write to the todos moves the counter version, so a page rendered
+    for the same version and request parameters (see `get_etag`) is still
+    current: it is answered with a 304 or served from the page cache after a
+    single counter lookup.
+
+    No `Last-Modified` is sent: the counter's timestamp has one-second
+    granularity, so two writes in the same second would leave an
+    `If-Modified-Since` client with a stale page.
+    """
+
+    template_name: str
+    conditional = True
+    # GET parameters the page depends on; the default `get_etag` hashes their
+    # raw values.
+    etag_params: Tuple[str, ...] = ()
+
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """
+        Answer conditional requests from the counter row, then serve the page
+        from the page cache or render it as usual.
+
+        Nothing is validated while the table is empty, so the seeding and
+        "warming up" responses are never cached by clients.
+        """
+        if not self.conditional:
+            return super().get(request, *args, **kwargs)
+
+        self.counters = TodoCounter.snapshot()
+        if not self.counters.total:
+            return super().get(request, *args, **kwargs)
+
+        etag = self.get_etag()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = self.get_page_response(etag, *args, **kwargs)
+        return self.set_validators(response, etag)
+
+    def set_validators(self, response: HttpResponse, etag: str) -> HttpResponse:
+        """
+        Add the `ETag` validator and require revalidation.
+        """
+        response.headers["ETag"] = etag
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    def get_page_response(
+        self, version_key: str, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        """
+        Return the rendered page for `version_key`, from the cache if possible.
+
+        Args:
+            version_key (str): The page's ETag, which already covers the data
+                version and every request parameter the page depends on.
+
+        Returns:
+            HttpResponse: The cached or freshly rendered page.
+        """
+        if not page_cache_enabled():
+            return super().get(self.request, *args, **kwargs)
+
+        key = page_cache_key(self.template_name, version_key)
+        content = get_cached_page(key)
+        if content is not None:
+            response = HttpResponse(content)
+            response.headers["X-Cache"] = "HIT"
+            return response
+
+        response = super().get(self.request, *args, **kwargs)
+        response.render()
+        if response.status_code == 200:
+            store_page(key, response.content)
+        response.headers["X-Cache"] = "MISS"
+        return response
+
+    def get_etag(self) -> str:
+        """
+        Build a quoted ETag for the current data version and request parameters.
+
+        Hashes the values of `etag_params`; override it to normalise the
+        parameters first.
+
+        Returns:
+            str: The validator, e.g. `"3f2a..."`.
+        """
+        return self.version_etag(
+            *(self.request.GET.get(name, "") for name in self.etag_params)
+        )
+
+    def version_etag(self, *parts: Any) -> str:
+        """
+        Hash the counter version and `parts` into a quoted ETag.
+
+        Args:
+            *parts (Any): The request parameters the page depends on.
+
+        Returns:
+            str: The validator, e.g. `"3f2a..."`.
+        """
+        counters = self.counters
+        key = "|".join(
+            str(part)
+            for part in (
+                counters.version,
+                counters.updated_at.isoformat(),
+                counters.total,
+                counters.completed,
+                *parts,
+            )
+        )
+        return quote_etag(md5(key.encode(), usedforsecurity=False).hexdigest())
+
+
+class TodoListView(VersionedPageMixin, ListView):
     """
     A class-based ListView for displaying Todo items.
 
     This view performs the following tasks:
     1. Retrieves a list of Todo objects from the database.
     2. If no Todo objects exist in the database, it attempts to fetch
-       data from an external API and store it.
+       data from an external API and store it, coordinating with other
+       workers so the upstream is only fetched once.
     3. Allows filtering of Todo items based on the 'filter' GET parameter.
     4. Adds additional metadata to the context, such as the total number of todos,
-       and counts of completed/uncompleted tasks.
+       and counts of completed/uncompleted tasks, read from the maintained
+       `TodoCounter` row rather than counted per request.
+    5. Paginates with a keyset cursor on `api_id` (`?after=<cursor>`), so deep
+       "Load More" pages cost the same as the first one. The legacy `?page=N`
+       parameter is still honoured through Django's OFFSET paginator.
 
     Additional Context Variables:
         - `total_todos`: Total number of Todo items.
         - `completed_todos`: Count of completed Todo items.
         - `uncompleted_todos`: Count of incomplete Todo items.
         - `current_filter`: The active filter applied to the todos list.
+        - `search_query`: The active `q` search, or an empty string.
+        - `current_user`: The active `user` filter, or None.
+        - `next_cursor`: Opaque cursor for the next page, or None on the last page.
+        - `warming_up`: True while another worker is still seeding the table.
 
     URL Parameters:
         - `filter`: (optional) A query parameter used to filter todos.
@@ -37,37 +196,123 @@ class TodoListView(ListView):
           - `"todo"`: Returns only uncompleted todos.
           - `"complete"`: Returns only completed todos.
           - Any other value defaults to `"all"`.
+        - `after`: (optional) Opaque cursor returned as `next_cursor` by the
+          previous page. Malformed cursors restart from the first page.
+        - `page`: (optional) Legacy page number; uses OFFSET pagination.
+        - `q`: (optional) Case-insensitive substring of the title. Combines
+          with `filter` and both pagination modes. On PostgreSQL with
+          pg_trgm it is served by a trigram index (migration 0008).
+        - `user`: (optional) Only the todos of this user id; other values are
+          ignored. Served by the `(user, api_id)` and `(user, completed,
+          api_id)` indexes, and the tab counts become the user's maintained
+          counts.
+
+    Conditional GET:
+        Responses carry an `ETag` built from the `TodoCounter` version, counts
+        and the requested filter/search/user/cursor/page. A matching
+        `If-None-Match` gets a 304 after that single counter lookup, before
+        the list query runs or the template is rendered.
+
+    Page cache:
+        Rendered bodies are cached under the same version key (see
+        `todos.helpers.page_cache`), so repeat requests for an unchanged page
+        skip the list query and the render. Every toggle or sync bumps the
+        counter version and thereby moves all pages to fresh keys. The
+        `X-Cache` header reports `HIT` or `MISS`.
     """
 
     model = Todo
+    # Each row shows its user's avatar; load it in the same query.
+    queryset = Todo.objects.select_related("user")
     template_name = "todos.html"
+    response_class = TimedTemplateResponse
     context_object_name = "todos"
     paginate_by = 20
     ordering = ["api_id"]
+    include_counters = True
+    # Counter row and page; `?user=` adds the user's counts and a legacy
+    # `?page=` the paginator's COUNT.
+    query_budget = 4
+
+    def get_etag(self) -> str:
+        """
+        Build a quoted ETag for the current data version and request parameters.
+
+        Returns:
+            str: The validator, e.g. `"3f2a..."`.
+        """
+        filter_param = self.request.GET.get("filter", "all")
+        if filter_param not in {"todo", "complete", "all"}:
+            filter_param = "all"
+        return self.version_etag(
+            filter_param,
+            self.get_search_query(),
+            self.get_user_filter(),
+            self.request.GET.get("after", ""),
+            self.request.GET.get(self.page_kwarg, ""),
+        )
 
     def get_queryset(self) -> QuerySet[Todo]:
         """
         Retrieve and filter Todo items from the database.
 
-        If the database is empty:
-        - Attempts to fetch and populate Todo items from an external API.
+        If the database is empty (according to the maintained counters):
+        - Attempts to fetch and populate Todo items from an external API. Only
+          one worker seeds at a time (see `seed_todos_if_empty`); the others
+          wait a bounded time and then render a "warming up" page.
         - If an exception occurs during the external API call, it logs the error
           and proceeds without crashing.
 
-        Filtering Logic:
-        - If a valid `filter` query parameter is provided, filters the queryset accordingly.
-        - If an invalid filter is provided, defaults to `"all"` (returns all todos).
+        Filtering is applied by `filter_queryset`.
 
         Returns:
             QuerySet[Todo]: A queryset containing Todo objects based on the applied filter.
         """
         qs = super().get_queryset()
-        if not qs.exists():
-            try:
-                get_external_todo_data()
-            except Exception as e:
-                logger.exception(f"Error fetching external data: {e}")
+        self.warming_up = False
+        if self.include_counters:
+            self.counters = getattr(self, "counters", None) or TodoCounter.snapshot()
+            if not self.counters.total:
+                self.warming_up = not seed_todos_if_empty(get_external_todo_data)
+                self.counters = TodoCounter.snapshot()
+            user_id = self.get_user_filter()
+            if user_id is not None:
+                self.todo_user = TodoUser.objects.filter(pk=user_id).first()
+
+        return self.filter_queryset(qs)
+
+    def get_search_query(self) -> str:
+        """
+        Return the `q` search term, stripped and cut to the title length.
 
+        NUL characters are dropped: titles cannot contain them, and
+        PostgreSQL rejects them in a query parameter.
+        """
+        max_length = Todo._meta.get_field("title").max_length
+        return self.request.GET.get("q", "").replace("\x00", "").strip()[:max_length]
+
+    def get_user_filter(self) -> Optional[int]:
+        """
+        Return the `user` id to filter by, or None if absent or not an id.
+        """
+        value = self.request.GET.get("user", "")
+        if not (value.isdecimal() and value.isascii()) or int(value) > MAX_USER_ID:
+            return None
+        return int(value)
+
+    def filter_queryset(self, qs: QuerySet[Todo]) -> QuerySet[Todo]:
+        """
+        Apply the `filter`, `q` and `user` query parameters.
+
+        Filtering Logic:
+        - If a valid `filter` query parameter is provided, filters the queryset accordingly.
+        - If an invalid filter is provided, defaults to `"all"` (returns all todos).
+        - A non-empty `q` keeps the todos whose title contains it, ignoring case.
+        - A valid `user` id keeps that user's todos.
+
+        Returns:
+            QuerySet[Todo]: The filtered queryset.
+        """
         filter_param = self.request.GET.get("filter", "all")
 
         filters = {
@@ -81,8 +326,36 @@ class TodoListView(ListView):
 
         qs = filters[filter_param](qs)
 
+        search = self.get_search_query()
+        if search:
+            qs = qs.filter(title__icontains=search)
+
+        user_id = self.get_user_filter()
+        if user_id is not None:
+            qs = qs.filter(user_id=user_id)
+
         return qs
 
+    def paginate_queryset(
+        self, queryset: QuerySet[Todo], page_size: int
+    ) -> Tuple[Optional[Paginator], Any, Any, bool]:
+        """
+        Paginate with a keyset cursor unless a legacy `page` number is given.
+
+        Cursor mode fetches `page_size + 1` rows after the cursor's `api_id`
+        and never runs the paginator's `COUNT(*)`.
+
+        Returns:
+            Tuple[Optional[Paginator], Any, Any, bool]: The same
+            `(paginator, page, object_list, is_paginated)` tuple as `ListView`.
+        """
+        if self.page_kwarg in self.request.GET:
+            return super().paginate_queryset(queryset, page_size)
+
+        after = decode_cursor(self.request.GET.get("after"))
+        page, object_list = paginate_by_cursor(queryset, page_size, after)
+        return None, page, object_list, page.has_next() or page.has_previous()
+
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         """
         Add additional metadata to the template context.
@@ -92,6 +365,13 @@ class TodoListView(ListView):
         - `completed_todos`: Number of completed todos.
         - `uncompleted_todos`: Number of uncompleted todos.
         - `current_filter`: The filter parameter currently applied.
+        - `search_query`: The `q` search currently applied.
+        - `current_user`: The `user` filter currently applied, or None.
+        - `next_cursor`: Cursor for the next page, in both pagination modes.
+
+        The counts come from the `TodoCounter` row loaded in `get_queryset`, so
+        no extra queries are issued for them. With a `user` filter they are
+        that user's counts, from the `TodoUser` row loaded alongside it.
 
         If an invalid filter is detected, it defaults `current_filter` to `"all"`.
 
@@ -100,24 +380,202 @@ class TodoListView(ListView):
         """
         context = super().get_context_data(**kwargs)
 
-        all_todos = Todo.objects.all()
-        context["total_todos"] = all_todos.count()
-        context["completed_todos"] = all_todos.filter(completed=True).count()
-        context["uncompleted_todos"] = all_todos.filter(completed=False).count()
+        context["current_user"] = self.get_user_filter()
+        if self.include_counters:
+            counters = getattr(self, "counters", None) or TodoCounter.snapshot()
+            if context["current_user"] is not None:
+                # A user that does not exist has no todos.
+                counters = getattr(self, "todo_user", None) or TodoUser(
+                    id=context["current_user"]
+                )
+            context["total_todos"] = counters.total
+            context["completed_todos"] = counters.completed
+            context["uncompleted_todos"] = counters.uncompleted
         context["current_filter"] = self.request.GET.get("filter", "all")
+        context["search_query"] = self.get_search_query()
+        context["warming_up"] = getattr(self, "warming_up", False)
 
         if context["current_filter"] not in {"todo", "complete", "all"}:
             context["current_filter"] = "all"
+
+        page = context.get("page_obj")
+        if isinstance(page, CursorPage):
+            context["next_cursor"] = page.next_cursor
+        elif page is not None and page.has_next():
+            # Querysets have no negative indexing; evaluating the page caches
+            # its rows for the template as well.
+            rows = list(page.object_list)
+            context["next_cursor"] = encode_cursor(rows[-1].api_id)
+        else:
+            context["next_cursor"] = None
         return context
 
 
+class TodoFragmentView(TodoListView):
+    """
+    Render only the task rows and next-page marker for "Load More".
+
+    Accepts the same `filter`, `after` and `page` parameters as `TodoListView`
+    but skips the counter lookup, the empty-table seeding check and the page
+    chrome, so each click costs a single page query and a small payload.
+    """
+
+    template_name = "todo_fragment.html"
+    include_counters = False
+    conditional = False
+    query_budget = 2
+
+
+class AsyncTodoListView(TodoListView):
+    """
+    Async version of `TodoListView` for ASGI deployments (`ASYNC_VIEWS=True`).
+
+    Accepts the same parameters and provides the same context, conditional
+    GET handling and page cache. The counters and cursor pages are read with
+    the async ORM, and a cold-start seed downloads through
+    `aget_external_todo_data`, so a slow upstream suspends the request
+    instead of holding a worker thread. Templates render in the
+    thread-sensitive executor, since rendering reads and fills the row cache
+    (and, for legacy `?page=N` requests, runs the OFFSET paginator).
+    """
+
+    async def get(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        self.warming_up = False
+        if not (self.conditional or self.include_counters):
+            return await self.arender_page()
+
+        self.counters = await TodoCounter.asnapshot()
+        if not self.counters.total:
+            if self.include_counters:
+                self.warming_up = not await aseed_todos_if_empty(
+                    aget_external_todo_data
+                )
+                self.counters = await TodoCounter.asnapshot()
+            return await self.arender_page()
+        if not self.conditional:
+            return await self.arender_page()
+
+        etag = self.get_etag()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = await self.aget_page_response(etag)
+        return self.set_validators(response, etag)
+
+    async def aget_page_response(self, version_key: str) -> HttpResponse:
+        """
+        Async version of `get_page_response`.
+        """
+        if not page_cache_enabled():
+            return await self.arender_page()
+
+        key = page_cache_key(self.template_name, version_key)
+        content = await sync_to_async(get_cached_page)(key)
+        if content is not None:
+            response = HttpResponse(content)
+            response.headers["X-Cache"] = "HIT"
+            return response
+
+        response = await self.arender_page()
+        if response.status_code == 200:
+            await sync_to_async(store_page)(key, response.content)
+        response.headers["X-Cache"] = "MISS"
+        return response
+
+    async def arender_page(self) -> HttpResponse:
+        """
+        Fetch the requested page and render the template off the event loop.
+        """
+        user_id = self.get_user_filter()
+        if self.include_counters and user_id is not None:
+            self.todo_user = await TodoUser.objects.filter(pk=user_id).afirst()
+        self.object_list = self.get_queryset()
+        if self.page_kwarg not in self.request.GET:
+            self.cursor_page, _ = await apaginate_by_cursor(
+                self.object_list,
+                self.get_paginate_by(self.object_list),
+                decode_cursor(self.request.GET.get("after")),
+            )
+        # Django's Page evaluates its rows lazily, during rendering, and the
+        # rows themselves go through the (blocking) row cache.
+        return await sync_to_async(self.render_sync_page)()
+
+    def render_sync_page(self) -> HttpResponse:
+        return self.render_to_response(self.get_context_data()).render()
+
+    def get_queryset(self) -> QuerySet[Todo]:
+        # Counters, seeding and the user's counts are loaded asynchronously.
+        return self.filter_queryset(super(TodoListView, self).get_queryset())
+
+    def paginate_queryset(
+        self, queryset: QuerySet[Todo], page_size: int
+    ) -> Tuple[Optional[Paginator], Any, Any, bool]:
+        page = getattr(self, "cursor_page", None)
+        if page is None:
+            return super().paginate_queryset(queryset, page_size)
+        return None, page, page.object_list, page.has_next() or page.has_previous()
+
+
+class AsyncTodoFragmentView(AsyncTodoListView):
+    """
+    Async version of `TodoFragmentView`.
+    """
+
+    template_name = "todo_fragment.html"
+    include_counters = False
+    conditional = False
+    query_budget = 2
+
+
+class TodoUserListView(VersionedPageMixin, ListView):
+    """
+    Summarise every user: their total, completed and pending todo counts.
+
+    The counts are the maintained columns of `TodoUser`, so a page costs one
+    indexed read of its users however many todos they have, never a GROUP BY
+    over the Todo table or a query per user. Each user links to the list
+    view filtered with `?user=`.
+
+    URL Parameters:
+        - `page`: (optional) Page number, `paginate_by` users per page.
+
+    Conditional GET and the page cache work as for `TodoListView`.
+    """
+
+    model = TodoUser
+    template_name = "todo_users.html"
+    response_class = TimedTemplateResponse
+    context_object_name = "users"
+    paginate_by = 100
+    ordering = ["id"]
+    # Counter row, the paginator's COUNT and the page.
+    query_budget = 3
+    etag_params = ("page",)
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Add the global counts as `total_todos`, `completed_todos` and
+        `uncompleted_todos`.
+        """
+        context = super().get_context_data(**kwargs)
+        counters = getattr(self, "counters", None) or TodoCounter.snapshot()
+        context["total_todos"] = counters.total
+        context["completed_todos"] = counters.completed
+        context["uncompleted_todos"] = counters.uncompleted
+        return context
+
+
+@query_budget(4)
 @require_http_methods(["POST"])
 def toggle_todo_completion(request: HttpRequest) -> JsonResponse:
     """
     Toggle the completion status of a Todo item.
 
     This view expects a JSON body with the key "todo_id" mapping to the UUID of an
-    existing Todo item. When called, it flips the `completed` status of that Todo.
+    existing Todo item. When called, it flips the `completed` status of that Todo
+    with a single atomic UPDATE (see `Todo.toggle_completed`), so concurrent
+    clicks on the same row never overwrite each other.
 
     Args:
         request (HttpRequest): The HTTP request object. Must be a POST request containing JSON data.
@@ -132,21 +590,173 @@ def toggle_todo_completion(request: HttpRequest) -> JsonResponse:
         todo_id = data.get("todo_id")
 
         if not todo_id:
+            TOGGLES.labels(outcome="missing_id").inc()
             return JsonResponse(
                 {"success": False, "error": "Missing todo_id"}, status=400
             )
 
-        todo = Todo.objects.get(uuid=todo_id)
-        todo.completed = not todo.completed  # Toggle the completion status
-        todo.save()
-        return JsonResponse({"success": True, "completed": todo.completed})
+        completed = Todo.toggle_completed(todo_id)
+        if completed is None:
+            logger.warning("Attempted to toggle a Todo that does not exist.")
+            TOGGLES.labels(outcome="not_found").inc()
+            return JsonResponse(
+                {"success": False, "error": "Todo not found"}, status=404
+            )
+        TOGGLES.labels(outcome="success").inc()
+        return JsonResponse({"success": True, "completed": completed})
 
-    except Todo.DoesNotExist:
-        logger.warning("Attempted to toggle a Todo that does not exist.")
-        return JsonResponse({"success": False, "error": "Todo not found"}, status=404)
     except json.JSONDecodeError:
         logger.error("Invalid JSON data in request.")
+        TOGGLES.labels(outcome="invalid_json").inc()
         return JsonResponse({"success": False, "error": "Invalid JSON"}, status=400)
     except Exception as e:
         logger.exception("Unexpected error toggling Todo completion.")
+        TOGGLES.labels(outcome="error").inc()
         return JsonResponse({"success": False, "error": str(e)}, status=400)
+
+
+@query_budget(4)
+async def atoggle_todo_completion(request: HttpRequest) -> HttpResponse:
+    """
+    Async version of `toggle_todo_completion`, with the same request and
+    response format.
+
+    `require_http_methods` does not support async views on Django 4.2, so the
+    method is checked here.
+    """
+    if request.method != "POST":
+        return HttpResponseNotAllowed(["POST"])
+
+    try:
+        data = json.loads(request.body)
+        todo_id = data.get("todo_id")
+
+        if not todo_id:
+            TOGGLES.labels(outcome="missing_id").inc()
+            return JsonResponse(
+                {"success": False, "error": "Missing todo_id"}, status=400
+            )
+
+        completed = await Todo.atoggle_completed(todo_id)
+        if completed is None:
+            logger.warning("Attempted to toggle a Todo that does not exist.")
+            TOGGLES.labels(outcome="not_found").inc()
+            return JsonResponse(
+                {"success": False, "error": "Todo not found"}, status=404
+            )
+        TOGGLES.labels(outcome="success").inc()
+        return JsonResponse({"success": True, "completed": completed})
+
+    except json.JSONDecodeError:
+        logger.error("Invalid JSON data in request.")
+        TOGGLES.labels(outcome="invalid_json").inc()
+        return JsonResponse({"success": False, "error": "Invalid JSON"}, status=400)
+    except Exception as e:
+        logger.exception("Unexpected error toggling Todo completion.")
+        TOGGLES.labels(outcome="error").inc()
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+
+
+@query_budget(5)
+@require_http_methods(["POST"])
+def toggle_todos_batch(request: HttpRequest) -> JsonResponse:
+    """
+    Set or toggle the completion status of many Todo items at once.
+
+    This view expects a JSON body of the form
+    `{"items": [{"todo_id": <uuid>, "completed": <bool>}, ...]}`. Items that
+    omit `completed` (or send null) are toggled. All changes are applied in one
+    transaction with a bounded number of statements (see
+    `Todo.set_completed_many`), regardless of batch size.
+
+    Args:
+        request (HttpRequest): The HTTP request object. Must be a POST request containing JSON data.
+
+    Returns:
+        JsonResponse: A JSON response with one result per item, in request order.
+            - `{"success": True, "results": [...]}` if the batch was processed, where
+              each result is `{"todo_id": ..., "success": True, "completed": <bool>}`
+              or `{"todo_id": ..., "success": False, "error": <message>}`.
+            - `{"success": False, "error": <message>}` if the batch is malformed
+              or has more than `MAX_BATCH_SIZE` items.
+    """
+    try:
+        data = json.loads(request.body)
+        items = data.get("items") if isinstance(data, dict) else None
+
+        if not isinstance(items, list):
+            return JsonResponse(
+                {"success": False, "error": "Missing items"}, status=400
+            )
+        if len(items) > MAX_BATCH_SIZE:
+            return JsonResponse(
+                {
+                    "success": False,
+                    "error": f"Too many items (max {MAX_BATCH_SIZE})",
+                },
+                status=400,
+            )
+
+        targets: Dict[Any, Optional[bool]] = {}
+        errors: Dict[int, str] = {}
+        keys: Dict[int, Any] = {}
+        for index, item in enumerate(items):
+            todo_id = item.get("todo_id") if isinstance(item, dict) else None
+            completed = item.get("completed") if isinstance(item, dict) else None
+            if not todo_id:
+                errors[index] = "Missing todo_id"
+                continue
+            if completed is not None and not isinstance(completed, bool):
+                errors[index] = "Invalid completed value"
+                continue
+            try:
+                pk = Todo._meta.get_field("uuid").to_python(todo_id)
+            except ValidationError:
+                errors[index] = "Invalid todo_id"
+                continue
+            if pk in targets:
+                errors[index] = "Duplicate todo_id"
+                continue
+            targets[pk] = completed
+            keys[index] = pk
+
+        final = Todo.set_completed_many(targets)
+
+        results = []
+        for index, item in enumerate(items):
+            todo_id = item.get("todo_id") if isinstance(item, dict) else None
+            if index in errors:
+                error = errors[index]
+            elif keys[index] not in final:
+                error = "Todo not found"
+            else:
+                results.append(
+                    {
+                        "todo_id": todo_id,
+                        "success": True,
+                        "completed": final[keys[index]],
+                    }
+                )
+                continue
+            results.append({"todo_id": todo_id, "success": False, "error": error})
+
+        return JsonResponse({"success": True, "results": results})
+
+    except json.JSONDecodeError:
+        logger.error("Invalid JSON data in batch request.")
+        return JsonResponse({"success": False, "error": "Invalid JSON"}, status=400)
+    except Exception as e:
+        logger.exception("Unexpected error applying batch Todo completion.")
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+
+
+@query_budget(2)
+@require_http_methods(["GET"])
+def metrics(request: HttpRequest) -> HttpResponse:
+    """
+    Serve the Prometheus metrics (see `todos.metrics`) in the text format.
+
+    Routed at `/metrics` only with `METRICS_ENABLED=True`.
+    """
+    body, content_type = render_metrics()
+    return HttpResponse(body, content_type=content_type)